@@ -1,11 +1,35 @@
+import os
+import tempfile
+from pathlib import Path
+
 import uvicorn
 
 
+def _prepare_metrics_dir() -> None:
+    # Workers write their metrics to files in this directory; leftovers from
+    # a previous run would be summed into the new one
+    path = Path(
+        os.environ.setdefault(
+            "PROMETHEUS_MULTIPROC_DIR",
+            str(Path(tempfile.gettempdir()) / "prometheus-multiproc"),
+        )
+    )
+    path.mkdir(parents=True, exist_ok=True)
+    for stale in path.glob("*.db"):
+        stale.unlink()
+
+
 def main() -> None:
+    from app.services.logging import setup_logging
     from app.settings import get_config
 
     config = get_config()
+    setup_logging(config.env, config.logging)
     reload = config.env == "local"
+    workers = 1 if reload else config.api.workers
+    if workers > 1:
+        _prepare_metrics_dir()
+
     uvicorn.run(
         "app.application:get_production_app",
         host=config.api.host,
@@ -13,4 +37,9 @@ def main() -> None:
         reload=reload,
         factory=True,
         reload_dirs=["src/app/"],
+        workers=workers,
+        loop=config.api.loop,
+        http=config.api.http,
+        # Uvicorn's loggers propagate to the queue handler of setup_logging
+        log_config=None,
     )
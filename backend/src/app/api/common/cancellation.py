@@ -0,0 +1,91 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from fastapi import HTTPException, Request, Response, status
+from prometheus_client import Counter
+
+from app.api.common.tracing import TracedRoute
+from app.services.deadline import DeadlineExceeded, deadline
+
+logger = logging.getLogger(__name__)
+
+# nginx's "client closed request"; never seen by the client
+CLIENT_CLOSED_REQUEST = 499
+
+CLIENT_DISCONNECTS = Counter(
+    "http_client_disconnect_cancellations_total",
+    "Requests cancelled because the client disconnected before the response",
+    ["route"],
+)
+DEADLINES_EXCEEDED = Counter(
+    "http_request_deadline_exceeded_total",
+    "Requests cancelled because their deadline passed",
+    ["route"],
+)
+
+
+async def wait_for_disconnect(request: Request) -> None:
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+class DeadlineRoute(TracedRoute):
+    """Route class that cancels the endpoint on client disconnect or deadline.
+
+    The deadline is set as context for everything the endpoint awaits, so
+    HTTP clients can size their timeouts from the remaining budget.
+    Only routes without a request body are watched for disconnects, since
+    watching consumes the ASGI receive channel.
+    """
+
+    def deadline_seconds(self) -> float | None:
+        return None
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        handler = super().get_route_handler()
+        if self.body_field is not None:
+            return handler
+
+        async def cancellable_handler(request: Request) -> Response:
+            budget = self.deadline_seconds()
+            if budget is None:
+                endpoint = asyncio.ensure_future(handler(request))
+            else:
+                with deadline(budget):
+                    endpoint = asyncio.ensure_future(handler(request))
+            disconnect = asyncio.ensure_future(wait_for_disconnect(request))
+
+            try:
+                done, _ = await asyncio.wait(
+                    {endpoint, disconnect},
+                    timeout=budget,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            except asyncio.CancelledError:
+                endpoint.cancel()
+                raise
+            finally:
+                disconnect.cancel()
+            if endpoint in done:
+                try:
+                    return endpoint.result()
+                except DeadlineExceeded:
+                    pass
+            else:
+                endpoint.cancel()
+                await asyncio.gather(endpoint, return_exceptions=True)
+                if disconnect in done:
+                    CLIENT_DISCONNECTS.labels(route=self.path_format).inc()
+                    logger.info("Client disconnected, cancelled %s", request.url.path)
+                    return Response(status_code=CLIENT_CLOSED_REQUEST)
+
+            DEADLINES_EXCEEDED.labels(route=self.path_format).inc()
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail="Request deadline exceeded.",
+            )
+
+        return cancellable_handler
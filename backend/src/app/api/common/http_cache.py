@@ -0,0 +1,57 @@
+import hashlib
+from collections.abc import Awaitable, Callable
+
+from fastapi import Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.api.common.tracing import TracedRoute
+
+
+def make_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+class CachedRoute(TracedRoute):
+    """Route class adding ETag, Cache-Control and 304 handling to GET responses.
+
+    Successful, fully rendered responses get a strong ETag over their body;
+    a request whose If-None-Match matches it gets an empty 304 instead.
+    Streaming responses are passed through untouched.
+    """
+
+    def cache_control(self, request: Request) -> str:
+        return "private, no-cache"
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        handler = super().get_route_handler()
+
+        async def cached_handler(request: Request) -> Response:
+            response = await handler(request)
+            if (
+                request.method != "GET"
+                or response.status_code != status.HTTP_200_OK
+                or isinstance(response, StreamingResponse)
+            ):
+                return response
+
+            etag = make_etag(response.body)
+            headers = {"ETag": etag, "Cache-Control": self.cache_control(request)}
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+            response.headers.update(headers)
+            # Bodies depend on the caller and on the negotiated format
+            response.headers.add_vary_header("Authorization")
+            response.headers.add_vary_header("Accept")
+            return response
+
+        return cached_handler
@@ -0,0 +1,28 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.services.profiling import SlowRequestSampler, slow_requests
+
+
+class SlowRequestMiddleware:
+    """Hands each HTTP request to the slow request sampler.
+
+    Add it before ``TracingMiddleware``, so kept profiles carry the trace id.
+    """
+
+    def __init__(self, app: ASGIApp, sampler: SlowRequestSampler = slow_requests):
+        self.app = app
+        self.sampler = sampler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.sampler.running:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        with self.sampler.watch(f"{method} {scope['path']}") as record:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    record.name = f"{method} {route.path_format}"
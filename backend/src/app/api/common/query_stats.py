@@ -0,0 +1,61 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.database.instrumentation import (
+    QueryStats,
+    compact_statement,
+    record_handler_stats,
+    track_queries,
+)
+
+
+def _stats_headers(stats: QueryStats) -> dict[str, str]:
+    headers = {
+        "X-DB-Queries": str(stats.count),
+        "X-DB-Time-Ms": f"{stats.duration * 1000:.1f}",
+    }
+    if stats.slowest_statement is not None:
+        headers["X-DB-Slowest-Ms"] = f"{stats.slowest_duration * 1000:.1f}"
+        headers["X-DB-Slowest-Query"] = (
+            compact_statement(stats.slowest_statement)
+            .encode("latin-1", "replace")
+            .decode("latin-1")
+        )
+    return headers
+
+
+class QueryStatsMiddleware:
+    """Counts SQL statements and DB time per request, by route.
+
+    With ``headers``, responses carry the numbers so far as ``X-DB-*``
+    headers; statements a streaming body runs later only reach the metrics.
+    """
+
+    def __init__(self, app: ASGIApp, headers: bool = False):
+        self.app = app
+        self.headers = headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_with_stats(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    for name, value in _stats_headers(stats).items():
+                        headers.append(name, value)
+                await send(message)
+
+            try:
+                await self.app(
+                    scope, receive, send_with_stats if self.headers else send
+                )
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    record_handler_stats(
+                        f"{scope['method']} {route.path_format}", stats
+                    )
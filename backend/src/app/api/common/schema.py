@@ -1,7 +1,8 @@
 from typing import Generic, TypeVar
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field, computed_field, field_validator
 
+from app.api.common.utils import decode_cursor
 from app.settings import get_config
 
 config = get_config()
@@ -14,29 +15,53 @@ class PaginationParams(BaseModel):
     page_size: int = Field(
         config.api.page_default_size, ge=1, le=config.api.page_max_size
     )
+    cursor: str | None = Field(
+        None,
+        description="next_cursor of the previous page; switches to keyset pagination",
+    )
+    include_total: bool | None = Field(
+        None,
+        description="Count matching rows exactly. Defaults to true for page "
+        "pagination and false for cursor pagination.",
+    )
+
+    @field_validator("cursor")
+    @classmethod
+    def validate_cursor(cls, value: str | None) -> str | None:
+        if value is not None:
+            decode_cursor(value)
+        return value
 
     @property
     def offset(self) -> int:
         return (self.page - 1) * self.page_size
 
+    @property
+    def is_keyset(self) -> bool:
+        return self.cursor is not None
+
 
 class Pagination(BaseModel, Generic[T]):
     items: list[T]
-    total: int
-    page: int
+    total: int | None
+    total_is_estimate: bool = False
+    page: int | None
     page_size: int
+    next_cursor: str | None = None
 
     @computed_field
     @property
-    def total_pages(self) -> int:
+    def total_pages(self) -> int | None:
+        if self.total is None:
+            return None
         return (self.total + self.page_size - 1) // self.page_size
 
     @computed_field
     @property
     def has_next(self) -> bool:
-        return self.page < self.total_pages
+        return self.next_cursor is not None
 
     @computed_field
     @property
     def has_prev(self) -> bool:
-        return self.page > 1
+        return self.page is None or self.page > 1
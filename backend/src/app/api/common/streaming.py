@@ -0,0 +1,88 @@
+import json
+from collections.abc import AsyncIterator, Iterable
+from contextlib import aclosing
+from typing import Any, TypeVar
+
+from fastapi import HTTPException, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.services.deadline import DeadlineExceeded, current_deadline, iterate_within
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+STREAM_MEDIA_TYPES = (NDJSON_MEDIA_TYPE, EVENT_STREAM_MEDIA_TYPE)
+
+# OpenAPI `responses` entry for routes that can stream
+STREAM_RESPONSES = {200: {"content": {t: {} for t in STREAM_MEDIA_TYPES}}}
+
+# Keep proxies (nginx) from buffering the stream
+STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def negotiate_stream(accept: str | None) -> str | None:
+    """Return the streaming media type requested by ``Accept``, if any."""
+    if accept:
+        for media_type in STREAM_MEDIA_TYPES:
+            if media_type in accept:
+                return media_type
+    return None
+
+
+async def iterate(items: Iterable[M]) -> AsyncIterator[M]:
+    for item in items:
+        yield item
+
+
+def _encode(payload: str, media_type: str, event: str | None = None) -> str:
+    if media_type == NDJSON_MEDIA_TYPE:
+        return f"{payload}\n"
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {payload}\n\n"
+
+
+def _encode_error(status_code: int, detail: Any, media_type: str) -> str:
+    payload = json.dumps(
+        {"error": {"status_code": status_code, "detail": detail}},
+        ensure_ascii=False,
+    )
+    return _encode(payload, media_type, event="error")
+
+
+async def stream_models(
+    items: AsyncIterator[BaseModel], media_type: str
+) -> StreamingResponse:
+    """Send each model as an NDJSON line or an SSE ``data`` event.
+
+    The first item is awaited before the response starts, so errors raised
+    while fetching it still get their status code. Later HTTPExceptions and
+    an expired request deadline are reported in-band as a final
+    ``{"error": ...}`` line or ``error`` event. The deadline of the calling
+    endpoint keeps bounding the body, which is sent after it returned;
+    Starlette cancels the body when the client disconnects.
+    """
+    items = iterate_within(items, current_deadline())
+    try:
+        first = await anext(items)
+    except StopAsyncIteration:
+        first = None
+
+    async def body() -> AsyncIterator[str]:
+        async with aclosing(items):
+            try:
+                if first is not None:
+                    yield _encode(first.model_dump_json(), media_type)
+                async for item in items:
+                    yield _encode(item.model_dump_json(), media_type)
+            except HTTPException as error:
+                yield _encode_error(error.status_code, error.detail, media_type)
+            except DeadlineExceeded:
+                yield _encode_error(
+                    status.HTTP_504_GATEWAY_TIMEOUT,
+                    "Request deadline exceeded.",
+                    media_type,
+                )
+
+    return StreamingResponse(body(), media_type=media_type, headers=STREAM_HEADERS)
@@ -0,0 +1,76 @@
+import functools
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+from dishka.integrations.fastapi import DishkaRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.logging import sample_logs
+from app.services.tracing import Span, span, trace
+
+
+class TracingMiddleware:
+    """Opens the root span of each HTTP request.
+
+    Sits outside routing, so the span covers validation, serialization and
+    streaming of the body; it is renamed to the matched route template.
+    Hot-path log records of the request are sampled together.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        traceparent = headers.get(b"traceparent", b"").decode("latin-1") or None
+        method = scope["method"]
+        with (
+            sample_logs(),
+            trace(
+                method,
+                traceparent=traceparent,
+                **{"http.request.method": method, "url.path": scope["path"]},
+            ) as root,
+        ):
+
+            async def send_with_status(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    root.set_attribute("http.response.status_code", message["status"])
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = scope.get("route")
+                if route is not None and isinstance(root, Span):
+                    root.name = f"{method} {route.path_format}"
+                    root.set_attribute("http.route", route.path_format)
+
+
+def _traced_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    if not inspect.iscoroutinefunction(endpoint):
+        return endpoint
+    name = f"endpoint {endpoint.__name__}"
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with span(name):
+            return await endpoint(*args, **kwargs)
+
+    return wrapper
+
+
+class TracedRoute(DishkaRoute):
+    """Dishka route whose endpoint runs in its own span.
+
+    Compared with the request span, it separates the handler from parsing,
+    dependency setup and response serialization.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, _traced_endpoint(endpoint), **kwargs)
@@ -1,15 +1,43 @@
+import base64
+import binascii
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import Any, NamedTuple
+from uuid import UUID
 
-from sqlalchemy import BinaryExpression
+from sqlalchemy import BinaryExpression, ColumnElement, case
 
 from app.database.base import Base
 
-if TYPE_CHECKING:
-    from sqlalchemy import ColumnElement  # noqa
-
 logger = logging.getLogger(__name__)
 
+LIKE_ESCAPE = "\\"
+
+
+class PageCursor(NamedTuple):
+    last_id: UUID
+    rank: int | None = None
+
+
+def escape_like(value: str) -> str:
+    return (
+        value.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", f"{LIKE_ESCAPE}%")
+        .replace("_", f"{LIKE_ESCAPE}_")
+    )
+
+
+def search_rank(column: ColumnElement, value: str) -> ColumnElement[int]:
+    """0 for values starting with ``value``, 1 for other matches."""
+    return case(
+        (column.ilike(f"{escape_like(value)}%", escape=LIKE_ESCAPE), 0),
+        else_=1,
+    )
+
+
+def search_rank_value(value: str, search: str) -> int:
+    """Python counterpart of :func:`search_rank` for an already loaded row."""
+    return 0 if value.lower().startswith(search.lower()) else 1
+
 
 def build_filters(
     model: type[Base],
@@ -45,9 +73,26 @@ def build_filters(
                 elif operation == "gte":
                     expressions.append(column >= value)
                 elif operation == "search":
-                    expressions.append(column.ilike(f"%{value}%"))
+                    expressions.append(
+                        column.ilike(f"%{escape_like(value)}%", escape=LIKE_ESCAPE)
+                    )
         else:
             column = getattr(model, field_name, None)
             if column is not None:
                 expressions.append(column == value)
     return expressions
+
+
+def encode_cursor(last_id: UUID, rank: int | None = None) -> str:
+    raw = last_id.bytes if rank is None else bytes([rank]) + last_id.bytes
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> PageCursor:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        if len(raw) == 17:
+            return PageCursor(UUID(bytes=raw[1:]), raw[0])
+        return PageCursor(UUID(bytes=raw))
+    except (binascii.Error, ValueError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
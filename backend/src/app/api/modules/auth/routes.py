@@ -1,7 +1,7 @@
 from dishka import FromDishka
-from dishka.integrations.fastapi import DishkaRoute
 from fastapi import APIRouter
 
+from app.api.common.tracing import TracedRoute
 from app.api.modules.auth.schema import (
     LoginRequest,
     RefreshRequest,
@@ -11,7 +11,7 @@ from app.api.modules.auth.service import AuthService
 from app.api.modules.auth.services.jwt import JwtService
 from app.database.uow import UnitOfWork
 
-router = APIRouter(route_class=DishkaRoute)
+router = APIRouter(route_class=TracedRoute)
 
 
 @router.post("/login", response_model=TokenPairResponse, status_code=200)
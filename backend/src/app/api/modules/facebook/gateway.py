@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.modules.users.models import FacebookAuth
@@ -25,3 +25,8 @@ class FacebookAuthGateway:
             self.session.add(fb_auth)
 
         return fb_auth
+
+    async def delete_by_owner(self, owner_id: UUID) -> None:
+        await self.session.execute(
+            delete(FacebookAuth).where(FacebookAuth.owner_id == owner_id)
+        )
@@ -1,10 +1,20 @@
-from datetime import date
-
-from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, Depends, Query
-
+from datetime import date, timedelta
+
+from dishka.integrations.fastapi import FromDishka
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.api.common.cancellation import DeadlineRoute
+from app.api.common.http_cache import CachedRoute
+from app.api.common.streaming import (
+    STREAM_RESPONSES,
+    iterate,
+    negotiate_stream,
+    stream_models,
+)
 from app.api.modules.auth.services.auth import AdminRequired, AuthenticateUser
 from app.api.modules.facebook.schema import (
+    AccountSnapshotResponse,
     AdResponse,
     AdSetResponse,
     CampaignResponse,
@@ -13,8 +23,55 @@ from app.api.modules.facebook.schema import (
 )
 from app.api.modules.facebook.service import FacebookService
 from app.api.modules.users.models import User
+from app.clients.facebook import GraphFields
+from app.settings import get_config
+
+
+def is_closed_range(until: str | None) -> bool:
+    if until is None:
+        return False
+    try:
+        end = date.fromisoformat(until)
+    except ValueError:
+        return False
+    # Ad accounts report in their own timezone, so yesterday may still be
+    # "today" for some of them
+    return end < date.today() - timedelta(days=1)
+
+
+class InsightsRoute(CachedRoute, DeadlineRoute):
+    """Lets browsers reuse insights, for longer once the range is closed.
+
+    Graph work is bounded by the request deadline and cancelled when the
+    client goes away.
+    """
+
+    def deadline_seconds(self) -> float | None:
+        return get_config().facebook.request_deadline
 
-router = APIRouter(route_class=DishkaRoute)
+    def cache_control(self, request: Request) -> str:
+        if not any(param.name == "until" for param in self.dependant.query_params):
+            return super().cache_control(request)
+
+        config = get_config().facebook
+        if is_closed_range(request.query_params.get("until")):
+            max_age = config.closed_range_max_age
+        else:
+            max_age = config.open_range_max_age
+        return f"private, max-age={max_age}"
+
+
+router = APIRouter(route_class=InsightsRoute)
+
+FIELDS_DESCRIPTION = (
+    "Comma-separated entity fields and insight metrics to fetch from Facebook "
+    "(e.g. name,status,spend,clicks). All fields when omitted."
+)
+
+ACCEPT_DESCRIPTION = (
+    "application/x-ndjson or text/event-stream to stream entities as soon as "
+    "their insights are joined"
+)
 
 
 @router.get("/auth/status")
@@ -52,7 +109,9 @@ async def get_ad_accounts(
 
 
 @router.get(
-    "/ad-accounts/{account_id}/campaigns", response_model=list[CampaignResponse]
+    "/ad-accounts/{account_id}/campaigns",
+    response_model=list[CampaignResponse],
+    responses=STREAM_RESPONSES,
 )
 async def get_campaigns(
     account_id: str,
@@ -60,15 +119,33 @@ async def get_campaigns(
     current_user: User = Depends(AuthenticateUser()),
     since: date | None = Query(None, description="Start date (YYYY-MM-DD)"),
     until: date | None = Query(None, description="End date (YYYY-MM-DD)"),
-) -> list[CampaignResponse]:
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    accept: str | None = Header(None, description=ACCEPT_DESCRIPTION),
+) -> list[CampaignResponse] | StreamingResponse:
+    media_type = negotiate_stream(accept)
+    if media_type is not None:
+        campaigns = await service.stream_campaigns(
+            current_user,
+            account_id,
+            since=since,
+            until=until,
+            fields=GraphFields.parse(fields),
+        )
+        return await stream_models(campaigns, media_type)
+
     return await service.get_campaigns(
-        current_user, account_id, since=since, until=until
+        current_user,
+        account_id,
+        since=since,
+        until=until,
+        fields=GraphFields.parse(fields),
     )
 
 
 @router.get(
     "/ad-accounts/{account_id}/campaigns/{campaign_id}/adsets",
     response_model=list[AdSetResponse],
+    responses=STREAM_RESPONSES,
 )
 async def get_adsets(
     account_id: str,
@@ -77,18 +154,86 @@ async def get_adsets(
     current_user: User = Depends(AuthenticateUser()),
     since: date | None = Query(None, description="Start date (YYYY-MM-DD)"),
     until: date | None = Query(None, description="End date (YYYY-MM-DD)"),
-) -> list[AdSetResponse]:
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    accept: str | None = Header(None, description=ACCEPT_DESCRIPTION),
+) -> list[AdSetResponse] | StreamingResponse:
+    media_type = negotiate_stream(accept)
+    if media_type is not None:
+        adsets = await service.stream_adsets(
+            current_user,
+            campaign_id,
+            account_id,
+            since=since,
+            until=until,
+            fields=GraphFields.parse(fields),
+        )
+        return await stream_models(adsets, media_type)
+
     return await service.get_adsets(
-        current_user, campaign_id, account_id, since=since, until=until
+        current_user,
+        campaign_id,
+        account_id,
+        since=since,
+        until=until,
+        fields=GraphFields.parse(fields),
     )
 
 
-@router.get("/adsets/{adset_id}/ads", response_model=list[AdResponse])
+@router.get(
+    "/adsets/{adset_id}/ads",
+    response_model=list[AdResponse],
+    responses=STREAM_RESPONSES,
+)
 async def get_ads(
     adset_id: str,
     service: FromDishka[FacebookService],
     current_user: User = Depends(AuthenticateUser()),
     since: date | None = Query(None, description="Start date (YYYY-MM-DD)"),
     until: date | None = Query(None, description="End date (YYYY-MM-DD)"),
-) -> list[AdResponse]:
-    return await service.get_ads(current_user, adset_id, since=since, until=until)
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    accept: str | None = Header(None, description=ACCEPT_DESCRIPTION),
+) -> list[AdResponse] | StreamingResponse:
+    media_type = negotiate_stream(accept)
+    if media_type is not None:
+        ads = await service.stream_ads(
+            current_user,
+            adset_id,
+            since=since,
+            until=until,
+            fields=GraphFields.parse(fields),
+        )
+        return await stream_models(ads, media_type)
+
+    return await service.get_ads(
+        current_user,
+        adset_id,
+        since=since,
+        until=until,
+        fields=GraphFields.parse(fields),
+    )
+
+
+@router.get(
+    "/ad-accounts/{account_id}/snapshot",
+    response_model=AccountSnapshotResponse,
+    responses=STREAM_RESPONSES,
+)
+async def get_account_snapshot(
+    account_id: str,
+    service: FromDishka[FacebookService],
+    current_user: User = Depends(AuthenticateUser()),
+    since: date | None = Query(None, description="Start date (YYYY-MM-DD)"),
+    until: date | None = Query(None, description="End date (YYYY-MM-DD)"),
+    accept: str | None = Header(None),
+) -> AccountSnapshotResponse | StreamingResponse:
+    """Campaigns with their ad sets and ads in one response.
+
+    When streamed, each campaign subtree is sent as a separate JSON document.
+    """
+    snapshot = await service.get_account_snapshot(
+        current_user, account_id, since=since, until=until
+    )
+    media_type = negotiate_stream(accept)
+    if media_type is None:
+        return snapshot
+    return await stream_models(iterate(snapshot.campaigns), media_type)
@@ -69,3 +69,18 @@ class AdResponse(BaseModel):
     status: str | None = None
     creative: dict[str, Any] = Field(default_factory=dict)
     insights: dict[str, Any] | None = None
+
+
+class AdSetSnapshot(AdSetResponse):
+    ads: list[AdResponse] = Field(default_factory=list)
+
+
+class CampaignSnapshot(CampaignResponse):
+    adsets: list[AdSetSnapshot] = Field(default_factory=list)
+
+
+class AccountSnapshotResponse(BaseModel):
+    account_id: str
+    since: date
+    until: date
+    campaigns: list[CampaignSnapshot]
@@ -1,20 +1,33 @@
 import logging
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from datetime import date
+from typing import Any, TypeVar
 
 from fastapi import HTTPException, status
+from pydantic import BaseModel
 
 from app.api.modules.facebook.schema import (
+    AccountSnapshotResponse,
     AdResponse,
     AdSetResponse,
     CampaignResponse,
 )
 from app.api.modules.facebook.services import FacebookSDKService
 from app.api.modules.users.models import User
-from app.clients.facebook import FacebookAPIError
+from app.clients.facebook import (
+    ALL_FIELDS,
+    FacebookAPIError,
+    GraphFields,
+    GraphLevel,
+)
 from app.database.uow import UnitOfWork
+from app.services.tracing import traced
 
 logger = logging.getLogger(__name__)
 
+M = TypeVar("M", bound=BaseModel)
+
 RATE_LIMIT_ERROR_CODES = {4, 17, 32, 613}
 
 
@@ -38,6 +51,7 @@ class FacebookService:
             }
         return self.sdk.get_current_month_range()
 
+    @traced()
     async def _get_access_token(self, user: User) -> str:
         owner_id = user.id if user.is_admin else user.created_by_id
         if not owner_id:
@@ -53,6 +67,18 @@ class FacebookService:
             )
         return fb_auth.long_token
 
+    @staticmethod
+    def _check_fields(fields: GraphFields, level: GraphLevel) -> None:
+        unknown = fields.unknown(level)
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=(
+                    f"Unknown fields: {', '.join(sorted(unknown))}. "
+                    f"Available: {', '.join(GraphFields.available(level))}"
+                ),
+            )
+
     def _check_account_access(self, user: User, account_id: str) -> None:
         if user.is_admin:
             return
@@ -93,6 +119,17 @@ class FacebookService:
             detail="Facebook API временно недоступен. Попробуйте позже.",
         ) from error
 
+    async def _stream_models(
+        self, rows: AsyncIterator[dict[str, Any]], model: type[M]
+    ) -> AsyncIterator[M]:
+        try:
+            async with aclosing(rows):
+                async for row in rows:
+                    yield model.model_validate(row)
+        except FacebookAPIError as error:
+            self._raise_facebook_http_exception(error)
+
+    @traced()
     async def get_auth_status(self, user: User) -> dict:
         fb_auth = await self.uow.facebook_auth.get_by_owner(user.id)
         return {
@@ -100,6 +137,7 @@ class FacebookService:
             "app_id": self.sdk.client.config.app_id,
         }
 
+    @traced()
     async def exchange_code(
         self, code: str, redirect_uri: str, user: User
     ) -> None:
@@ -119,6 +157,7 @@ class FacebookService:
         await self.uow.facebook_auth.set_token(user.id, long_token)
         await self.uow.commit()
 
+    @traced()
     async def exchange_token(
         self, short_lived_token: str, user: User
     ) -> None:
@@ -131,6 +170,7 @@ class FacebookService:
         await self.uow.facebook_auth.set_token(user.id, long_token)
         await self.uow.commit()
 
+    @traced()
     async def get_ad_accounts(self, user: User) -> list[dict]:
         access_token = await self._get_access_token(user)
         try:
@@ -148,26 +188,30 @@ class FacebookService:
             acc for acc in all_accounts if acc.get("account_id") == user.ad_account_id
         ]
 
+    @traced()
     async def get_campaigns(
         self,
         user: User,
         account_id: str,
         since: date | None = None,
         until: date | None = None,
+        fields: GraphFields = ALL_FIELDS,
     ) -> list[CampaignResponse]:
         self._check_account_access(user, account_id)
+        self._check_fields(fields, "campaign")
 
         access_token = await self._get_access_token(user)
         time_range = self._build_time_range(since, until)
 
         try:
             campaigns = await self.sdk.get_campaigns(
-                account_id, access_token, time_range
+                account_id, access_token, time_range, fields
             )
         except FacebookAPIError as error:
             self._raise_facebook_http_exception(error)
-        return [CampaignResponse(**c) for c in campaigns]
+        return [CampaignResponse.model_validate(c) for c in campaigns]
 
+    @traced()
     async def get_adsets(
         self,
         user: User,
@@ -175,32 +219,115 @@ class FacebookService:
         account_id: str,
         since: date | None = None,
         until: date | None = None,
+        fields: GraphFields = ALL_FIELDS,
     ) -> list[AdSetResponse]:
         self._check_account_access(user, account_id)
+        self._check_fields(fields, "adset")
 
         access_token = await self._get_access_token(user)
         time_range = self._build_time_range(since, until)
 
         try:
             adsets = await self.sdk.get_adsets(
-                campaign_id, account_id, access_token, time_range
+                campaign_id, account_id, access_token, time_range, fields
             )
         except FacebookAPIError as error:
             self._raise_facebook_http_exception(error)
-        return [AdSetResponse(**a) for a in adsets]
+        return [AdSetResponse.model_validate(a) for a in adsets]
 
+    @traced()
     async def get_ads(
         self,
         user: User,
         adset_id: str,
         since: date | None = None,
         until: date | None = None,
+        fields: GraphFields = ALL_FIELDS,
     ) -> list[AdResponse]:
+        self._check_fields(fields, "ad")
         access_token = await self._get_access_token(user)
         time_range = self._build_time_range(since, until)
 
         try:
-            ads = await self.sdk.get_ads(adset_id, access_token, time_range)
+            ads = await self.sdk.get_ads(adset_id, access_token, time_range, fields)
         except FacebookAPIError as error:
             self._raise_facebook_http_exception(error)
-        return [AdResponse(**a) for a in ads]
+        return [AdResponse.model_validate(a) for a in ads]
+
+    @traced()
+    async def get_account_snapshot(
+        self,
+        user: User,
+        account_id: str,
+        since: date | None = None,
+        until: date | None = None,
+    ) -> AccountSnapshotResponse:
+        self._check_account_access(user, account_id)
+
+        access_token = await self._get_access_token(user)
+        time_range = self._build_time_range(since, until)
+
+        try:
+            campaigns = await self.sdk.get_account_snapshot(
+                account_id, access_token, time_range
+            )
+        except FacebookAPIError as error:
+            self._raise_facebook_http_exception(error)
+        return AccountSnapshotResponse.model_validate(
+            {"account_id": account_id, **time_range, "campaigns": campaigns}
+        )
+
+    @traced()
+    async def stream_campaigns(
+        self,
+        user: User,
+        account_id: str,
+        since: date | None = None,
+        until: date | None = None,
+        fields: GraphFields = ALL_FIELDS,
+    ) -> AsyncIterator[CampaignResponse]:
+        self._check_account_access(user, account_id)
+        self._check_fields(fields, "campaign")
+
+        access_token = await self._get_access_token(user)
+        time_range = self._build_time_range(since, until)
+
+        rows = self.sdk.iter_campaigns(account_id, access_token, time_range, fields)
+        return self._stream_models(rows, CampaignResponse)
+
+    @traced()
+    async def stream_adsets(
+        self,
+        user: User,
+        campaign_id: str,
+        account_id: str,
+        since: date | None = None,
+        until: date | None = None,
+        fields: GraphFields = ALL_FIELDS,
+    ) -> AsyncIterator[AdSetResponse]:
+        self._check_account_access(user, account_id)
+        self._check_fields(fields, "adset")
+
+        access_token = await self._get_access_token(user)
+        time_range = self._build_time_range(since, until)
+
+        rows = self.sdk.iter_adsets(
+            campaign_id, account_id, access_token, time_range, fields
+        )
+        return self._stream_models(rows, AdSetResponse)
+
+    @traced()
+    async def stream_ads(
+        self,
+        user: User,
+        adset_id: str,
+        since: date | None = None,
+        until: date | None = None,
+        fields: GraphFields = ALL_FIELDS,
+    ) -> AsyncIterator[AdResponse]:
+        self._check_fields(fields, "ad")
+        access_token = await self._get_access_token(user)
+        time_range = self._build_time_range(since, until)
+
+        rows = self.sdk.iter_ads(adset_id, access_token, time_range, fields)
+        return self._stream_models(rows, AdResponse)
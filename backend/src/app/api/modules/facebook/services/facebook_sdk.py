@@ -1,7 +1,8 @@
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
 
-from app.clients.facebook import FacebookClient
+from app.clients.facebook import ALL_FIELDS, FacebookClient, GraphFields
 
 
 class FacebookSDKService:
@@ -29,9 +30,10 @@ class FacebookSDKService:
         account_id: str,
         access_token: str,
         time_range: dict[str, str],
+        fields: GraphFields = ALL_FIELDS,
     ) -> list[dict[str, Any]]:
         return await self.client.get_campaigns(
-            account_id, access_token, time_range, active_only=False
+            account_id, access_token, time_range, active_only=False, fields=fields
         )
 
     async def get_adsets(
@@ -40,9 +42,10 @@ class FacebookSDKService:
         account_id: str,
         access_token: str,
         time_range: dict[str, str],
+        fields: GraphFields = ALL_FIELDS,
     ) -> list[dict[str, Any]]:
         return await self.client.get_adsets(
-            campaign_id, account_id, access_token, time_range
+            campaign_id, account_id, access_token, time_range, fields=fields
         )
 
     async def get_ads(
@@ -50,5 +53,50 @@ class FacebookSDKService:
         adset_id: str,
         access_token: str,
         time_range: dict[str, str],
+        fields: GraphFields = ALL_FIELDS,
+    ) -> list[dict[str, Any]]:
+        return await self.client.get_ads(
+            adset_id, access_token, time_range, fields=fields
+        )
+
+    async def get_account_snapshot(
+        self,
+        account_id: str,
+        access_token: str,
+        time_range: dict[str, str],
     ) -> list[dict[str, Any]]:
-        return await self.client.get_ads(adset_id, access_token, time_range)
+        return await self.client.get_account_snapshot(
+            account_id, access_token, time_range, active_only=False
+        )
+
+    def iter_campaigns(
+        self,
+        account_id: str,
+        access_token: str,
+        time_range: dict[str, str],
+        fields: GraphFields = ALL_FIELDS,
+    ) -> AsyncIterator[dict[str, Any]]:
+        return self.client.iter_campaigns(
+            account_id, access_token, time_range, active_only=False, fields=fields
+        )
+
+    def iter_adsets(
+        self,
+        campaign_id: str,
+        account_id: str,
+        access_token: str,
+        time_range: dict[str, str],
+        fields: GraphFields = ALL_FIELDS,
+    ) -> AsyncIterator[dict[str, Any]]:
+        return self.client.iter_adsets(
+            campaign_id, account_id, access_token, time_range, fields=fields
+        )
+
+    def iter_ads(
+        self,
+        adset_id: str,
+        access_token: str,
+        time_range: dict[str, str],
+        fields: GraphFields = ALL_FIELDS,
+    ) -> AsyncIterator[dict[str, Any]]:
+        return self.client.iter_ads(adset_id, access_token, time_range, fields=fields)
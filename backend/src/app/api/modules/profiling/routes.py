@@ -0,0 +1,122 @@
+import os
+from datetime import UTC, datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import PlainTextResponse
+from taskiq import TaskiqResultTimeoutError
+
+from app.api.common.tracing import TracedRoute
+from app.api.modules.auth.services.auth import AdminRequired
+from app.api.modules.profiling.schema import SlowProfileResponse
+from app.api.modules.users.models import User
+from app.services.profiling import (
+    ProfileKind,
+    ProfilerBusyError,
+    run_profile,
+    slow_requests,
+)
+
+router = APIRouter(route_class=TracedRoute)
+
+MAX_SECONDS = 120
+# Time for a worker to pick the task up and store its result
+WORKER_GRACE_SECONDS = 30
+
+# API worker process that answered; profiles and slow records are per process
+PROCESS_ID_HEADER = "X-Process-Id"
+
+
+def _folded_response(folded: str, name: str) -> PlainTextResponse:
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+    return PlainTextResponse(
+        folded,
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}-{stamp}.folded"',
+            PROCESS_ID_HEADER: str(os.getpid()),
+        },
+    )
+
+
+@router.get("/process/{kind}", response_class=PlainTextResponse)
+async def profile_process(
+    kind: ProfileKind,
+    seconds: float = Query(10, gt=0, le=MAX_SECONDS),
+    current_user: User = Depends(AdminRequired()),
+) -> PlainTextResponse:
+    """Profile the API worker process that takes the request.
+
+    With several workers that is any one of them, named by the pid in the
+    file name and the X-Process-Id header; the bot poller runs in one.
+    """
+    try:
+        profile = await run_profile(kind, seconds)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+    return _folded_response(profile.folded(), f"api-{os.getpid()}-{kind}")
+
+
+@router.get("/worker/{kind}", response_class=PlainTextResponse)
+async def profile_worker_process(
+    kind: ProfileKind,
+    seconds: float = Query(10, gt=0, le=MAX_SECONDS),
+    current_user: User = Depends(AdminRequired()),
+) -> PlainTextResponse:
+    """Profile whichever taskiq worker process takes the task."""
+    from app.tasks.profiling import profile_worker
+
+    task = await profile_worker.kiq(kind, seconds)
+    try:
+        result = await task.wait_result(timeout=seconds + WORKER_GRACE_SECONDS)
+    except TaskiqResultTimeoutError as e:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="No worker returned the profile in time",
+        ) from e
+    if result.is_err:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY, detail=str(result.error)
+        )
+    return _folded_response(result.return_value, f"worker-{kind}")
+
+
+@router.get("/slow", response_model=list[SlowProfileResponse])
+async def get_slow_profiles(
+    response: Response,
+    current_user: User = Depends(AdminRequired()),
+) -> list[SlowProfileResponse]:
+    """Requests and bot updates slower than the threshold, latest first.
+
+    Only those of the API worker process that takes the request: each worker
+    keeps its own, and ``/slow/{id}`` finds a profile only in the same one.
+    """
+    response.headers[PROCESS_ID_HEADER] = str(os.getpid())
+    return [
+        SlowProfileResponse(
+            id=record.id,
+            name=record.name,
+            started_at=record.started_at,
+            duration_ms=round(record.duration * 1000, 1),
+            trace_id=record.trace_id,
+            pid=record.pid,
+            samples=record.profile.total,
+        )
+        for record in reversed(slow_requests.profiles)
+    ]
+
+
+@router.get("/slow/{profile_id}", response_class=PlainTextResponse)
+async def get_slow_profile(
+    profile_id: str,
+    current_user: User = Depends(AdminRequired()),
+) -> PlainTextResponse:
+    record = slow_requests.get(profile_id)
+    if record is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=(
+                f"Profile not found in API worker {os.getpid()}; "
+                "each worker keeps only the profiles it recorded"
+            ),
+            headers={PROCESS_ID_HEADER: str(os.getpid())},
+        )
+    return _folded_response(record.profile.folded(), f"slow-{record.id}")
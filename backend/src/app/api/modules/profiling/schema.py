@@ -0,0 +1,13 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class SlowProfileResponse(BaseModel):
+    id: str
+    name: str
+    started_at: datetime
+    duration_ms: float
+    trace_id: str | None
+    pid: int
+    samples: int
@@ -1,9 +1,32 @@
 import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 
-from sqlalchemy import select, update
+from sqlalchemy import Select, Update, case, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.modules.users.models import User
+from app.api.modules.users.models import FacebookAuth, User
+
+RECIPIENTS_YIELD_PER = 500
+
+
+@dataclass(frozen=True, slots=True)
+class TelegramRecipient:
+    user_id: uuid.UUID
+    chat_id: int
+    locale: str | None
+    is_admin: bool
+    ad_account_id: str | None
+    access_token: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class ChatBinding:
+    """Users a ``/start`` touches: the token owner and the chat's current user."""
+
+    user_id: uuid.UUID | None = None
+    user_chat_id: int | None = None
+    chat_owner_id: uuid.UUID | None = None
 
 
 class TelegramGateway:
@@ -17,28 +40,32 @@ class TelegramGateway:
         await self.session.flush()
         return token
 
-    async def get_user_by_token(self, token: str) -> User | None:
-        stmt = select(User).where(User.telegram_token == token)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
-
-    async def get_user_by_chat_id(self, chat_id: int) -> User | None:
-        stmt = select(User).where(User.telegram_chat_id == chat_id)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+    @staticmethod
+    def chat_binding_query(chat_id: int, token: str | None) -> Select:
+        condition = User.telegram_chat_id == chat_id
+        if token:
+            condition = or_(condition, User.telegram_token == token)
+        return select(User.id, User.telegram_chat_id, User.telegram_token).where(
+            condition
+        )
 
-    async def clear_token(self, user_id: uuid.UUID) -> None:
-        stmt = update(User).where(User.id == user_id).values(telegram_token=None)
-        await self.session.execute(stmt)
-        await self.session.flush()
+    async def get_chat_binding(self, chat_id: int, token: str | None) -> ChatBinding:
+        stmt = self.chat_binding_query(chat_id, token)
+        owner: dict[str, object] = {}
+        for user_id, user_chat_id, user_token in await self.session.execute(stmt):
+            if token and user_token == token:
+                owner.update(user_id=user_id, user_chat_id=user_chat_id)
+            if user_chat_id == chat_id:
+                owner["chat_owner_id"] = user_id
+        return ChatBinding(**owner)
 
-    async def update_telegram_chat_id(
-        self,
-        user_id: uuid.UUID,
+    @staticmethod
+    def bind_chat_statement(
+        token: str,
         chat_id: int,
         username: str | None = None,
         locale: str | None = None,
-    ) -> None:
+    ) -> Update:
         values: dict[str, object] = {
             "telegram_chat_id": chat_id,
             "telegram_username": username,
@@ -46,7 +73,30 @@ class TelegramGateway:
         }
         if locale:
             values["locale"] = locale
-        stmt = update(User).where(User.id == user_id).values(**values)
+        return (
+            update(User)
+            .where(User.telegram_token == token)
+            .values(**values)
+            .returning(User.id)
+        )
+
+    async def bind_chat(
+        self,
+        token: str,
+        chat_id: int,
+        username: str | None = None,
+        locale: str | None = None,
+    ) -> uuid.UUID | None:
+        """Attach the chat to the token owner and consume the token.
+
+        Returns the user id, or None when the token was already used.
+        """
+        stmt = self.bind_chat_statement(token, chat_id, username, locale)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def clear_token(self, user_id: uuid.UUID) -> None:
+        stmt = update(User).where(User.id == user_id).values(telegram_token=None)
         await self.session.execute(stmt)
         await self.session.flush()
 
@@ -55,16 +105,46 @@ class TelegramGateway:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_users_with_telegram(self, daily_only: bool = False) -> list[User]:
+    @staticmethod
+    def recipients_query(daily_only: bool = False) -> Select:
+        # Admins use their own Facebook token, other users the token of the
+        # admin who created them; resolve it in the same statement.
+        token_owner_id = case(
+            (User.is_admin.is_(True), User.id),
+            else_=User.created_by_id,
+        )
         conditions = [
             User.telegram_chat_id.isnot(None),
             User.is_active.is_(True),
         ]
         if daily_only:
             conditions.append(User.telegram_daily_enabled.is_(True))
-        stmt = select(User).where(*conditions)
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return (
+            select(
+                User.id.label("user_id"),
+                User.telegram_chat_id.label("chat_id"),
+                User.locale,
+                User.is_admin,
+                User.ad_account_id,
+                FacebookAuth.long_token.label("access_token"),
+            )
+            .outerjoin(FacebookAuth, FacebookAuth.owner_id == token_owner_id)
+            .where(*conditions)
+            .order_by(User.id)
+        )
+
+    async def stream_recipients(
+        self, daily_only: bool = False
+    ) -> AsyncIterator[TelegramRecipient]:
+        stmt = self.recipients_query(daily_only).execution_options(
+            yield_per=RECIPIENTS_YIELD_PER
+        )
+        result = await self.session.stream(stmt)
+        try:
+            async for row in result:
+                yield TelegramRecipient(**row._mapping)
+        finally:
+            await result.close()
 
     async def toggle_daily(self, user_id: uuid.UUID, enabled: bool) -> None:
         stmt = (
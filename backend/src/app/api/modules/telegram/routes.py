@@ -1,12 +1,12 @@
 import asyncio
 import logging
-from typing import Literal
+from typing import Any, Literal
 from uuid import UUID
 
 from dishka import FromDishka
-from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Body, Depends, Header
 
+from app.api.common.tracing import TracedRoute
 from app.api.modules.auth.services.auth import AuthenticateUser
 from app.api.modules.telegram.schema import (
     BroadcastRequest,
@@ -15,10 +15,14 @@ from app.api.modules.telegram.schema import (
     ToggleDailyRequest,
 )
 from app.api.modules.telegram.service import TelegramService
+from app.api.modules.telegram.services.webhook import (
+    SECRET_TOKEN_HEADER,
+    TelegramWebhookService,
+)
 from app.api.modules.users.models import User
 
 logger = logging.getLogger(__name__)
-router = APIRouter(route_class=DishkaRoute)
+router = APIRouter(route_class=TracedRoute)
 
 
 @router.get("/register", response_model=TelegramRegisterResponse)
@@ -65,22 +69,24 @@ async def _run_broadcast_in_background(
     period: str,
     locale: str,
 ) -> None:
-    from aiogram import Bot
     from httpx import AsyncClient
 
+    from app.api.modules.telegram.services import create_bot
     from app.api.modules.telegram.services.broadcast import TelegramBroadcastService
     from app.clients.facebook import FacebookClient
+    from app.clients.graph_simulator import graph_mounts
     from app.database.engine import SessionFactory
     from app.database.uow import UnitOfWork
     from app.settings import get_config
 
     config = get_config()
-    bot = Bot(token=config.telegram.bot_token)
+    bot = create_bot(config.telegram)
     try:
-        async with AsyncClient(timeout=60.0) as http_client:
+        async with AsyncClient(
+            timeout=60.0, mounts=graph_mounts(config.facebook)
+        ) as http_client:
             fb_client = FacebookClient(http_client, config.facebook)
-            async with SessionFactory() as session:
-                uow = UnitOfWork(session)
+            async with UnitOfWork(session_factory=SessionFactory) as uow:
                 user = await uow.users.get_by_id(user_id)
                 if not user:
                     return
@@ -109,3 +115,12 @@ async def toggle_daily(
     current_user: User = Depends(AuthenticateUser()),
 ) -> None:
     await service.toggle_daily(current_user.id, request.enabled)
+
+
+@router.post("/webhook", include_in_schema=False)
+async def telegram_webhook(
+    service: FromDishka[TelegramWebhookService],
+    payload: dict[str, Any] = Body(...),
+    secret_token: str | None = Header(None, alias=SECRET_TOKEN_HEADER),
+) -> None:
+    await service.handle(secret_token, payload)
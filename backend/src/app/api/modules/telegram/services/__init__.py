@@ -1,5 +1,6 @@
-from app.api.modules.telegram.services.bot import TelegramBotService
+from app.api.modules.telegram.services.bot import TelegramBotService, create_bot
 
 __all__ = [
     "TelegramBotService",
+    "create_bot",
 ]
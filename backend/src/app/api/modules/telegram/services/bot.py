@@ -1,27 +1,114 @@
 import asyncio
 import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 from aiogram import Bot, Dispatcher
-from aiogram.methods import DeleteWebhook
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
+from aiogram.methods import DeleteWebhook, TelegramMethod
+from aiogram.types import TelegramObject, Update
 
 from app.api.modules.telegram.services.handlers import setup_handlers
+from app.api.modules.telegram.services.metrics import TelegramMetricsMiddleware
+from app.api.modules.telegram.services.simulator import (
+    SIMULATOR_SCHEME,
+    SimulatedTelegramSession,
+)
+from app.services.logging import sample_logs
+from app.services.profiling import slow_requests
 from app.settings import TelegramConfig
 
 logger = logging.getLogger(__name__)
 
+POLLING_RETRY_MIN = 1.0
+POLLING_RETRY_MAX = 60.0
+
+
+def create_bot(config: TelegramConfig) -> Bot:
+    if config.api_url is None:
+        session = AiohttpSession()
+    elif config.api_url.startswith(f"{SIMULATOR_SCHEME}://"):
+        session = SimulatedTelegramSession(config.simulator)
+    else:
+        session = AiohttpSession(api=TelegramAPIServer.from_base(config.api_url))
+    session.middleware(TelegramMetricsMiddleware())
+    return Bot(token=config.bot_token, session=session)
+
+
+async def _watch_slow_updates(
+    handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+    event: TelegramObject,
+    data: dict[str, Any],
+) -> Any:
+    kind = event.event_type if isinstance(event, Update) else type(event).__name__
+    with slow_requests.watch(f"telegram update {kind}"):
+        return await handler(event, data)
+
+
+async def _sample_update_logs(
+    handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+    event: TelegramObject,
+    data: dict[str, Any],
+) -> Any:
+    with sample_logs():
+        return await handler(event, data)
+
 
 class TelegramBotService:
 
     def __init__(self, config: TelegramConfig):
-        self.bot = Bot(token=config.bot_token)
+        self.config = config
+        self.bot = create_bot(config)
         self.dp = Dispatcher()
-        setup_handlers(self.dp)
+        setup_handlers(self.dp, config.db_concurrency)
+        # Slow handlers are profiled like slow requests when the API polls
+        self.dp.update.outer_middleware(_watch_slow_updates)
+        self.dp.update.outer_middleware(_sample_update_logs)
+        self._handler_slots = asyncio.Semaphore(config.webhook_max_concurrency)
+        self._handler_tasks: set[asyncio.Task] = set()
 
     async def start_polling(self) -> None:
+        delay = POLLING_RETRY_MIN
         while True:
             try:
-                await self.bot(DeleteWebhook(drop_pending_updates=True))
+                # Pending updates are kept and delivered by the next poll
+                await self.bot(DeleteWebhook(drop_pending_updates=False))
                 await self.dp.start_polling(self.bot, handle_signals=False)
+                delay = POLLING_RETRY_MIN
             except Exception as e:
-                logger.error("Polling stopped with error: %s, restarting in 5 seconds...", e)
-                await asyncio.sleep(5)
+                logger.error(
+                    "Polling stopped with error: %s, restarting in %s seconds...",
+                    e,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, POLLING_RETRY_MAX)
+
+    async def set_webhook(self) -> None:
+        await self.bot.set_webhook(
+            url=self.config.webhook_url,
+            secret_token=self.config.webhook_secret,
+            allowed_updates=self.dp.resolve_used_update_types(),
+            drop_pending_updates=False,
+        )
+
+    def feed_in_background(self, update: Update) -> None:
+        """Handle ``update`` concurrently with others, up to the configured limit."""
+        task = asyncio.create_task(self._feed(update))
+        self._handler_tasks.add(task)
+        task.add_done_callback(self._handler_tasks.discard)
+
+    async def _feed(self, update: Update) -> None:
+        async with self._handler_slots:
+            try:
+                # Replies returned by handlers, as polling sends them
+                response = await self.dp.feed_update(self.bot, update)
+                if isinstance(response, TelegramMethod):
+                    await self.bot(response)
+            except Exception:
+                logger.exception("Failed to handle update %s", update.update_id)
+
+    async def close(self) -> None:
+        await asyncio.gather(*self._handler_tasks, return_exceptions=True)
+        await self.bot.session.close()
@@ -6,15 +6,21 @@ from aiogram import Bot
 from aiogram.enums import ParseMode
 
 from app.api.modules.facebook.gateway import FacebookAuthGateway
-from app.api.modules.telegram.gateway import TelegramGateway
+from app.api.modules.telegram.gateway import TelegramGateway, TelegramRecipient
 from app.api.modules.users.gateway import UserGateway
 from app.api.modules.users.models import User
-from app.clients.facebook import FacebookClient
+from app.clients.facebook import FacebookClient, GraphFields
+from app.services.tracing import span
 
 logger = logging.getLogger(__name__)
 
 Locale = Literal["ua", "ru"]
 
+# Everything _aggregate and _obj_block read; skips cpm/ctr/cpc (recomputed)
+REPORT_FIELDS = GraphFields.parse(
+    "status,objective,spend,impressions,clicks,reach,conversations"
+)
+
 # ── i18n labels ─────────────────────────────────
 
 _LABELS: dict[str, dict[Locale, str]] = {
@@ -290,7 +296,7 @@ class TelegramBroadcastService:
     ) -> dict[str, Any]:
         try:
             campaigns = await self.fb_client.get_campaigns(
-                account_id, access_token, time_range
+                account_id, access_token, time_range, fields=REPORT_FIELDS
             )
         except Exception as e:
             logger.warning("Failed to fetch campaigns for %s: %s", account_id, e)
@@ -308,94 +314,129 @@ class TelegramBroadcastService:
         if not user.telegram_chat_id:
             return False
 
-        token = await self._get_token_for_user(user)
+        recipient = TelegramRecipient(
+            user_id=user.id,
+            chat_id=user.telegram_chat_id,
+            locale=user.locale,
+            is_admin=user.is_admin,
+            ad_account_id=user.ad_account_id,
+            access_token=await self._get_token_for_user(user),
+        )
+        return await self.send_report(recipient, period, locale)
+
+    async def send_report(
+        self, recipient: TelegramRecipient, period: str, locale: Locale = "ua",
+    ) -> bool:
+        token = recipient.access_token
         if not token:
-            logger.warning("No FB token for user %s", user.id)
+            logger.warning("No FB token for user %s", recipient.user_id)
             return False
 
         time_range = _build_time_range(period)
 
         try:
-            if user.is_admin:
-                return await self._send_admin_report(user, token, period, time_range, locale)
-            return await self._send_user_report(user, token, period, time_range, locale)
+            if recipient.is_admin:
+                return await self._send_admin_report(
+                    recipient, token, period, time_range, locale
+                )
+            return await self._send_user_report(
+                recipient, token, period, time_range, locale
+            )
         except Exception as e:
-            logger.error("Failed to build report for user %s: %s", user.id, e)
+            logger.error("Failed to build report for user %s: %s", recipient.user_id, e)
             return False
 
     async def _send_admin_report(
-        self, user: User, token: str, period: str, time_range: dict[str, str],
-        locale: Locale = "ua",
+        self, recipient: TelegramRecipient, token: str, period: str,
+        time_range: dict[str, str], locale: Locale = "ua",
     ) -> bool:
-        all_accounts = await self.fb_client.get_ad_accounts(token)
-        active: list[dict[str, Any]] = []
+        with span("broadcast.fetch") as fetch:
+            all_accounts = await self.fb_client.get_ad_accounts(token)
+            active: list[dict[str, Any]] = []
 
-        for acc in all_accounts:
-            acc_id = acc.get("account_id")
-            acc_name = acc.get("name") or acc_id or "Unnamed"
-            acc_currency = acc.get("currency") or "USD"
-            data = await self._fetch_campaigns(acc_id, acc_name, token, time_range, acc_currency)
-            if data["campaigns"]:
-                active.append(data)
+            for acc in all_accounts:
+                acc_id = acc.get("account_id")
+                acc_name = acc.get("name") or acc_id or "Unnamed"
+                acc_currency = acc.get("currency") or "USD"
+                data = await self._fetch_campaigns(acc_id, acc_name, token, time_range, acc_currency)
+                if data["campaigns"]:
+                    active.append(data)
+            fetch.set_attribute("broadcast.accounts", len(all_accounts))
 
         if not active:
-            logger.info("No active campaigns for admin %s, skip", user.id)
+            logger.info("No active campaigns for admin %s, skip", recipient.user_id)
             return False
 
-        msg = _format_admin_report(active, period, time_range, locale)
-        return await self._send(user.telegram_chat_id, msg)
+        # Aggregation happens while formatting, so it is part of this span
+        with span("broadcast.render"):
+            msg = _format_admin_report(active, period, time_range, locale)
+        return await self._send(recipient.chat_id, msg)
 
     async def _send_user_report(
-        self, user: User, token: str, period: str, time_range: dict[str, str],
-        locale: Locale = "ua",
+        self, recipient: TelegramRecipient, token: str, period: str,
+        time_range: dict[str, str], locale: Locale = "ua",
     ) -> bool:
-        if not user.ad_account_id:
+        if not recipient.ad_account_id:
             return False
 
-        all_accounts = await self.fb_client.get_ad_accounts(token)
-        acc_name = user.ad_account_id
-        acc_currency = "USD"
-        for acc in all_accounts:
-            if acc.get("account_id") == user.ad_account_id:
-                acc_name = acc.get("name") or user.ad_account_id
-                acc_currency = acc.get("currency") or "USD"
-                break
-
-        data = await self._fetch_campaigns(
-            user.ad_account_id, acc_name, token, time_range, acc_currency
-        )
+        with span("broadcast.fetch"):
+            all_accounts = await self.fb_client.get_ad_accounts(token)
+            acc_name = recipient.ad_account_id
+            acc_currency = "USD"
+            for acc in all_accounts:
+                if acc.get("account_id") == recipient.ad_account_id:
+                    acc_name = acc.get("name") or recipient.ad_account_id
+                    acc_currency = acc.get("currency") or "USD"
+                    break
+
+            data = await self._fetch_campaigns(
+                recipient.ad_account_id, acc_name, token, time_range, acc_currency
+            )
         if not data["campaigns"]:
-            logger.info("No active campaigns for user %s, skip", user.id)
+            logger.info("No active campaigns for user %s, skip", recipient.user_id)
             return False
 
-        msg = _format_user_report(data, period, time_range, locale)
-        return await self._send(user.telegram_chat_id, msg)
+        with span("broadcast.render"):
+            msg = _format_user_report(data, period, time_range, locale)
+        return await self._send(recipient.chat_id, msg)
 
     async def _send(self, chat_id: int, text: str) -> bool:
-        try:
-            await self.bot.send_message(
-                chat_id=chat_id, text=text, parse_mode=ParseMode.HTML,
-            )
-            return True
-        except Exception as e:
-            logger.error("Telegram send failed to %s: %s", chat_id, e)
-            return False
+        with span("broadcast.send", **{"message.length": len(text)}) as send:
+            try:
+                await self.bot.send_message(
+                    chat_id=chat_id, text=text, parse_mode=ParseMode.HTML,
+                )
+                return True
+            except Exception as e:
+                send.record_error(e)
+                logger.error("Telegram send failed to %s: %s", chat_id, e)
+                return False
 
     async def send_daily_reports(self) -> None:
-        users = await self.telegram_gw.get_users_with_telegram(daily_only=True)
-        logger.info("Sending daily reports to %d users", len(users))
+        logger.info("Sending daily reports")
+        sent_count = 0
+        skipped_count = 0
 
-        for user in users:
+        async for recipient in self.telegram_gw.stream_recipients(daily_only=True):
             try:
                 locale: Locale = (
-                    user.locale
-                    if hasattr(user, "locale") and user.locale in ("ua", "ru")
-                    else "ua"
+                    recipient.locale if recipient.locale in ("ua", "ru") else "ua"
                 )
-                sent = await self.send_report_for_user(user, "yesterday", locale)
+                with span(
+                    "broadcast.report", **{"user.id": recipient.user_id}
+                ) as report:
+                    sent = await self.send_report(recipient, "yesterday", locale)
+                    report.set_attribute("broadcast.sent", sent)
                 if sent:
-                    logger.info("Daily report sent to user %s", user.id)
+                    sent_count += 1
+                    logger.info("Daily report sent to user %s", recipient.user_id)
                 else:
-                    logger.warning("Skipped report for user %s", user.id)
+                    skipped_count += 1
+                    logger.warning("Skipped report for user %s", recipient.user_id)
             except Exception as e:
-                logger.error("Error sending to user %s: %s", user.id, e)
+                skipped_count += 1
+                logger.error("Error sending to user %s: %s", recipient.user_id, e)
+
+        logger.info(
+            "Daily reports done: %d sent, %d skipped", sent_count, skipped_count
+        )
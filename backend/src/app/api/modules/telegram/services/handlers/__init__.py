@@ -1,7 +1,11 @@
 from aiogram import Dispatcher
 
+from app.api.modules.telegram.services.handlers.middleware import UnitOfWorkMiddleware
 from app.api.modules.telegram.services.handlers.start import register_start_handler
+from app.database.engine import SessionFactory
 
 
-def setup_handlers(dp: Dispatcher) -> None:
+def setup_handlers(dp: Dispatcher, db_concurrency: int) -> None:
+    # Inner middleware: only updates that matched a handler take a slot
+    dp.message.middleware(UnitOfWorkMiddleware(SessionFactory, db_concurrency))
     register_start_handler(dp)
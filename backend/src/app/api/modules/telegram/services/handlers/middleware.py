@@ -0,0 +1,35 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.uow import UnitOfWork
+
+
+class UnitOfWorkMiddleware(BaseMiddleware):
+    """Passes a lazily opened ``uow`` to handlers.
+
+    At most ``limit`` handlers hold it at once, so a burst of ``/start``
+    messages queues here instead of waiting on (and timing out in) the
+    connection pool, which the API and broadcasts share. Handlers return
+    their replies, which the dispatcher sends after the slot is released,
+    so Bot API round trips do not hold it.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession], limit: int):
+        self.session_factory = session_factory
+        self._slots = asyncio.Semaphore(limit)
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        async with self._slots:
+            async with UnitOfWork(session_factory=self.session_factory) as uow:
+                data["uow"] = uow
+                return await handler(event, data)
@@ -2,14 +2,14 @@ import logging
 
 from aiogram import Dispatcher, types
 from aiogram.filters import CommandStart
+from aiogram.methods import SendMessage
 
-from app.api.modules.telegram.gateway import TelegramGateway
 from app.api.modules.telegram.services.messages import (
     detect_telegram_locale,
     get_message,
     normalize_locale,
 )
-from app.database.engine import SessionFactory
+from app.database.uow import UnitOfWork
 
 logger = logging.getLogger(__name__)
 
@@ -27,79 +27,71 @@ def parse_start_payload(payload: str | None) -> tuple[str | None, str | None]:
 
 
 def register_start_handler(dp: Dispatcher) -> None:
+    # Replies are returned, not awaited: the dispatcher sends them after
+    # UnitOfWorkMiddleware has closed the session and freed its slot
     @dp.message(CommandStart())
-    async def start_command(message: types.Message) -> None:
+    async def start_command(message: types.Message, uow: UnitOfWork) -> SendMessage:
         chat_id = message.chat.id
         fallback_locale = detect_telegram_locale(
             message.from_user.language_code if message.from_user else None
         )
 
-        async with SessionFactory() as session:
-            gateway = TelegramGateway(session)
+        parts = message.text.split(maxsplit=1) if message.text else []
+        payload = parts[1] if len(parts) > 1 else None
+        token, payload_locale = parse_start_payload(payload)
+        response_locale = (
+            normalize_locale(payload_locale) if payload_locale else fallback_locale
+        )
+        binding = await uow.telegram.get_chat_binding(chat_id, token)
 
-            parts = message.text.split(maxsplit=1) if message.text else []
-            payload = parts[1] if len(parts) > 1 else None
-            token, payload_locale = parse_start_payload(payload)
-            response_locale = (
-                normalize_locale(payload_locale) if payload_locale else fallback_locale
-            )
-            existing_user_with_chat_id = await gateway.get_user_by_chat_id(chat_id)
-
-            if not token:
-                if existing_user_with_chat_id:
-                    await message.answer(
-                        get_message("already_registered", response_locale)
-                    )
-                else:
-                    await message.answer(get_message("use_link", response_locale))
-                return
-
-            user = await gateway.get_user_by_token(token)
-
-            if not user:
-                await message.answer(get_message("invalid_token", response_locale))
-                return
-
-            if existing_user_with_chat_id and existing_user_with_chat_id.id != user.id:
-                logger.debug(
-                    "Disconnecting chat_id %s from user %s to connect user %s",
-                    chat_id,
-                    existing_user_with_chat_id.id,
-                    user.id,
+        if not token:
+            if binding.chat_owner_id:
+                return message.answer(
+                    get_message("already_registered", response_locale)
                 )
-                await gateway.logout_user(existing_user_with_chat_id.id)
-                await session.flush()
+            return message.answer(get_message("use_link", response_locale))
 
-            if user.telegram_chat_id == chat_id:
-                logger.debug(
-                    "User %s already has chat_id %s, clearing token", user.id, chat_id
-                )
-                await gateway.clear_token(user.id)
-                await session.commit()
-                await message.answer(get_message("already_registered", response_locale))
-                return
+        if not binding.user_id:
+            return message.answer(get_message("invalid_token", response_locale))
 
+        if binding.chat_owner_id and binding.chat_owner_id != binding.user_id:
             logger.debug(
-                "Updating chat_id %s for user %s (previous: %s)",
+                "Disconnecting chat_id %s from user %s to connect user %s",
                 chat_id,
-                user.id,
-                user.telegram_chat_id,
+                binding.chat_owner_id,
+                binding.user_id,
             )
-            tg_username = message.from_user.username if message.from_user else None
-            await gateway.update_telegram_chat_id(
-                user.id, chat_id, username=tg_username, locale=response_locale,
+            await uow.telegram.logout_user(binding.chat_owner_id)
+
+        if binding.user_chat_id == chat_id:
+            logger.debug(
+                "User %s already has chat_id %s, clearing token",
+                binding.user_id,
+                chat_id,
             )
-            await session.commit()
-
-            await session.refresh(user)
-            if user.telegram_chat_id == chat_id:
-                logger.debug("Updated chat_id %s for user %s", chat_id, user.id)
-                await message.answer(get_message("success", response_locale))
-            else:
-                logger.error(
-                    "Failed to update chat_id for user %s: expected %s, got %s",
-                    user.id,
-                    chat_id,
-                    user.telegram_chat_id,
-                )
-                await message.answer(get_message("save_error", response_locale))
+            await uow.telegram.clear_token(binding.user_id)
+            await uow.commit()
+            return message.answer(get_message("already_registered", response_locale))
+
+        logger.debug(
+            "Updating chat_id %s for user %s (previous: %s)",
+            chat_id,
+            binding.user_id,
+            binding.user_chat_id,
+        )
+        tg_username = message.from_user.username if message.from_user else None
+        user_id = await uow.telegram.bind_chat(
+            token, chat_id, username=tg_username, locale=response_locale
+        )
+        await uow.commit()
+
+        if user_id:
+            logger.debug("Updated chat_id %s for user %s", chat_id, user_id)
+            return message.answer(get_message("success", response_locale))
+
+        # Another /start with the same link consumed the token first
+        logger.error(
+            "Failed to update chat_id for user %s: token already used",
+            binding.user_id,
+        )
+        return message.answer(get_message("save_error", response_locale))
@@ -0,0 +1,76 @@
+import time
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.exceptions import (
+    TelegramForbiddenError,
+    TelegramNetworkError,
+    TelegramRetryAfter,
+)
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.services.tracing import span
+
+TELEGRAM_REQUEST_DURATION = Histogram(
+    "telegram_request_duration_seconds",
+    "Duration of Bot API requests",
+    ["method"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+TELEGRAM_REQUESTS = Counter(
+    "telegram_requests_total",
+    "Bot API requests by outcome: ok, retry_after (flood control), "
+    "forbidden (bot blocked), network or error",
+    ["method", "outcome"],
+)
+TELEGRAM_IN_FLIGHT = Gauge(
+    "telegram_requests_in_flight",
+    "Bot API requests awaiting a response",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+
+def _outcome(error: Exception) -> str:
+    if isinstance(error, TelegramRetryAfter):
+        return "retry_after"
+    if isinstance(error, TelegramForbiddenError):
+        return "forbidden"
+    if isinstance(error, TelegramNetworkError):
+        return "network"
+    return "error"
+
+
+class TelegramMetricsMiddleware(BaseRequestMiddleware):
+    """Session middleware recording latency and outcome per Bot API method.
+
+    Inside a sampled trace, each request also gets a client span.
+    """
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        name = method.__api_method__
+        TELEGRAM_IN_FLIGHT.labels(name).inc()
+        started = time.perf_counter()
+        outcome = "ok"
+        try:
+            with span(f"telegram {name}", "client", **{"rpc.method": name}):
+                return await make_request(bot, method)
+        except Exception as e:
+            outcome = _outcome(e)
+            raise
+        finally:
+            TELEGRAM_IN_FLIGHT.labels(name).dec()
+            TELEGRAM_REQUEST_DURATION.labels(name).observe(
+                time.perf_counter() - started
+            )
+            TELEGRAM_REQUESTS.labels(name, outcome).inc()
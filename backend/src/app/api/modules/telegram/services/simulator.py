@@ -0,0 +1,94 @@
+"""In-process Bot API for benchmarks and load tests.
+
+Selected with ``APP__TELEGRAM__API_URL=simulator://telegram``: bots built by
+``create_bot`` then use ``SimulatedTelegramSession`` and nothing reaches
+api.telegram.org. Answers go through aiogram's own response parsing, so
+handlers and services see the same types and errors as with the real API.
+"""
+
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from aiogram import Bot
+from aiogram.client.session.base import BaseSession
+from aiogram.methods import TelegramMethod
+from aiogram.methods.base import TelegramType
+
+from app.settings import TelegramSimulatorConfig
+
+SIMULATOR_SCHEME = "simulator"
+
+# getUpdates waits like a long poll instead of spinning
+GET_UPDATES_WAIT = 1.0
+
+RETRY_AFTER = {
+    "ok": False,
+    "error_code": 429,
+    "description": "Too Many Requests: retry after 1",
+    "parameters": {"retry_after": 1},
+}
+
+
+class SimulatedTelegramSession(BaseSession):
+    def __init__(self, config: TelegramSimulatorConfig | None = None):
+        super().__init__()
+        self.config = config or TelegramSimulatorConfig()
+        self._rng = random.Random()
+        self._message_id = 0
+        self.calls: Counter[str] = Counter()
+
+    async def close(self) -> None:
+        pass
+
+    async def make_request(
+        self,
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+        timeout: int | None = None,
+    ) -> TelegramType:
+        name = method.__api_method__
+        self.calls[name] += 1
+        if self.config.latency_ms:
+            await asyncio.sleep(self.config.latency_ms / 1000)
+
+        if self.config.error_rate and self._rng.random() < self.config.error_rate:
+            self.check_response(bot, method, 429, json.dumps(RETRY_AFTER))
+        body = {"ok": True, "result": await self._result(method)}
+        return self.check_response(bot, method, 200, json.dumps(body)).result
+
+    async def _result(self, method: TelegramMethod[Any]) -> Any:
+        match method.__api_method__:
+            case "sendMessage":
+                self._message_id += 1
+                return {
+                    "message_id": self._message_id,
+                    "date": int(time.time()),
+                    "chat": {"id": method.chat_id, "type": "private"},
+                    "text": method.text,
+                }
+            case "getMe":
+                return {
+                    "id": 1,
+                    "is_bot": True,
+                    "first_name": "Simulator",
+                    "username": "simulator_bot",
+                }
+            case "getUpdates":
+                await asyncio.sleep(GET_UPDATES_WAIT)
+                return []
+        return True
+
+    async def stream_content(
+        self,
+        url: str,
+        headers: dict[str, Any] | None = None,
+        timeout: int = 30,
+        chunk_size: int = 65536,
+        raise_for_status: bool = True,
+    ) -> AsyncGenerator[bytes, None]:
+        yield b""
@@ -0,0 +1,66 @@
+import hmac
+import logging
+from typing import Any
+
+from aiogram.types import Update
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from redis.asyncio import Redis
+
+from app.api.modules.telegram.services.bot import TelegramBotService
+from app.settings import TelegramConfig
+
+logger = logging.getLogger(__name__)
+
+SECRET_TOKEN_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+# Telegram keeps redelivering an update until it gets a 200, for up to a day
+UPDATE_DEDUP_TTL = 24 * 60 * 60
+
+
+class TelegramWebhookService:
+    def __init__(
+        self, config: TelegramConfig, bot_service: TelegramBotService, redis: Redis
+    ):
+        self.config = config
+        self.bot_service = bot_service
+        self.redis = redis
+
+    def _check_secret(self, secret_token: str | None) -> None:
+        if self.config.mode != "webhook":
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Telegram webhook is disabled.",
+            )
+        if secret_token is None or not hmac.compare_digest(
+            secret_token, self.config.webhook_secret
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Invalid secret token.",
+            )
+
+    async def _first_delivery(self, update_id: int) -> bool:
+        # Redeliveries may reach another worker, so the set is shared
+        return bool(
+            await self.redis.set(
+                f"telegram:update:{update_id}", 1, nx=True, ex=UPDATE_DEDUP_TTL
+            )
+        )
+
+    async def handle(self, secret_token: str | None, payload: dict[str, Any]) -> None:
+        self._check_secret(secret_token)
+        try:
+            update = Update.model_validate(
+                payload, context={"bot": self.bot_service.bot}
+            )
+        except ValidationError as error:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid update.",
+            ) from error
+
+        if not await self._first_delivery(update.update_id):
+            logger.info("Skipping duplicate telegram update %s", update.update_id)
+            return
+        self.bot_service.feed_in_background(update)
@@ -1,9 +1,10 @@
 from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import BinaryExpression, func, select
+from sqlalchemy import BinaryExpression, delete, func, select, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.common.utils import PageCursor, search_rank
 from app.api.modules.users.models import User
 
 
@@ -16,13 +17,40 @@ class UserGateway:
         result = await self.session.execute(stmt)
         return result.scalar()
 
+    async def get_estimated_count(self) -> int | None:
+        if self.session.bind.dialect.name != "postgresql":
+            return None
+        stmt = text(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"
+        )
+        result = await self.session.execute(stmt, {"table": User.__tablename__})
+        estimate = result.scalar()
+        # reltuples is -1 until the table has been vacuumed or analyzed
+        return estimate if estimate is not None and estimate >= 0 else None
+
     async def get_all(
         self,
         limit: int,
         offset: int,
         filters: list[BinaryExpression],
+        after: PageCursor | None = None,
+        search: str | None = None,
     ) -> Sequence[User]:
-        stmt = select(User).filter(*filters).offset(offset=offset).limit(limit)
+        stmt = select(User).filter(*filters)
+        if search:
+            # username__search is served by the trigram index; rank prefix
+            # matches first and keep id as the tie-breaker for keyset paging
+            rank = search_rank(User.username, search)
+            stmt = stmt.order_by(rank, User.id)
+            if after is not None:
+                stmt = stmt.where(
+                    tuple_(rank, User.id) > tuple_(after.rank or 0, after.last_id)
+                )
+        else:
+            stmt = stmt.order_by(User.id)
+            if after is not None:
+                stmt = stmt.where(User.id > after.last_id)
+        stmt = stmt.offset(offset=offset).limit(limit)
         result = await self.session.execute(stmt)
         users = result.scalars().all()
         return users
@@ -41,3 +69,6 @@ class UserGateway:
         self.session.add(user)
         await self.session.flush()
         return user
+
+    async def delete(self, user_id: UUID) -> None:
+        await self.session.execute(delete(User).where(User.id == user_id))
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import UUID, BigInteger, ForeignKey, String, Text
+from sqlalchemy import UUID, BigInteger, ForeignKey, Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database.base import Base, DateTimeMixin, UUID7IDMixin
@@ -17,8 +17,38 @@ class FacebookAuth(Base, UUID7IDMixin, DateTimeMixin):
 
 class User(Base, UUID7IDMixin, DateTimeMixin):
     __tablename__ = "users"
+    __table_args__ = (
+        Index(
+            "users_telegram_daily_recipients_idx",
+            "id",
+            postgresql_where=text(
+                "telegram_chat_id IS NOT NULL"
+                " AND is_active IS true"
+                " AND telegram_daily_enabled IS true"
+            ),
+            postgresql_include=[
+                "telegram_chat_id",
+                "locale",
+                "is_admin",
+                "ad_account_id",
+                "created_by_id",
+            ],
+        ),
+        Index(
+            "users_username_trgm_idx",
+            "username",
+            postgresql_using="gin",
+            postgresql_ops={"username": "gin_trgm_ops"},
+        ),
+        Index(
+            "users_telegram_token_idx",
+            "telegram_token",
+            unique=True,
+            postgresql_where=text("telegram_token IS NOT NULL"),
+        ),
+    )
 
-    username: Mapped[str] = mapped_column(String, index=True)
+    username: Mapped[str] = mapped_column(String, index=True, unique=True)
     password: Mapped[str] = mapped_column(String)
     is_active: Mapped[bool] = mapped_column(default=True)
     is_admin: Mapped[bool] = mapped_column(default=False)
@@ -1,10 +1,10 @@
 from uuid import UUID
 
 from dishka import FromDishka
-from dishka.integrations.fastapi import DishkaRoute
 from fastapi import APIRouter, Depends, Path
 from fastapi.params import Query
 
+from app.api.common.http_cache import CachedRoute
 from app.api.modules.auth.services.auth import AdminRequired, AuthenticateUser
 from app.api.modules.users.models import User
 from app.api.modules.users.schema import (
@@ -16,7 +16,7 @@ from app.api.modules.users.schema import (
 )
 from app.api.modules.users.service import UserService
 
-router = APIRouter(route_class=DishkaRoute)
+router = APIRouter(route_class=CachedRoute)
 
 
 @router.post("", response_model=UserResponse, status_code=201)
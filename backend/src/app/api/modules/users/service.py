@@ -1,8 +1,14 @@
 from uuid import UUID
 
 from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
 
-from app.api.common.utils import build_filters
+from app.api.common.utils import (
+    build_filters,
+    decode_cursor,
+    encode_cursor,
+    search_rank_value,
+)
 from app.api.modules.auth.service import AuthService
 from app.api.modules.users.models import User
 from app.api.modules.users.schema import (
@@ -23,23 +29,51 @@ class UserService:
         self,
         params: UsersPaginationParams,
     ) -> UsersPaginationResponse:
-        pagination_data = params.model_dump(exclude_unset=True)
-        pagination_data.pop("page_size", None)
-        pagination_data.pop("page", None)
+        pagination_data = params.model_dump(
+            exclude_unset=True,
+            exclude={"page", "page_size", "cursor", "include_total"},
+        )
 
         filters = build_filters(User, pagination_data)
 
-        users = await self.uow.users.get_all(
-            limit=params.page_size,
-            offset=params.offset,
-            filters=filters,
+        search = params.username__search
+        after = decode_cursor(params.cursor) if params.is_keyset else None
+        # Fetch one extra row to find out whether there is a next page
+        users = list(
+            await self.uow.users.get_all(
+                limit=params.page_size + 1,
+                offset=0 if params.is_keyset else params.offset,
+                filters=filters,
+                after=after,
+                search=search,
+            )
         )
-        total = await self.uow.users.get_total_count(filters)
+        next_cursor = None
+        if len(users) > params.page_size:
+            users = users[: params.page_size]
+            last = users[-1]
+            rank = search_rank_value(last.username, search) if search else None
+            next_cursor = encode_cursor(last.id, rank)
+
+        include_total = params.include_total
+        if include_total is None:
+            include_total = not params.is_keyset
+
+        total = None
+        total_is_estimate = False
+        if include_total:
+            total = await self.uow.users.get_total_count(filters)
+        elif not filters:
+            total = await self.uow.users.get_estimated_count()
+            total_is_estimate = total is not None
+
         return UsersPaginationResponse(
             total=total,
+            total_is_estimate=total_is_estimate,
             items=users,
-            page=params.page,
+            page=None if params.is_keyset else params.page,
             page_size=params.page_size,
+            next_cursor=next_cursor,
         )
 
     async def get_user_by_id(
@@ -63,8 +97,14 @@ class UserService:
             ad_account_id=None if request.is_admin else request.ad_account_id,
             created_by_id=current_user.id,
         )
-        await self.uow.users.create(user)
-        await self.uow.commit()
+        try:
+            await self.uow.users.create(user)
+            await self.uow.commit()
+        except IntegrityError:
+            await self.uow.rollback()
+            raise HTTPException(
+                status_code=409, detail="Username already exists"
+            ) from None
         return user
 
     async def update_user(
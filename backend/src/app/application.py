@@ -1,26 +1,34 @@
 import asyncio
 import contextlib
 import logging
+import os
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
+from aiogram.exceptions import TelegramAPIError
 from dishka.integrations.fastapi import setup_dishka
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from prometheus_fastapi_instrumentator import Instrumentator
 
 from app.api import register_routers
+from app.api.common.profiling import SlowRequestMiddleware
+from app.api.common.query_stats import QueryStatsMiddleware
+from app.api.common.tracing import TracingMiddleware
 from app.api.modules.telegram.services.bot import TelegramBotService
 from app.ioc import get_async_container
 from app.services.logging import setup_logging
+from app.services.loop_monitor import LoopMonitor
+from app.services.process_lock import exclusive_file_lock, lock_path
+from app.services.profiling import slow_requests
+from app.services.tracing import configure_tracing
 from app.settings import get_config
 
 config = get_config()
-setup_logging(config.env)
+setup_logging(config.env, config.logging)
+configure_tracing(config.tracing.sample_ratio, service_name="api")
 logger = logging.getLogger(__name__)
 
-_telegram_bot = TelegramBotService(config.telegram)
-
 router = APIRouter()
 
 
@@ -31,12 +39,18 @@ async def ping() -> None | dict:
 
 async def _ensure_default_admin() -> None:
     import bcrypt
+    from sqlalchemy.exc import IntegrityError
 
     from app.api.modules.users.models import User
     from app.database.uow import UnitOfWork
 
+    # Workers of one host seed in turn; the unique username index settles
+    # races between hosts
     container = get_async_container()
-    async with container() as request_container:
+    async with (
+        exclusive_file_lock(lock_path("default-admin"), retry_interval=0.1),
+        container() as request_container,
+    ):
         uow = await request_container.get(UnitOfWork)
         existing = await uow.users.get_by_username("admin")
         if existing is not None:
@@ -48,25 +62,68 @@ async def _ensure_default_admin() -> None:
             is_active=True,
             is_admin=True,
         )
-        await uow.users.create(user)
-        await uow.commit()
+        try:
+            await uow.users.create(user)
+            await uow.commit()
+        except IntegrityError:
+            # Another host created it first
+            await uow.rollback()
+            return
     logger.info("Default admin user created (username: admin, password: admin)")
 
 
+async def _run_telegram_poller(bot_service: TelegramBotService) -> None:
+    # Only one process may poll a bot, or Telegram answers with conflicts
+    bot_id = config.telegram.bot_token.split(":", 1)[0]
+    async with exclusive_file_lock(lock_path(f"telegram-poller-{bot_id}")):
+        logger.info("Starting telegram bot polling in process %s...", os.getpid())
+        await bot_service.start_polling()
+
+
+async def _set_telegram_webhook(bot_service: TelegramBotService) -> None:
+    # Every worker registers the same URL; a failure only delays updates
+    try:
+        await bot_service.set_webhook()
+        logger.info("Telegram webhook set to %s", config.telegram.webhook_url)
+    except TelegramAPIError as e:
+        logger.warning("Failed to set telegram webhook: %s", e)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info("Starting application...")
 
+    # Requests, the bot poller and background broadcasts share this loop
+    loop_monitor = LoopMonitor(
+        config.loop_monitor.interval, config.loop_monitor.blocking_threshold
+    )
+    loop_monitor.start()
+
     await _ensure_default_admin()
 
-    logger.info("Starting telegram bot polling...")
-    bot_task = asyncio.create_task(_telegram_bot.start_polling())
+    profiling = config.profiling
+    if profiling.slow_request_threshold is not None:
+        slow_requests.start(
+            profiling.slow_request_threshold, profiling.sample_interval, profiling.keep
+        )
+
+    container = app.state.dishka_container
+    bot_service = await container.get(TelegramBotService)
+    bot_task = None
+    if config.telegram.mode == "webhook":
+        await _set_telegram_webhook(bot_service)
+    elif config.telegram.poller == "api":
+        bot_task = asyncio.create_task(_run_telegram_poller(bot_service))
 
     yield
 
-    bot_task.cancel()
-    with contextlib.suppress(asyncio.CancelledError):
-        await bot_task
+    if bot_task is not None:
+        bot_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await bot_task
+    await container.close()
+    slow_requests.stop()
+    await loop_monitor.stop()
 
     logger.info("Shutting down application...")
 
@@ -85,6 +142,9 @@ def get_production_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    app.add_middleware(QueryStatsMiddleware, headers=config.env in ("local", "dev"))
+    app.add_middleware(SlowRequestMiddleware)
+    app.add_middleware(TracingMiddleware)
 
     register_routers(router)
     app.include_router(router)
@@ -1,12 +1,27 @@
+import json
 import logging
 from typing import Any
 
 import httpx
 from pydantic import BaseModel
 
+from app.services.deadline import timeout_for
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with fastapi[all]
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def json_loads(content: bytes | str) -> Any:
+    """Decode JSON with orjson when installed, falling back to the stdlib."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 class HttpClientError(Exception):
     def __init__(
         self,
@@ -39,6 +54,10 @@ class HttpClient:
             return f"{self.base_url}/{path}"
         return path
 
+    @staticmethod
+    def parse_json(response: httpx.Response) -> Any:
+        return json_loads(response.content)
+
     def _merge_headers(self, headers: dict[str, str] | None) -> dict[str, str]:
         merged = self.default_headers.copy()
         if headers:
@@ -52,33 +71,38 @@ class HttpClient:
         **kwargs: Any,
     ) -> httpx.Response:
         if "timeout" not in kwargs:
-            kwargs["timeout"] = self.default_timeout
+            kwargs["timeout"] = timeout_for(self.default_timeout)
 
         if "headers" in kwargs:
             kwargs["headers"] = self._merge_headers(kwargs["headers"])
         elif self.default_headers:
             kwargs["headers"] = self.default_headers
 
+        # Skips building the extra dicts when DEBUG is off. Request kwargs
+        # are not logged, since params carry access tokens
+        debug = logger.isEnabledFor(logging.DEBUG)
         try:
-            logger.debug(
-                "Making %s request to %s",
-                method.upper(),
-                url,
-                extra={"method": method, "url": url, "kwargs": kwargs},
-            )
+            if debug:
+                logger.debug(
+                    "Making %s request to %s",
+                    method.upper(),
+                    url,
+                    extra={"method": method, "url": url},
+                )
 
             response = await self.client.request(method, url, **kwargs)
 
-            logger.debug(
-                "Received response: %s %s",
-                response.status_code,
-                url,
-                extra={
-                    "status_code": response.status_code,
-                    "url": url,
-                    "method": method,
-                },
-            )
+            if debug:
+                logger.debug(
+                    "Received response: %s %s",
+                    response.status_code,
+                    url,
+                    extra={
+                        "status_code": response.status_code,
+                        "url": url,
+                        "method": method,
+                    },
+                )
 
             response.raise_for_status()
             return response
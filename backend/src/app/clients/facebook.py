@@ -1,16 +1,112 @@
 import asyncio
 import json
 import logging
-from typing import Any
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import Any, Literal
 
 import httpx
 
 from app.clients.base import HttpClient, HttpClientError
+from app.clients.metrics import GRAPH_PAGES, GraphRequestMetrics, graph_endpoint
+from app.services.deadline import gather_cancelling, timeout_for
+from app.services.tracing import span
 from app.settings import FacebookConfig
 
 logger = logging.getLogger(__name__)
 
 
+GraphLevel = Literal["campaign", "adset", "ad"]
+
+# Projectable entity fields per level: public name -> Graph `fields` entry
+ENTITY_FIELDS: dict[GraphLevel, dict[str, str]] = {
+    "campaign": {
+        "name": "name",
+        "status": "status",
+        "objective": "objective",
+        "updated_time": "updated_time",
+    },
+    "adset": {
+        "name": "name",
+        "status": "status",
+        "targeting": "targeting",
+    },
+    "ad": {
+        "name": "name",
+        "status": "status",
+        "creative": (
+            "creative{id,thumbnail_url,body,title,link_url,image_url,video_id}"
+        ),
+    },
+}
+
+# Projectable insight metrics: public name -> Graph insights field
+INSIGHT_METRICS: dict[str, str] = {
+    "spend": "spend",
+    "impressions": "impressions",
+    "clicks": "clicks",
+    "cpc": "cpc",
+    "cpm": "cpm",
+    "ctr": "ctr",
+    "reach": "reach",
+    "conversations": "actions",
+}
+
+CONVERSATION_ACTION_TYPE = "onsite_conversion.messaging_conversation_started_7d"
+
+# Always fetched: entities without spend and impressions are dropped
+REQUIRED_METRICS = ("spend", "impressions")
+
+
+@dataclass(frozen=True, slots=True)
+class GraphFields:
+    """Entity fields and insight metrics a caller needs; ``None`` means all."""
+
+    names: frozenset[str] | None = None
+
+    @classmethod
+    def parse(cls, value: str | None) -> "GraphFields":
+        if not value:
+            return cls()
+        return cls(frozenset(n.strip() for n in value.split(",") if n.strip()))
+
+    @staticmethod
+    def available(level: GraphLevel) -> list[str]:
+        return [*ENTITY_FIELDS[level], *INSIGHT_METRICS]
+
+    def unknown(self, level: GraphLevel) -> set[str]:
+        if self.names is None:
+            return set()
+        return set(self.names) - set(self.available(level))
+
+    def wants(self, name: str) -> bool:
+        return self.names is None or name in self.names
+
+    def entity_fields(self, level: GraphLevel) -> str:
+        selected = [
+            field for name, field in ENTITY_FIELDS[level].items() if self.wants(name)
+        ]
+        return ",".join(["id", *selected])
+
+    def insight_fields(self, default: str) -> str:
+        if self.names is None:
+            return default
+        # Fields of ``default`` that are not metrics, e.g. campaign_name
+        metric_fields = set(INSIGHT_METRICS.values())
+        identity = [f for f in default.split(",") if f not in metric_fields]
+        selected = [
+            field
+            for name, field in INSIGHT_METRICS.items()
+            if name in self.names or name in REQUIRED_METRICS
+        ]
+        return ",".join([*identity, *selected])
+
+
+ALL_FIELDS = GraphFields()
+
+
 class FacebookAPIError(HttpClientError):
     def __init__(self, message: str, error_code: int | None = None, **kwargs):
         self.error_code = error_code
@@ -26,6 +122,17 @@ class FacebookClient(HttpClient):
         )
         self.config = config
 
+    async def _make_request(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        with GraphRequestMetrics(graph_endpoint(url)) as metrics:
+            response = await super()._make_request(method, url, **kwargs)
+            metrics.record(response)
+        return response
+
     def _get_active_filter(self) -> str:
         return json.dumps(
             [
@@ -37,35 +144,218 @@ class FacebookClient(HttpClient):
             ]
         )
 
+    def _entity_params(
+        self, level: GraphLevel, fields: GraphFields, active_only: bool = False
+    ) -> dict[str, Any]:
+        params: dict[str, Any] = {"fields": fields.entity_fields(level)}
+        if active_only:
+            params["filtering"] = self._get_active_filter()
+        return params
+
+    def _insight_params(
+        self,
+        level: GraphLevel,
+        time_range: dict[str, str],
+        fields: GraphFields,
+        campaign_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Account-level insights of ``level``, of one campaign if given."""
+        default = (
+            self.config.campaign_insight_fields
+            if level == "campaign"
+            else self.config.ad_insight_fields
+        )
+        params: dict[str, Any] = {
+            "time_range": json.dumps(time_range),
+            "level": level,
+            "fields": f"{level}_id,{fields.insight_fields(default)}",
+        }
+        if campaign_id is not None:
+            params["filtering"] = json.dumps(
+                [{"field": "campaign.id", "operator": "EQUAL", "value": campaign_id}]
+            )
+        return params
+
+    @staticmethod
+    def _pop_conversations(insight: dict[str, Any]) -> str | None:
+        actions = insight.pop("actions", None)
+        insight.pop("cost_per_action_type", None)
+        for a in actions or []:
+            if a.get("action_type") == CONVERSATION_ACTION_TYPE:
+                return a.get("value")
+        return None
+
+    def _index_insights(
+        self, insights: list[dict[str, Any]], id_key: str
+    ) -> dict[str, dict[str, Any]]:
+        # Decoded pages are not shared, so insights are trimmed in place
+        by_id: dict[str, dict[str, Any]] = {}
+        for insight in insights:
+            entity_id = insight.pop(id_key, None)
+            if not entity_id:
+                continue
+            insight.pop("date_start", None)
+            insight.pop("date_stop", None)
+            if "actions" in insight:
+                insight["conversations"] = self._pop_conversations(insight)
+            if insight:
+                by_id[entity_id] = insight
+        return by_id
+
+    @staticmethod
+    def _has_activity(insight: dict[str, Any]) -> bool:
+        spend = float(insight.get("spend") or 0)
+        impressions = int(float(insight.get("impressions") or 0))
+        return spend != 0 or impressions != 0
+
+    @staticmethod
+    def _campaign_row(
+        campaign: dict[str, Any], insight: dict[str, Any]
+    ) -> dict[str, Any]:
+        return {
+            "campaign_id": campaign["id"],
+            "campaign_name": campaign.get("name"),
+            "objective": campaign.get("objective"),
+            "status": campaign.get("status"),
+            "updated_time": campaign.get("updated_time"),
+            "insights": insight,
+        }
+
+    @staticmethod
+    def _adset_row(adset: dict[str, Any], insight: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "adset_id": adset["id"],
+            "adset_name": adset.get("name"),
+            "targeting": adset.get("targeting", {}),
+            "status": adset.get("status"),
+            "insights": insight,
+        }
+
+    @staticmethod
+    def _ad_row(ad: dict[str, Any], insight: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "ad_id": ad["id"],
+            "ad_name": ad.get("name"),
+            "status": ad.get("status"),
+            "creative": ad.get("creative", {}),
+            "insights": insight,
+        }
+
+    async def _iter_pages(
+        self,
+        endpoint: str,
+        access_token: str,
+        params: dict[str, Any] | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        params = {**(params or {}), "access_token": access_token}
+        url = self._build_url(endpoint)
+        label = graph_endpoint(url)
+        pages = 0
+
+        try:
+            while url:
+                with span(
+                    "graph.page",
+                    "client",
+                    **{"graph.endpoint": label, "graph.page": pages + 1},
+                ) as page_span:
+                    with GraphRequestMetrics(label) as metrics:
+                        response = await self.client.get(
+                            url,
+                            params=params,
+                            timeout=timeout_for(self.default_timeout),
+                        )
+                        metrics.record(response)
+                    pages += 1
+                    page_span.set_attribute(
+                        "http.response.status_code", response.status_code
+                    )
+                    page_span.set_attribute(
+                        "http.response.body.size", len(response.content)
+                    )
+                    data = self.parse_json(response)
+
+                    if "error" in data:
+                        error = data["error"]
+                        raise FacebookAPIError(
+                            message=error.get("message", str(error)),
+                            error_code=error.get("code"),
+                            response_body=data,
+                        )
+
+                yield data.get("data", [])
+                url = data.get("paging", {}).get("next")
+                params = None
+        finally:
+            GRAPH_PAGES.labels(label).observe(pages)
+
     async def _fetch_with_pagination(
         self,
         endpoint: str,
         access_token: str,
         params: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
-        params = params or {}
-        params["access_token"] = access_token
         items: list[dict[str, Any]] = []
+        with span("graph.paginate", **{"graph.endpoint": endpoint}) as call:
+            async with aclosing(
+                self._iter_pages(endpoint, access_token, params)
+            ) as pages:
+                async for page in pages:
+                    items.extend(page)
+            call.set_attribute("graph.items", len(items))
+        return items
 
-        url = self._build_url(endpoint)
-
-        while url:
-            response = await self.client.get(url, params=params, timeout=60.0)
-            data = response.json()
-
-            if "error" in data:
-                error = data["error"]
-                raise FacebookAPIError(
-                    message=error.get("message", str(error)),
-                    error_code=error.get("code"),
-                    response_body=data,
+    async def _join_pages(
+        self,
+        entity_pages: AsyncIterator[list[dict[str, Any]]],
+        insight_pages: AsyncIterator[list[dict[str, Any]]],
+        id_key: str,
+    ) -> AsyncIterator[tuple[dict[str, Any], dict[str, Any]]]:
+        """Pair entities with their insights as pages of either side arrive.
+
+        Both paginations run concurrently; an entity is yielded as soon as
+        its insight has been seen, so entities without insights never are.
+        """
+        sources = {"entities": entity_pages, "insights": insight_pages}
+        entities: dict[str, dict[str, Any]] = {}
+        insights: dict[str, dict[str, Any]] = {}
+        pending = {
+            asyncio.ensure_future(anext(pages)): name for name, pages in sources.items()
+        }
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
-
-            items.extend(data.get("data", []))
-            url = data.get("paging", {}).get("next")
-            params = None
-
-        return items
+                for task in done:
+                    name = pending.pop(task)
+                    try:
+                        page = task.result()
+                    except StopAsyncIteration:
+                        continue
+                    pending[asyncio.ensure_future(anext(sources[name]))] = name
+
+                    if name == "entities":
+                        for entity in page:
+                            insight = insights.pop(entity["id"], None)
+                            if insight is None:
+                                entities[entity["id"]] = entity
+                            else:
+                                yield entity, insight
+                    else:
+                        indexed = self._index_insights(page, id_key)
+                        for entity_id, insight in indexed.items():
+                            entity = entities.pop(entity_id, None)
+                            if entity is None:
+                                insights[entity_id] = insight
+                            else:
+                                yield entity, insight
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for pages in sources.values():
+                await pages.aclose()
 
     async def exchange_code(self, code: str, redirect_uri: str) -> dict[str, Any]:
         response = await self.get(
@@ -77,7 +367,7 @@ class FacebookClient(HttpClient):
                 "code": code,
             },
         )
-        data = response.json()
+        data = self.parse_json(response)
 
         if "error" in data:
             error = data["error"]
@@ -99,7 +389,7 @@ class FacebookClient(HttpClient):
                 "fb_exchange_token": short_lived_token,
             },
         )
-        data = response.json()
+        data = self.parse_json(response)
 
         if "error" in data:
             error = data["error"]
@@ -126,17 +416,12 @@ class FacebookClient(HttpClient):
         access_token: str,
         time_range: dict[str, str],
         active_only: bool = True,
+        fields: GraphFields = ALL_FIELDS,
     ) -> list[dict[str, Any]]:
-        params: dict[str, Any] = {
-            "fields": "id,name,status,objective,updated_time",
-        }
-        if active_only:
-            params["filtering"] = self._get_active_filter()
-
         campaigns = await self._fetch_with_pagination(
             f"act_{account_id}/campaigns",
             access_token,
-            params=params,
+            params=self._entity_params("campaign", fields, active_only),
         )
 
         if not campaigns:
@@ -145,59 +430,17 @@ class FacebookClient(HttpClient):
         all_insights = await self._fetch_with_pagination(
             f"act_{account_id}/insights",
             access_token,
-            params={
-                "time_range": json.dumps(time_range),
-                "level": "campaign",
-                "fields": f"campaign_id,{self.config.campaign_insight_fields}",
-            },
+            params=self._insight_params("campaign", time_range, fields),
         )
-
-        insights_by_campaign: dict[str, dict[str, Any]] = {}
-        for insight in all_insights:
-            campaign_id = insight.get("campaign_id")
-            if campaign_id:
-                cleaned = dict(insight)
-                cleaned.pop("date_start", None)
-                cleaned.pop("date_stop", None)
-                cleaned.pop("campaign_id", None)
-
-                actions = cleaned.pop("actions", None)
-                cleaned.pop("cost_per_action_type", None)
-
-                conversations = None
-                if actions:
-                    for a in actions:
-                        if a.get("action_type") == "onsite_conversion.messaging_conversation_started_7d":
-                            conversations = a.get("value")
-                            break
-
-                cleaned["conversations"] = conversations
-
-                if cleaned:
-                    insights_by_campaign[campaign_id] = cleaned
+        insights_by_campaign = self._index_insights(all_insights, "campaign_id")
 
         result = []
         for campaign in campaigns:
             insight = insights_by_campaign.get(campaign["id"])
-            if not insight:
-                continue
-
             # Skip campaigns with no activity in the period
-            spend = float(insight.get("spend") or 0)
-            impressions = int(float(insight.get("impressions") or 0))
-            if spend == 0 and impressions == 0:
+            if not insight or not self._has_activity(insight):
                 continue
-
-            result.append(
-                {
-                    "campaign_id": campaign["id"],
-                    "campaign_name": campaign.get("name"),
-                    "objective": campaign.get("objective"),
-                    "status": campaign.get("status"),
-                    "updated_time": campaign.get("updated_time"),
-                    "insights": insight,
-                }
-            )
+            result.append(self._campaign_row(campaign, insight))
 
         return result
 
@@ -207,13 +450,12 @@ class FacebookClient(HttpClient):
         account_id: str,
         access_token: str,
         time_range: dict[str, str],
+        fields: GraphFields = ALL_FIELDS,
     ) -> list[dict[str, Any]]:
         adsets = await self._fetch_with_pagination(
             f"{campaign_id}/adsets",
             access_token,
-            params={
-                "fields": "id,name,targeting,status",
-            },
+            params=self._entity_params("adset", fields),
         )
 
         if not adsets:
@@ -222,48 +464,16 @@ class FacebookClient(HttpClient):
         all_insights = await self._fetch_with_pagination(
             f"act_{account_id}/insights",
             access_token,
-            params={
-                "time_range": json.dumps(time_range),
-                "level": "adset",
-                "fields": f"adset_id,{self.config.ad_insight_fields}",
-                "filtering": json.dumps(
-                    [
-                        {
-                            "field": "campaign.id",
-                            "operator": "EQUAL",
-                            "value": campaign_id,
-                        }
-                    ]
-                ),
-            },
+            params=self._insight_params("adset", time_range, fields, campaign_id),
         )
 
-        insights_by_adset: dict[str, dict[str, Any]] = {}
-        for insight in all_insights:
-            adset_id = insight.get("adset_id")
-            if adset_id:
-                cleaned = dict(insight)
-                cleaned.pop("date_start", None)
-                cleaned.pop("date_stop", None)
-                cleaned.pop("adset_id", None)
-                if cleaned:
-                    insights_by_adset[adset_id] = cleaned
+        insights_by_adset = self._index_insights(all_insights, "adset_id")
 
         result = []
         for adset in adsets:
             insight = insights_by_adset.get(adset["id"])
-            if not insight:
-                continue
-
-            result.append(
-                {
-                    "adset_id": adset["id"],
-                    "adset_name": adset.get("name"),
-                    "targeting": adset.get("targeting", {}),
-                    "status": adset.get("status"),
-                    "insights": insight,
-                }
-            )
+            if insight:
+                result.append(self._adset_row(adset, insight))
 
         return result
 
@@ -272,47 +482,227 @@ class FacebookClient(HttpClient):
         adset_id: str,
         access_token: str,
         time_range: dict[str, str],
+        fields: GraphFields = ALL_FIELDS,
     ) -> list[dict[str, Any]]:
         ads = await self._fetch_with_pagination(
             f"{adset_id}/ads",
             access_token,
             params={
-                "fields": "id,name,status,creative{id,thumbnail_url,body,title,link_url,image_url,video_id}",
+                "fields": fields.entity_fields("ad"),
             },
         )
+        insight_fields = fields.insight_fields(self.config.ad_insight_fields)
 
         if not ads:
             return []
 
         semaphore = asyncio.Semaphore(5)
+        results = await gather_cancelling(
+            *[
+                self._fetch_ad_row(
+                    ad, access_token, time_range, insight_fields, semaphore
+                )
+                for ad in ads
+            ]
+        )
+        return [r for r in results if r is not None]
+
+    async def _fetch_ad_row(
+        self,
+        ad: dict[str, Any],
+        access_token: str,
+        time_range: dict[str, str],
+        insight_fields: str,
+        semaphore: asyncio.Semaphore,
+    ) -> dict[str, Any] | None:
+        async with semaphore:
+            insights = await self._fetch_with_pagination(
+                f"{ad['id']}/insights",
+                access_token,
+                params={
+                    "fields": insight_fields,
+                    "time_range": json.dumps(time_range),
+                },
+            )
+
+        if not insights:
+            return None
+
+        insight = insights[0]
+        insight.pop("date_start", None)
+        insight.pop("date_stop", None)
+        if "actions" in insight:
+            insight["conversations"] = self._pop_conversations(insight)
+        if not insight:
+            return None
+
+        return self._ad_row(ad, insight)
 
-        async def fetch_ad_insight(ad: dict[str, Any]) -> dict[str, Any] | None:
-            async with semaphore:
-                insights = await self._fetch_with_pagination(
-                    f"{ad['id']}/insights",
+    async def iter_campaigns(
+        self,
+        account_id: str,
+        access_token: str,
+        time_range: dict[str, str],
+        active_only: bool = True,
+        fields: GraphFields = ALL_FIELDS,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Like ``get_campaigns``, yielding each campaign once it is joined."""
+        joined = self._join_pages(
+            self._iter_pages(
+                f"act_{account_id}/campaigns",
+                access_token,
+                self._entity_params("campaign", fields, active_only),
+            ),
+            self._iter_pages(
+                f"act_{account_id}/insights",
+                access_token,
+                self._insight_params("campaign", time_range, fields),
+            ),
+            "campaign_id",
+        )
+        async with aclosing(joined):
+            async for campaign, insight in joined:
+                if self._has_activity(insight):
+                    yield self._campaign_row(campaign, insight)
+
+    async def iter_adsets(
+        self,
+        campaign_id: str,
+        account_id: str,
+        access_token: str,
+        time_range: dict[str, str],
+        fields: GraphFields = ALL_FIELDS,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Like ``get_adsets``, yielding each ad set once it is joined."""
+        joined = self._join_pages(
+            self._iter_pages(
+                f"{campaign_id}/adsets",
+                access_token,
+                self._entity_params("adset", fields),
+            ),
+            self._iter_pages(
+                f"act_{account_id}/insights",
+                access_token,
+                self._insight_params("adset", time_range, fields, campaign_id),
+            ),
+            "adset_id",
+        )
+        async with aclosing(joined):
+            async for adset, insight in joined:
+                yield self._adset_row(adset, insight)
+
+    async def iter_ads(
+        self,
+        adset_id: str,
+        access_token: str,
+        time_range: dict[str, str],
+        fields: GraphFields = ALL_FIELDS,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Like ``get_ads``, yielding each ad as soon as its insight arrives."""
+        insight_fields = fields.insight_fields(self.config.ad_insight_fields)
+        semaphore = asyncio.Semaphore(5)
+        tasks: list[asyncio.Future[dict[str, Any] | None]] = []
+        try:
+            async with aclosing(
+                self._iter_pages(
+                    f"{adset_id}/ads",
                     access_token,
-                    params={
-                        "fields": self.config.ad_insight_fields,
-                        "time_range": json.dumps(time_range),
-                    },
+                    params={"fields": fields.entity_fields("ad")},
                 )
+            ) as pages:
+                async for page in pages:
+                    tasks.extend(
+                        asyncio.ensure_future(
+                            self._fetch_ad_row(
+                                ad, access_token, time_range, insight_fields, semaphore
+                            )
+                        )
+                        for ad in page
+                    )
+            for next_done in asyncio.as_completed(tasks):
+                row = await next_done
+                if row is not None:
+                    yield row
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def get_account_snapshot(
+        self,
+        account_id: str,
+        access_token: str,
+        time_range: dict[str, str],
+        active_only: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Campaigns with nested ad sets and ads, from six concurrent requests.
 
-            if not insights:
-                return None
+        Entities are listed account-wide and insights are fetched with
+        account-level ``level=campaign|adset|ad`` calls, instead of one
+        request per campaign, ad set and ad.
+        """
+        entity_params: dict[str, Any] = {}
+        if active_only:
+            entity_params["filtering"] = self._get_active_filter()
 
-            insight = dict(insights[0])
-            insight.pop("date_start", None)
-            insight.pop("date_stop", None)
-            if not insight:
-                return None
-
-            return {
-                "ad_id": ad["id"],
-                "ad_name": ad.get("name"),
-                "status": ad.get("status"),
-                "creative": ad.get("creative", {}),
-                "insights": insight,
-            }
-
-        results = await asyncio.gather(*[fetch_ad_insight(ad) for ad in ads])
-        return [r for r in results if r is not None]
+        def list_entities(edge: str, fields: str) -> Any:
+            return self._fetch_with_pagination(
+                f"act_{account_id}/{edge}",
+                access_token,
+                params={**entity_params, "fields": fields},
+            )
+
+        def list_insights(level: GraphLevel, fields: str) -> Any:
+            return self._fetch_with_pagination(
+                f"act_{account_id}/insights",
+                access_token,
+                params={
+                    "time_range": json.dumps(time_range),
+                    "level": level,
+                    "fields": f"{level}_id,{fields}",
+                },
+            )
+
+        (
+            campaigns,
+            adsets,
+            ads,
+            campaign_insights,
+            adset_insights,
+            ad_insights,
+        ) = await gather_cancelling(
+            list_entities("campaigns", ALL_FIELDS.entity_fields("campaign")),
+            list_entities("adsets", f"campaign_id,{ALL_FIELDS.entity_fields('adset')}"),
+            list_entities("ads", f"adset_id,{ALL_FIELDS.entity_fields('ad')}"),
+            list_insights("campaign", self.config.campaign_insight_fields),
+            list_insights("adset", self.config.ad_insight_fields),
+            list_insights("ad", self.config.ad_insight_fields),
+        )
+
+        insights_by_ad = self._index_insights(ad_insights, "ad_id")
+        ads_by_adset: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for ad in ads:
+            insight = insights_by_ad.get(ad["id"])
+            if insight:
+                ads_by_adset[ad.get("adset_id")].append(self._ad_row(ad, insight))
+
+        insights_by_adset = self._index_insights(adset_insights, "adset_id")
+        adsets_by_campaign: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for adset in adsets:
+            insight = insights_by_adset.get(adset["id"])
+            if insight:
+                row = self._adset_row(adset, insight)
+                row["ads"] = ads_by_adset.get(adset["id"], [])
+                adsets_by_campaign[adset.get("campaign_id")].append(row)
+
+        insights_by_campaign = self._index_insights(campaign_insights, "campaign_id")
+        result = []
+        for campaign in campaigns:
+            insight = insights_by_campaign.get(campaign["id"])
+            if not insight or not self._has_activity(insight):
+                continue
+            row = self._campaign_row(campaign, insight)
+            row["adsets"] = adsets_by_campaign.get(campaign["id"], [])
+            result.append(row)
+
+        return result
@@ -0,0 +1,489 @@
+"""Synthetic Graph API for benchmarks and load tests.
+
+Serves the endpoints ``FacebookClient`` calls from deterministic generated
+data: ad accounts, campaigns, ad sets, ads and insights at the scale set in
+``GraphSimulatorConfig``, with cursor paging, latency, injected errors and
+throttling, and the usage headers the real API sends.
+
+Set ``APP__FACEBOOK__BASE_URL=simulator://graph`` to serve it in-process
+(``graph_mounts``), or run ``cli graph-simulator`` and point ``base_url`` at it
+to share one simulator between processes.
+"""
+
+import asyncio
+import base64
+import json
+import math
+import random
+import time
+from collections import Counter, deque
+from collections.abc import Iterator
+from datetime import date, timedelta
+from typing import Any
+
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from app.clients.facebook import CONVERSATION_ACTION_TYPE
+from app.settings import FacebookConfig, GraphSimulatorConfig
+
+SIMULATOR_SCHEME = "simulator"
+
+# Entity ids encode their position: kind digit, then account, campaign,
+# ad set and ad indexes, so any id can be resolved without a lookup table
+LEVEL_KIND = {"campaign": "2", "adset": "3", "ad": "4"}
+KIND_LEVEL = {kind: level for level, kind in LEVEL_KIND.items()}
+LEVEL_DEPTH = {"campaign": 2, "adset": 3, "ad": 4}
+ID_WIDTHS = (4, 5, 3, 3)
+
+# Salts of the per-entity draws
+SALT_STATUS, SALT_ACTIVE, SALT_ENTITY, SALT_METRICS = range(4)
+DRAW_MASK = 2**48 - 1
+
+STATUSES = (("ACTIVE", 0.6), ("PAUSED", 0.85), ("ARCHIVED", 1.0))
+OBJECTIVES = ("OUTCOME_ENGAGEMENT", "OUTCOME_LEADS", "OUTCOME_TRAFFIC")
+ERROR_MESSAGES = {
+    1: "An unknown error occurred",
+    2: "Service temporarily unavailable",
+    4: "Application request limit reached",
+    80004: "There have been too many calls to this ad-account.",
+}
+
+
+class GraphError(Exception):
+    def __init__(self, code: int, status_code: int = 400, message: str | None = None):
+        self.code = code
+        self.status_code = status_code
+        self.message = message or ERROR_MESSAGES.get(code, "Invalid request")
+        super().__init__(self.message)
+
+
+def _split_fields(value: str | None) -> set[str]:
+    """Top-level names of a ``fields`` parameter, ignoring ``{...}`` subfields."""
+    names: set[str] = set()
+    depth = 0
+    name = ""
+    for char in value or "":
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+        elif char == "," and depth == 0:
+            names.add(name)
+            name = ""
+        elif depth == 0:
+            name += char
+    names.add(name)
+    names.discard("")
+    return names
+
+
+def _encode_cursor(position: int) -> str:
+    return base64.urlsafe_b64encode(str(position).encode()).decode()
+
+
+def _decode_cursor(cursor: str | None) -> int:
+    if not cursor:
+        return 0
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError as e:
+        raise GraphError(100, message="Invalid cursor") from e
+
+
+class GraphSimulator:
+    def __init__(self, config: GraphSimulatorConfig | None = None):
+        self.config = config or GraphSimulatorConfig()
+        self._rng = random.Random(self.config.seed)
+        self._recent_calls: deque[float] = deque()
+        self.calls: Counter[str] = Counter()
+        self.errors: Counter[int] = Counter()
+        self.bytes_sent = 0
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def asgi(self) -> Starlette:
+        async def endpoint(request: Request) -> Response:
+            response = await self.handle(httpx.Request("GET", str(request.url)))
+            return Response(
+                response.content,
+                status_code=response.status_code,
+                headers=dict(response.headers),
+            )
+
+        return Starlette(routes=[Route("/{path:path}", endpoint)])
+
+    def reset_stats(self) -> None:
+        self.calls.clear()
+        self.errors.clear()
+        self.bytes_sent = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        if self.config.latency_ms:
+            await asyncio.sleep(self._latency())
+
+        # Path is "/<version>/<node>[/<edge>]"
+        parts = request.url.path.strip("/").split("/")[1:]
+        params = request.url.params
+        route = self._route_name(parts)
+        self.calls[route] += 1
+        usage = self._record_usage()
+        headers = self._usage_headers(parts, usage)
+
+        try:
+            self._inject_failures(parts, usage, params)
+            body = self._dispatch(request.url, parts, params)
+        except GraphError as e:
+            self.errors[e.code] += 1
+            body = {
+                "error": {
+                    "message": e.message,
+                    "type": "OAuthException",
+                    "code": e.code,
+                    "is_transient": e.status_code >= 500 or e.code in (4, 80004),
+                    "fbtrace_id": "simulator",
+                }
+            }
+            response = httpx.Response(e.status_code, json=body, headers=headers)
+        else:
+            response = httpx.Response(200, json=body, headers=headers)
+        self.bytes_sent += len(response.content)
+        return response
+
+    @staticmethod
+    def _route_name(parts: list[str]) -> str:
+        # Low-cardinality label: ids replaced by their kind
+        names = []
+        for part in parts:
+            if part.startswith("act_"):
+                names.append("act")
+            elif part.isdigit():
+                names.append(KIND_LEVEL.get(part[0], "node"))
+            else:
+                names.append(part)
+        return "/".join(names)
+
+    def _latency(self) -> float:
+        median = self.config.latency_ms / 1000
+        if not self.config.latency_sigma:
+            return median
+        return self._rng.lognormvariate(math.log(median), self.config.latency_sigma)
+
+    def _record_usage(self) -> float:
+        now = time.monotonic()
+        window_start = now - self.config.usage_window
+        while self._recent_calls and self._recent_calls[0] < window_start:
+            self._recent_calls.popleft()
+        self._recent_calls.append(now)
+        return len(self._recent_calls) * 100 / self.config.usage_limit
+
+    def _usage_headers(self, parts: list[str], usage: float) -> dict[str, str]:
+        pct = min(100, int(usage))
+        headers = {
+            "x-app-usage": json.dumps(
+                {"call_count": pct, "total_cputime": pct // 2, "total_time": pct // 2}
+            )
+        }
+        if parts and parts[0].startswith("act_"):
+            account_id = parts[0].removeprefix("act_")
+            regain = 0 if usage < 100 else math.ceil(self.config.usage_window / 60)
+            headers["x-business-use-case-usage"] = json.dumps(
+                {
+                    account_id: [
+                        {
+                            "type": "ads_insights",
+                            "call_count": pct,
+                            "total_cputime": pct // 2,
+                            "total_time": pct // 2,
+                            "estimated_time_to_regain_access": regain,
+                        }
+                    ]
+                }
+            )
+            headers["x-ad-account-usage"] = json.dumps({"acc_id_util_pct": pct})
+        return headers
+
+    def _inject_failures(
+        self, parts: list[str], usage: float, params: httpx.QueryParams
+    ) -> None:
+        if parts[:1] == ["oauth"]:
+            return
+        if not params.get("access_token"):
+            raise GraphError(190, message="An access token is required")
+        throttle_code = 80004 if parts and parts[0].startswith("act_") else 4
+        if usage > 100:
+            raise GraphError(throttle_code)
+        if (
+            self.config.rate_limit_rate
+            and self._rng.random() < self.config.rate_limit_rate
+        ):
+            raise GraphError(throttle_code)
+        if self.config.error_rate and self._rng.random() < self.config.error_rate:
+            raise GraphError(self._rng.choice(self.config.error_codes), status_code=500)
+
+    def _dispatch(
+        self, url: httpx.URL, parts: list[str], params: httpx.QueryParams
+    ) -> dict[str, Any]:
+        match parts:
+            case ["oauth", "access_token"]:
+                return {
+                    "access_token": f"simulated-{self._rng.getrandbits(64):x}",
+                    "token_type": "bearer",
+                    "expires_in": 60 * 24 * 3600,
+                }
+            case ["me", "adaccounts"]:
+                accounts = [self._account(a) for a in range(self.config.accounts)]
+                return {"data": accounts}
+            case [node, edge]:
+                path = self._resolve(node)
+                if edge == "insights":
+                    return self._insights_page(url, path, params)
+                level = {"campaigns": "campaign", "adsets": "adset", "ads": "ad"}.get(
+                    edge
+                )
+                if level is None or LEVEL_DEPTH[level] <= len(path):
+                    raise GraphError(100, message=f"Unsupported edge {edge}")
+                return self._entities_page(url, level, path, params)
+        raise GraphError(100, message="Unsupported get request")
+
+    def _resolve(self, node: str) -> tuple[int, ...]:
+        if node.startswith("act_"):
+            account = int(node.removeprefix("act_")) - 10000
+            if not 0 <= account < self.config.accounts:
+                raise GraphError(100, message=f"Unknown ad account {node}")
+            return (account,)
+        level = KIND_LEVEL.get(node[:1])
+        if level is None:
+            raise GraphError(100, message=f"Unknown node {node}")
+        path: list[int] = []
+        offset = 1
+        for width in ID_WIDTHS[: LEVEL_DEPTH[level]]:
+            path.append(int(node[offset : offset + width]))
+            offset += width
+        return tuple(path)
+
+    @staticmethod
+    def _entity_id(path: tuple[int, ...]) -> str:
+        level = next(k for k, v in LEVEL_DEPTH.items() if v == len(path))
+        digits = "".join(
+            f"{index:0{width}d}" for index, width in zip(path, ID_WIDTHS, strict=False)
+        )
+        return LEVEL_KIND[level] + digits
+
+    def _draw(self, path: tuple[int, ...], salt: int, k: int = 0) -> float:
+        """Deterministic uniform [0, 1) value for an entity attribute.
+
+        Hashes of int tuples are not randomized per process, and this is far
+        cheaper than seeding a ``random.Random`` per entity at benchmark scale.
+        """
+        return (hash((self.config.seed, salt, k, *path)) & DRAW_MASK) / (DRAW_MASK + 1)
+
+    def _pick(self, options: tuple[Any, ...], path: tuple[int, ...], k: int) -> Any:
+        return options[int(self._draw(path, SALT_ENTITY, k) * len(options))]
+
+    def _scan(
+        self, level: str, scope: tuple[int, ...], start: int
+    ) -> Iterator[tuple[int, tuple[int, ...]]]:
+        """Positions and paths of ``level`` entities under ``scope``, in order."""
+        sizes = (
+            self.config.campaigns,
+            self.config.adsets_per_campaign,
+            self.config.ads_per_adset,
+        )
+        free = sizes[len(scope) - 1 : LEVEL_DEPTH[level] - 1]
+        for position in range(start, math.prod(free)):
+            digits = []
+            rest = position
+            for size in reversed(free):
+                rest, digit = divmod(rest, size)
+                digits.append(digit)
+            yield position, scope + tuple(reversed(digits))
+
+    def _page(
+        self,
+        url: httpx.URL,
+        params: httpx.QueryParams,
+        level: str,
+        scope: tuple[int, ...],
+        row: Any,
+    ) -> dict[str, Any]:
+        limit = int(params.get("limit") or self.config.page_size)
+        data: list[dict[str, Any]] = []
+        last = None
+        more = False
+        for position, path in self._scan(
+            level, scope, _decode_cursor(params.get("after"))
+        ):
+            if len(data) == limit:
+                more = True
+                break
+            last = position
+            item = row(path)
+            if item is not None:
+                data.append(item)
+
+        body: dict[str, Any] = {"data": data}
+        if last is not None:
+            after = _encode_cursor(last + 1)
+            body["paging"] = {"cursors": {"after": after}}
+            if more:
+                body["paging"]["next"] = str(url.copy_set_param("after", after))
+        return body
+
+    def _status(self, path: tuple[int, ...]) -> str:
+        draw = self._draw(path, SALT_STATUS)
+        return next(status for status, bound in STATUSES if draw < bound)
+
+    def _is_active(self, path: tuple[int, ...]) -> bool:
+        return self._draw(path, SALT_ACTIVE) < self.config.active_ratio
+
+    @staticmethod
+    def _status_filter(params: httpx.QueryParams) -> tuple[set[str] | None, str | None]:
+        statuses = None
+        campaign_id = None
+        for rule in json.loads(params.get("filtering") or "[]"):
+            if rule.get("field") == "effective_status":
+                statuses = set(rule.get("value") or [])
+            elif rule.get("field") == "campaign.id":
+                campaign_id = str(rule.get("value"))
+        return statuses, campaign_id
+
+    def _account(self, account: int) -> dict[str, Any]:
+        account_id = str(10000 + account)
+        return {
+            "id": f"act_{account_id}",
+            "account_id": account_id,
+            "name": f"Simulated account {account + 1}",
+            "currency": "USD",
+            "account_status": 1,
+        }
+
+    def _entity(self, level: str, path: tuple[int, ...]) -> dict[str, Any]:
+        entity_id = self._entity_id(path)
+        status = self._status(path)
+        entity: dict[str, Any] = {
+            "id": entity_id,
+            "name": f"{level.title()} {'.'.join(str(i + 1) for i in path[1:])}",
+            "status": status,
+            "effective_status": status,
+        }
+        if level == "campaign":
+            entity["objective"] = self._pick(OBJECTIVES, path, 0)
+            day = date(2026, 1, 1) + timedelta(
+                days=int(self._draw(path, SALT_ENTITY, 1) * 365)
+            )
+            entity["updated_time"] = f"{day.isoformat()}T10:00:00+0000"
+        elif level == "adset":
+            entity["campaign_id"] = self._entity_id(path[:2])
+            entity["targeting"] = {
+                "age_min": self._pick((18, 21, 25), path, 0),
+                "age_max": self._pick((45, 55, 65), path, 1),
+                "geo_locations": {"countries": ["UA"]},
+            }
+        else:
+            entity["campaign_id"] = self._entity_id(path[:2])
+            entity["adset_id"] = self._entity_id(path[:3])
+            entity["creative"] = {
+                "id": f"9{entity_id[1:]}",
+                "title": f"Creative {entity_id}",
+                "body": "Simulated ad copy",
+                "link_url": "https://example.com",
+                "image_url": f"https://example.com/{entity_id}.jpg",
+                "thumbnail_url": f"https://example.com/{entity_id}_thumb.jpg",
+            }
+        return entity
+
+    def _entities_page(
+        self,
+        url: httpx.URL,
+        level: str,
+        scope: tuple[int, ...],
+        params: httpx.QueryParams,
+    ) -> dict[str, Any]:
+        fields = _split_fields(params.get("fields")) | {"id"}
+        statuses, _ = self._status_filter(params)
+
+        def row(path: tuple[int, ...]) -> dict[str, Any] | None:
+            if statuses is not None and self._status(path) not in statuses:
+                return None
+            entity = self._entity(level, path)
+            return {k: v for k, v in entity.items() if k in fields}
+
+        return self._page(url, params, level, scope, row)
+
+    def _metrics(self, path: tuple[int, ...], days: int) -> dict[str, Any]:
+        draws = [self._draw(path, SALT_METRICS, k) for k in range(4)]
+        impressions = (200 + int(draws[0] * 19800)) * days
+        clicks = max(1, int(impressions * (0.005 + draws[1] * 0.025)))
+        spend = impressions / 1000 * (1.0 + draws[2] * 7.0)
+        conversations = int(clicks * (0.05 + draws[3] * 0.25))
+        return {
+            "spend": f"{spend:.2f}",
+            "impressions": str(impressions),
+            "clicks": str(clicks),
+            "cpc": f"{spend / clicks:.6f}",
+            "cpm": f"{spend * 1000 / impressions:.6f}",
+            "ctr": f"{clicks * 100 / impressions:.6f}",
+            "reach": str(int(impressions * 0.7)),
+            "actions": [
+                {"action_type": "link_click", "value": str(clicks)},
+                {"action_type": CONVERSATION_ACTION_TYPE, "value": str(conversations)},
+            ],
+        }
+
+    def _insights_page(
+        self, url: httpx.URL, scope: tuple[int, ...], params: httpx.QueryParams
+    ) -> dict[str, Any]:
+        time_range = json.loads(params.get("time_range") or "{}")
+        since = date.fromisoformat(time_range.get("since", "2026-01-01"))
+        until = date.fromisoformat(time_range.get("until", "2026-01-30"))
+        days = max(1, (until - since).days + 1)
+        fields = _split_fields(params.get("fields"))
+
+        node_level = next((k for k, v in LEVEL_DEPTH.items() if v == len(scope)), None)
+        level = params.get("level") or node_level
+        if level is not None and level not in LEVEL_DEPTH:
+            raise GraphError(100, message=f"Unsupported level {level}")
+        _, campaign_id = self._status_filter(params)
+        if campaign_id and len(scope) == 1:
+            campaign = self._resolve(campaign_id)
+            if campaign[0] != scope[0]:
+                return {"data": []}
+            scope = campaign
+
+        def row(path: tuple[int, ...]) -> dict[str, Any] | None:
+            if len(path) > 1 and not self._is_active(path):
+                return None
+            insight: dict[str, Any] = {}
+            if len(path) > 1:
+                insight["campaign_id"] = self._entity_id(path[:2])
+                insight["campaign_name"] = f"Campaign {path[1] + 1}"
+            if len(path) > 2:
+                insight["adset_id"] = self._entity_id(path[:3])
+            if len(path) > 3:
+                insight["ad_id"] = self._entity_id(path)
+            insight = {k: v for k, v in insight.items() if k in fields}
+            metrics = self._metrics(path, days)
+            insight.update((k, v) for k, v in metrics.items() if k in fields)
+            insight["date_start"] = since.isoformat()
+            insight["date_stop"] = until.isoformat()
+            return insight
+
+        if level is None or LEVEL_DEPTH[level] == len(scope):
+            # The node's own insights: a single row, or none without activity
+            item = row(scope)
+            return {"data": [item] if item else []}
+        if LEVEL_DEPTH[level] < len(scope):
+            raise GraphError(100, message=f"Level {level} is above the node")
+        return self._page(url, params, level, scope, row)
+
+
+def graph_mounts(config: FacebookConfig) -> dict[str, httpx.AsyncBaseTransport]:
+    """httpx ``mounts`` serving ``simulator://`` when ``base_url`` selects it."""
+    if not config.base_url.startswith(f"{SIMULATOR_SCHEME}://"):
+        return {}
+    return {f"{SIMULATOR_SCHEME}://": GraphSimulator(config.simulator).transport()}
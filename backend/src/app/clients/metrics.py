@@ -0,0 +1,183 @@
+"""Client-side metrics of Graph API calls.
+
+Labels are logical endpoints ("campaigns", "insights", ...) and Graph error
+codes, never account, campaign or user ids, to keep series count bounded.
+"""
+
+import time
+from collections.abc import Iterator
+from types import TracebackType
+from typing import Any
+
+import httpx
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.clients.base import HttpClientError, json_loads
+
+# Graph error codes of app, user and ad account level throttling
+# https://developers.facebook.com/docs/graph-api/overview/rate-limiting
+THROTTLING_ERROR_CODES = frozenset({4, 17, 32, 613, *range(80000, 80015)})
+
+# Last path segment -> endpoint label
+GRAPH_ENDPOINTS = {
+    "access_token": "oauth",
+    "adaccounts": "accounts",
+    "campaigns": "campaigns",
+    "adsets": "adsets",
+    "ads": "ads",
+    "insights": "insights",
+}
+
+# Usage header -> label of GRAPH_USAGE
+USAGE_HEADERS = {
+    "x-app-usage": "app",
+    "x-business-use-case-usage": "business_use_case",
+    "x-ad-account-usage": "ad_account",
+}
+USAGE_NON_PERCENT_KEYS = {"estimated_time_to_regain_access", "reset_time_duration"}
+
+GRAPH_REQUEST_DURATION = Histogram(
+    "graph_request_duration_seconds",
+    "Duration of single Graph API requests (one page)",
+    ["endpoint"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 0.75, 1, 1.5, 2.5, 5, 10, 30, 60),
+)
+GRAPH_REQUESTS = Counter(
+    "graph_requests_total",
+    "Graph API requests by HTTP status; 0 when no response was received",
+    ["endpoint", "status"],
+)
+GRAPH_PAGES = Histogram(
+    "graph_pages_per_call",
+    "Pages fetched by one paginated Graph call",
+    ["endpoint"],
+    buckets=(1, 2, 3, 5, 10, 20, 50, 100, 250),
+)
+GRAPH_RESPONSE_BYTES = Histogram(
+    "graph_response_bytes",
+    "Body size of Graph API responses",
+    ["endpoint"],
+    buckets=(1_000, 10_000, 50_000, 100_000, 250_000, 500_000, 1_000_000, 5_000_000),
+)
+GRAPH_ERRORS = Counter(
+    "graph_errors_total",
+    "Failed Graph API requests by Graph error code, or timeout / transport",
+    ["endpoint", "code"],
+)
+GRAPH_RATE_LIMITED = Counter(
+    "graph_rate_limited_total",
+    "Graph API requests rejected by throttling",
+    ["endpoint"],
+)
+GRAPH_USAGE = Gauge(
+    "graph_usage_percent",
+    "Highest utilisation reported by the last Graph usage header of each kind",
+    ["header"],
+    multiprocess_mode="livemax",
+)
+GRAPH_IN_FLIGHT = Gauge(
+    "graph_requests_in_flight",
+    "Graph API requests awaiting a response",
+    ["endpoint"],
+    multiprocess_mode="livesum",
+)
+
+
+def graph_endpoint(url: httpx.URL | str) -> str:
+    segment = httpx.URL(url).path.rstrip("/").rsplit("/", 1)[-1]
+    return GRAPH_ENDPOINTS.get(segment, "other")
+
+
+def _usage_percents(value: Any) -> Iterator[float]:
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key not in USAGE_NON_PERCENT_KEYS:
+                yield from _usage_percents(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _usage_percents(item)
+    elif isinstance(value, int | float) and not isinstance(value, bool):
+        yield float(value)
+
+
+def _error_code(body: Any) -> int | None:
+    if isinstance(body, str | bytes):
+        try:
+            body = json_loads(body)
+        except ValueError:
+            return None
+    if isinstance(body, dict) and isinstance(body.get("error"), dict):
+        return body["error"].get("code")
+    return None
+
+
+def record_usage(headers: httpx.Headers) -> None:
+    for header, label in USAGE_HEADERS.items():
+        raw = headers.get(header)
+        if raw is None:
+            continue
+        try:
+            percents = list(_usage_percents(json_loads(raw)))
+        except ValueError:
+            continue
+        if percents:
+            GRAPH_USAGE.labels(label).set(max(percents))
+
+
+def record_graph_error(endpoint: str, code: int | str | None) -> None:
+    GRAPH_ERRORS.labels(endpoint, str(code)).inc()
+    if code in THROTTLING_ERROR_CODES:
+        GRAPH_RATE_LIMITED.labels(endpoint).inc()
+
+
+class GraphRequestMetrics:
+    """Times one Graph request and records its outcome.
+
+    Use as a context manager around the request and call ``record`` with the
+    response; requests failing without one count as timeout or transport
+    errors.
+    """
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self._started = 0.0
+        self._recorded = False
+
+    def __enter__(self) -> "GraphRequestMetrics":
+        GRAPH_IN_FLIGHT.labels(self.endpoint).inc()
+        self._started = time.perf_counter()
+        return self
+
+    def record(self, response: httpx.Response) -> None:
+        self._recorded = True
+        GRAPH_REQUESTS.labels(self.endpoint, str(response.status_code)).inc()
+        GRAPH_RESPONSE_BYTES.labels(self.endpoint).observe(len(response.content))
+        record_usage(response.headers)
+        if response.is_error:
+            code = _error_code(response.content)
+            record_graph_error(self.endpoint, code or f"http_{response.status_code}")
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        GRAPH_IN_FLIGHT.labels(self.endpoint).dec()
+        GRAPH_REQUEST_DURATION.labels(self.endpoint).observe(
+            time.perf_counter() - self._started
+        )
+        if self._recorded or not isinstance(exc, Exception):
+            return
+        if isinstance(exc, HttpClientError) and exc.status_code is not None:
+            # Raised by HttpClient for error statuses, after the response
+            GRAPH_REQUESTS.labels(self.endpoint, str(exc.status_code)).inc()
+            code = _error_code(exc.response_body)
+            record_graph_error(self.endpoint, code or f"http_{exc.status_code}")
+            return
+        GRAPH_REQUESTS.labels(self.endpoint, "0").inc()
+        cause = exc if isinstance(exc, httpx.HTTPError) else exc.__cause__
+        if isinstance(cause, httpx.TimeoutException):
+            record_graph_error(self.endpoint, "timeout")
+        else:
+            record_graph_error(self.endpoint, "transport")
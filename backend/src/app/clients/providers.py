@@ -7,6 +7,7 @@ from dishka import Provider, Scope, provide
 from app.api.modules.telegram.services.client import TelegramClient
 from app.clients.example_service import ExampleServiceClient
 from app.clients.facebook import FacebookClient
+from app.clients.graph_simulator import graph_mounts
 from app.settings import Config
 
 HTTP2_AVAILABLE = find_spec("h2") is not None
@@ -14,12 +15,15 @@ HTTP2_AVAILABLE = find_spec("h2") is not None
 
 class HttpClientsProvider(Provider):
     @provide(scope=Scope.APP)
-    async def get_httpx_client(self) -> AsyncIterator[httpx.AsyncClient]:
+    async def get_httpx_client(
+        self, config: Config
+    ) -> AsyncIterator[httpx.AsyncClient]:
         async with httpx.AsyncClient(
             timeout=httpx.Timeout(30.0),
             limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
             http2=HTTP2_AVAILABLE,
             follow_redirects=True,
+            mounts=graph_mounts(config.facebook),
         ) as client:
             yield client
 
@@ -1,9 +1,48 @@
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
-from app.settings import get_config
+from app.database.instrumentation import instrument_engine
+from app.database.pool import InstrumentedAsyncQueuePool
+from app.settings import PostgresConfig, get_config
+
+
+def get_engine_options(database_url: str, postgres: PostgresConfig) -> dict[str, Any]:
+    if make_url(database_url).get_backend_name() != "postgresql":
+        return {}
+
+    connect_args: dict[str, Any] = {
+        "statement_cache_size": postgres.statement_cache_size,
+        "prepared_statement_cache_size": postgres.prepared_statement_cache_size,
+    }
+    if postgres.pool_mode == "transaction":
+        connect_args.update(
+            statement_cache_size=0,
+            prepared_statement_cache_size=0,
+            # Unnamed statements can clash between clients sharing a backend
+            prepared_statement_name_func=lambda: f"__asyncpg_{uuid4()}__",
+        )
+
+    return {
+        "poolclass": InstrumentedAsyncQueuePool,
+        "pool_size": postgres.pool_size,
+        "max_overflow": postgres.max_overflow,
+        "pool_timeout": postgres.pool_timeout,
+        "pool_recycle": postgres.pool_recycle,
+        "pool_pre_ping": postgres.pool_pre_ping,
+        "connect_args": connect_args,
+    }
+
 
 config = get_config()
-engine = create_async_engine(config.database_url, echo=False)
+engine = create_async_engine(
+    config.database_url,
+    echo=False,
+    **get_engine_options(config.database_url, config.postgres),
+)
+instrument_engine(engine.sync_engine)
 
 SessionFactory = async_sessionmaker(
     bind=engine,
@@ -0,0 +1,189 @@
+import logging
+import re
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Any
+
+from prometheus_client import Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExceptionContext
+from sqlalchemy.engine.interfaces import DBAPICursor, ExecutionContext
+
+from app.services.logging import Lazy
+from app.services.tracing import start_span
+
+logger = logging.getLogger(__name__)
+
+# Bulk inserts can render very long statements; the head identifies the query
+MAX_STATEMENT_LENGTH = 1000
+
+_STARTED_ATTR = "_query_started"
+_SPAN_ATTR = "_trace_span"
+_WHITESPACE = re.compile(r"\s+")
+
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Duration of SQL statements by operation: SELECT, INSERT, ...",
+    ["operation"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 10),
+)
+DB_QUERIES_PER_HANDLER = Histogram(
+    "db_queries_per_handler",
+    "SQL statements run by one request (by route) or task (by name)",
+    ["handler"],
+    buckets=(0, 1, 2, 3, 4, 6, 8, 12, 16, 25, 50, 100, 250, 1000),
+)
+DB_TIME_PER_HANDLER = Histogram(
+    "db_time_per_handler_seconds",
+    "Time one request or task spent in SQL statements",
+    ["handler"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 10, 60),
+)
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """Statements run while tracking, including by tasks spawned meanwhile."""
+
+    count: int = 0
+    duration: float = 0.0
+    slowest_duration: float = 0.0
+    slowest_statement: str | None = None
+    # Outer tracking, e.g. a test around a request, sees the same statements
+    parent: "QueryStats | None" = None
+
+    def record(self, statement: str, duration: float) -> None:
+        stats: QueryStats | None = self
+        while stats is not None:
+            stats.count += 1
+            stats.duration += duration
+            if duration >= stats.slowest_duration:
+                stats.slowest_duration = duration
+                stats.slowest_statement = statement
+            stats = stats.parent
+
+    def summary(self) -> str:
+        text = f"{self.count} queries in {self.duration * 1000:.1f} ms"
+        if self.slowest_statement is None:
+            return text
+        return (
+            f"{text}, slowest {self.slowest_duration * 1000:.1f} ms: "
+            f"{compact_statement(self.slowest_statement)}"
+        )
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def compact_statement(statement: str, limit: int = 200) -> str:
+    """Single-line head of ``statement``, for logs and headers."""
+    return _WHITESPACE.sub(" ", statement).strip()[:limit]
+
+
+def start_tracking() -> tuple[QueryStats, Token[QueryStats | None]]:
+    """Count statements of the current context until ``stop_tracking``."""
+    stats = QueryStats(parent=_query_stats.get())
+    return stats, _query_stats.set(stats)
+
+
+def stop_tracking(token: Token[QueryStats | None]) -> None:
+    _query_stats.reset(token)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    stats, token = start_tracking()
+    try:
+        yield stats
+    finally:
+        stop_tracking(token)
+
+
+def record_handler_stats(handler: str, stats: QueryStats) -> None:
+    DB_QUERIES_PER_HANDLER.labels(handler).observe(stats.count)
+    DB_TIME_PER_HANDLER.labels(handler).observe(stats.duration)
+    if stats.count:
+        logger.debug("%s: %s", handler, Lazy(stats.summary))
+
+
+def _operation(statement: str) -> str:
+    return statement.lstrip().split(None, 1)[0].upper() if statement else ""
+
+
+def _finish(context: ExecutionContext | None, statement: str) -> None:
+    started = getattr(context, _STARTED_ATTR, None)
+    if started is None:
+        return
+    setattr(context, _STARTED_ATTR, None)
+    duration = time.perf_counter() - started
+    DB_QUERY_DURATION.labels(_operation(statement)).observe(duration)
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.record(statement, duration)
+
+
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: DBAPICursor,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext | None,
+    executemany: bool,
+) -> None:
+    if context is None:
+        return
+    setattr(context, _STARTED_ATTR, time.perf_counter())
+    operation = _operation(statement)
+    query_span = start_span(
+        f"db {operation}".rstrip(),
+        "client",
+        {
+            "db.system": conn.dialect.name,
+            "db.operation.name": operation,
+            "db.query.text": statement[:MAX_STATEMENT_LENGTH],
+        },
+    )
+    if query_span is not None:
+        setattr(context, _SPAN_ATTR, query_span)
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: DBAPICursor,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext | None,
+    executemany: bool,
+) -> None:
+    _finish(context, statement)
+    query_span = getattr(context, _SPAN_ATTR, None)
+    if query_span is not None:
+        query_span.set_attribute("db.response.returned_rows", cursor.rowcount)
+        query_span.end()
+        setattr(context, _SPAN_ATTR, None)
+
+
+def _handle_error(exception_context: ExceptionContext) -> None:
+    context = exception_context.execution_context
+    _finish(context, exception_context.statement or "")
+    query_span = getattr(context, _SPAN_ATTR, None)
+    if query_span is not None:
+        query_span.record_error(exception_context.original_exception)
+        query_span.end()
+        setattr(context, _SPAN_ATTR, None)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Time and trace every statement of ``engine`` (``sync_engine`` if async).
+
+    Gateways run their queries through the engine, so this covers them all
+    without touching each method. Cursor events fire in the task awaiting the
+    query, where the span and ``track_queries`` stats of the request or task
+    are current.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -0,0 +1,54 @@
+"""add_telegram_partial_indexes
+
+Revision ID: tg0004
+Revises: loc001
+Create Date: 2026-02-20 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "tg0004"
+down_revision: str | None = "loc001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Daily broadcast recipients; covers the columns the recipients query reads
+    op.create_index(
+        "users_telegram_daily_recipients_idx",
+        "users",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text(
+            "telegram_chat_id IS NOT NULL"
+            " AND is_active IS true"
+            " AND telegram_daily_enabled IS true"
+        ),
+        postgresql_include=[
+            "telegram_chat_id",
+            "locale",
+            "is_admin",
+            "ad_account_id",
+            "created_by_id",
+        ],
+    )
+
+    # Bot /start lookup by registration token
+    op.create_index(
+        "users_telegram_token_idx",
+        "users",
+        ["telegram_token"],
+        unique=True,
+        postgresql_where=sa.text("telegram_token IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("users_telegram_token_idx", table_name="users")
+    op.drop_index("users_telegram_daily_recipients_idx", table_name="users")
@@ -0,0 +1,34 @@
+"""add_username_trgm_index
+
+Revision ID: usr001
+Revises: tg0004
+Create Date: 2026-02-21 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "usr001"
+down_revision: str | None = "tg0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Serves username ILIKE '%...%' (users username__search filter)
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "users_username_trgm_idx",
+        "users",
+        ["username"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"username": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("users_username_trgm_idx", table_name="users")
@@ -0,0 +1,29 @@
+"""make_username_unique
+
+Revision ID: usr002
+Revises: usr001
+Create Date: 2026-02-22 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "usr002"
+down_revision: str | None = "usr001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Fails on duplicate usernames, e.g. "admin" seeded by concurrent API
+    # workers; delete the extra rows first
+    op.drop_index(op.f("users_username_idx"), table_name="users")
+    op.create_index(op.f("users_username_idx"), "users", ["username"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("users_username_idx"), table_name="users")
+    op.create_index(op.f("users_username_idx"), "users", ["username"], unique=False)
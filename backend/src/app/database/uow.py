@@ -1,3 +1,5 @@
+from collections.abc import Callable
+from functools import cached_property
 from typing import Self
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,35 +10,70 @@ from app.api.modules.users.gateway import UserGateway
 
 
 class UnitOfWork:
-    users: UserGateway
-    facebook_auth: FacebookAuthGateway
-    telegram: TelegramGateway
+    """Gateways over one session.
 
-    def __init__(self, session: AsyncSession):
-        self.session = session
-        self.users = UserGateway(session)
-        self.facebook_auth = FacebookAuthGateway(session)
-        self.telegram = TelegramGateway(session)
+    With ``session_factory`` the session (and therefore a pooled connection)
+    is only created when a gateway or ``session`` is first used; commit and
+    rollback are no-ops until then.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession | None = None,
+        session_factory: Callable[[], AsyncSession] | None = None,
+    ):
+        if session is None and session_factory is None:
+            raise ValueError("Either session or session_factory is required")
+        self._session = session
+        self._session_factory = session_factory
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    @property
+    def is_active(self) -> bool:
+        return self._session is not None
+
+    @cached_property
+    def users(self) -> UserGateway:
+        return UserGateway(self.session)
+
+    @cached_property
+    def facebook_auth(self) -> FacebookAuthGateway:
+        return FacebookAuthGateway(self.session)
+
+    @cached_property
+    def telegram(self) -> TelegramGateway:
+        return TelegramGateway(self.session)
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if not self.is_active:
+            return
         if exc_type is not None:
             await self.rollback()
         await self.session.close()
 
     async def commit(self: Self):
-        await self.session.commit()
+        if self.is_active:
+            await self.session.commit()
 
     async def flush(self: Self):
-        await self.session.flush()
+        if self.is_active:
+            await self.session.flush()
 
     async def refresh(self: Self, instance: object):
         await self.session.refresh(instance)
 
     async def rollback(self: Self):
-        await self.session.rollback()
+        if self.is_active:
+            await self.session.rollback()
 
     async def close(self: Self):
-        await self.session.close()
+        if self.is_active:
+            await self.session.close()
@@ -2,13 +2,15 @@ from collections.abc import AsyncIterator
 
 from aiogram import Bot
 from dishka import AsyncContainer, Provider, Scope, make_async_container, provide
-from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
 
 from app.api.modules.auth.service import AuthService
 from app.api.modules.auth.services import JwtService
 from app.api.modules.facebook.service import FacebookService
 from app.api.modules.facebook.services import FacebookSDKService
 from app.api.modules.telegram.service import TelegramService
+from app.api.modules.telegram.services import TelegramBotService, create_bot
+from app.api.modules.telegram.services.webhook import TelegramWebhookService
 from app.api.modules.users.service import UserService
 from app.clients.facebook import FacebookClient
 from app.clients.providers import HttpClientsProvider
@@ -24,16 +26,25 @@ class AppProvider(Provider):
 
     @provide(scope=Scope.APP)
     def get_bot(self, config: Config) -> Bot:
-        return Bot(token=config.telegram.bot_token)
+        return create_bot(config.telegram)
 
-    @provide(scope=Scope.REQUEST)
-    async def get_session(self) -> AsyncIterator[AsyncSession]:
-        async with SessionFactory() as session:
-            yield session
+    @provide(scope=Scope.APP)
+    async def get_redis(self, config: Config) -> AsyncIterator[Redis]:
+        redis = Redis.from_url(config.redis_url)
+        yield redis
+        await redis.aclose()
+
+    @provide(scope=Scope.APP)
+    async def get_telegram_bot_service(
+        self, config: Config
+    ) -> AsyncIterator[TelegramBotService]:
+        bot_service = TelegramBotService(config.telegram)
+        yield bot_service
+        await bot_service.close()
 
     @provide(scope=Scope.REQUEST)
-    async def get_uow(self, session: AsyncSession) -> AsyncIterator[UnitOfWork]:
-        async with UnitOfWork(session) as uow:
+    async def get_uow(self) -> AsyncIterator[UnitOfWork]:
+        async with UnitOfWork(session_factory=SessionFactory) as uow:
             yield uow
 
 
@@ -70,6 +81,12 @@ class ServicesProvider(Provider):
     ) -> TelegramService:
         return TelegramService(uow, config.telegram, bot, fb_client)
 
+    @provide(scope=Scope.REQUEST)
+    def get_telegram_webhook_service(
+        self, config: Config, bot_service: TelegramBotService, redis: Redis
+    ) -> TelegramWebhookService:
+        return TelegramWebhookService(config.telegram, bot_service, redis)
+
 
 def get_async_container() -> AsyncContainer:
     return make_async_container(
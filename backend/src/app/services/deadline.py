@@ -0,0 +1,110 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Iterator
+from contextlib import aclosing, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(TimeoutError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class Deadline:
+    expires_at: float
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        return cls(time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+
+_current: ContextVar[Deadline | None] = ContextVar("deadline", default=None)
+
+
+def current_deadline() -> Deadline | None:
+    return _current.get()
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[Deadline]:
+    """Bound the work done in this context, including tasks it spawns.
+
+    An enclosing deadline that expires sooner is kept.
+    """
+    outer = _current.get()
+    scoped = Deadline.after(seconds)
+    if outer is not None and outer.expires_at < scoped.expires_at:
+        scoped = outer
+    token = _current.set(scoped)
+    try:
+        yield scoped
+    finally:
+        _current.reset(token)
+
+
+def timeout_for(default: float) -> float:
+    """Per-call timeout: ``default`` capped by the remaining deadline budget."""
+    current = _current.get()
+    if current is None:
+        return default
+    remaining = current.remaining()
+    if remaining <= 0:
+        raise DeadlineExceeded("Request deadline exceeded")
+    return min(default, remaining)
+
+
+async def iterate_within(
+    items: AsyncIterator[T], bound: Deadline | None
+) -> AsyncIterator[T]:
+    """Iterate ``items`` under ``bound`` from any context.
+
+    A streamed response body is consumed after the endpoint returned, outside
+    the request's deadline context; each step runs under the deadline again
+    and is cancelled once it passes.
+    """
+    async with aclosing(items):
+        while True:
+            if bound is None:
+                try:
+                    item = await anext(items)
+                except StopAsyncIteration:
+                    return
+                yield item
+                continue
+
+            remaining = bound.remaining()
+            if remaining <= 0:
+                raise DeadlineExceeded("Request deadline exceeded")
+            token = _current.set(bound)
+            try:
+                async with asyncio.timeout(remaining):
+                    item = await anext(items)
+            except StopAsyncIteration:
+                return
+            except TimeoutError as e:
+                raise DeadlineExceeded("Request deadline exceeded") from e
+            finally:
+                _current.reset(token)
+            yield item
+
+
+async def gather_cancelling(*aws: Awaitable[Any]) -> list[Any]:
+    """``asyncio.gather`` that cancels the remaining awaitables on failure.
+
+    Plain gather leaves siblings running when one of them raises, which for
+    Graph fan-outs keeps spending rate-limit budget on a failed request.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
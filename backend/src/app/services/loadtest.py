@@ -0,0 +1,361 @@
+"""Closed-loop HTTP load generator behind `cli loadtest`.
+
+``concurrency`` virtual users repeatedly pick an action from the configured
+mix (login, users pages, ad accounts, campaign drill-downs, snapshots,
+broadcast triggers) until the duration is over. Latency is recorded per
+route template, so ``/adsets/1/ads`` and ``/adsets/2/ads`` aggregate.
+
+Each run logs in as a user of its own, created by ``create_loadtest_user``
+and removed by ``delete_loadtest_user``, so no existing account is touched.
+"""
+
+import asyncio
+import math
+import random
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any
+from uuid import UUID, uuid4
+
+import bcrypt
+import httpx
+
+from app.api.modules.users.models import User
+from app.database.uow import UnitOfWork
+from app.settings import LoadTestConfig, RouteSLO
+
+# Below any real chat id, so broadcasts to the load-test user go nowhere
+LOADTEST_CHAT_ID_BASE = -(10**12)
+
+
+class LoadTestSetupError(Exception):
+    pass
+
+
+async def create_loadtest_user(uow: UnitOfWork, password: str) -> User:
+    """A new admin with a random ``loadtest_`` username, for one run."""
+    suffix = uuid4()
+    hashed_password = bcrypt.hashpw(
+        password.encode("utf-8"), bcrypt.gensalt(rounds=12)
+    ).decode("utf-8")
+    user = await uow.users.create(
+        User(
+            username=f"loadtest_{suffix.hex[:12]}",
+            password=hashed_password,
+            is_active=True,
+            is_admin=True,
+            # Broadcasts need a connected chat; daily reports must skip it
+            telegram_chat_id=LOADTEST_CHAT_ID_BASE - suffix.int % 10**9,
+            telegram_daily_enabled=False,
+        )
+    )
+    await uow.commit()
+    return user
+
+
+async def delete_loadtest_user(uow: UnitOfWork, user_id: UUID) -> None:
+    """Remove a user made by ``create_loadtest_user`` and its Facebook link."""
+    await uow.facebook_auth.delete_by_owner(user_id)
+    await uow.users.delete(user_id)
+    await uow.commit()
+
+
+@dataclass
+class RouteStats:
+    latencies: list[float] = field(default_factory=list)
+    statuses: Counter[int] = field(default_factory=Counter)
+    errors: int = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.latencies)
+
+    def percentile(self, q: float) -> float:
+        """Nearest-rank percentile in milliseconds."""
+        ordered = sorted(self.latencies)
+        rank = max(1, math.ceil(q / 100 * len(ordered)))
+        return ordered[rank - 1] * 1000
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.count if self.count else 0.0
+
+
+@dataclass
+class RouteResult:
+    route: str
+    count: int
+    rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    error_rate: float
+    slo: RouteSLO
+    statuses: dict[int, int]
+
+    @property
+    def violations(self) -> list[str]:
+        found = []
+        if self.p95_ms > self.slo.p95_ms:
+            found.append(f"p95 {self.p95_ms:.0f} ms > {self.slo.p95_ms:.0f} ms")
+        if self.p99_ms > self.slo.p99_ms:
+            found.append(f"p99 {self.p99_ms:.0f} ms > {self.slo.p99_ms:.0f} ms")
+        if self.error_rate > self.slo.max_error_rate:
+            found.append(
+                f"errors {self.error_rate:.2%} > {self.slo.max_error_rate:.2%}"
+            )
+        return found
+
+
+@dataclass
+class LoadTestReport:
+    duration: float
+    concurrency: int
+    routes: list[RouteResult]
+
+    @property
+    def total_requests(self) -> int:
+        return sum(r.count for r in self.routes)
+
+    @property
+    def throughput(self) -> float:
+        return self.total_requests / self.duration if self.duration else 0.0
+
+    @property
+    def passed(self) -> bool:
+        return not any(r.violations for r in self.routes)
+
+    def format(self) -> str:
+        width = max([len("route"), *(len(r.route) for r in self.routes)])
+        header = (
+            f"{'route':<{width}} {'count':>6} {'rps':>7} {'p50':>7} {'p95':>7} "
+            f"{'p99':>7} {'errors':>7}  SLO"
+        )
+        lines = [header, "-" * len(header)]
+        for r in self.routes:
+            verdict = "; ".join(r.violations) or "ok"
+            lines.append(
+                f"{r.route:<{width}} {r.count:>6} {r.rps:>7.1f} {r.p50_ms:>7.0f} "
+                f"{r.p95_ms:>7.0f} {r.p99_ms:>7.0f} {r.error_rate:>7.2%}  {verdict}"
+            )
+        lines.append("-" * len(header))
+        lines.append(
+            f"{self.total_requests} requests in {self.duration:.1f}s, "
+            f"{self.throughput:.1f} req/s with {self.concurrency} virtual users"
+        )
+        return "\n".join(lines)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "duration": self.duration,
+            "concurrency": self.concurrency,
+            "throughput": self.throughput,
+            "passed": self.passed,
+            "routes": [
+                {
+                    "route": r.route,
+                    "count": r.count,
+                    "rps": r.rps,
+                    "p50_ms": r.p50_ms,
+                    "p95_ms": r.p95_ms,
+                    "p99_ms": r.p99_ms,
+                    "error_rate": r.error_rate,
+                    "statuses": r.statuses,
+                    "violations": r.violations,
+                }
+                for r in self.routes
+            ],
+        }
+
+
+class LoadTest:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        config: LoadTestConfig,
+        username: str,
+        password: str,
+        seed: int | None = None,
+    ):
+        self.client = client
+        self.config = config
+        self.username = username
+        self.password = password
+        self._rng = random.Random(seed)
+        self._headers: dict[str, str] = {}
+        self._account_ids: list[str] = []
+        self._campaign_ids: dict[str, list[str]] = {}
+        self.stats: dict[str, RouteStats] = {}
+        until = date.today() - timedelta(days=1)
+        self._dates = {
+            "since": (until - timedelta(days=29)).isoformat(),
+            "until": until.isoformat(),
+        }
+        self._actions: dict[str, Callable[[], Awaitable[None]]] = {
+            "login": self.login,
+            "users": self.list_users,
+            "ad_accounts": self.list_ad_accounts,
+            "campaigns": self.list_campaigns,
+            "drilldown": self.drill_down,
+            "snapshot": self.snapshot,
+            "broadcast": self.broadcast,
+        }
+        unknown = set(config.mix) - set(self._actions)
+        if unknown:
+            raise LoadTestSetupError(f"Unknown actions in mix: {sorted(unknown)}")
+
+    async def _request(
+        self, route: str, method: str, url: str, **kwargs: Any
+    ) -> httpx.Response | None:
+        stats = self.stats.setdefault(route, RouteStats())
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(
+                method, url, headers=self._headers, **kwargs
+            )
+        except httpx.HTTPError:
+            stats.latencies.append(time.perf_counter() - started)
+            stats.statuses[0] += 1
+            stats.errors += 1
+            return None
+        stats.latencies.append(time.perf_counter() - started)
+        stats.statuses[response.status_code] += 1
+        if response.status_code >= 400:
+            stats.errors += 1
+            return None
+        return response
+
+    async def setup(self) -> None:
+        """Log in, link the simulated Facebook account and learn entity ids."""
+        await self.login()
+        if not self._headers:
+            raise LoadTestSetupError(f"Login as {self.username!r} failed")
+        linked = await self._request(
+            "POST /facebook/auth/exchange-token",
+            "POST",
+            "/facebook/auth/exchange-token",
+            json={"short_lived_token": "loadtest"},
+        )
+        if linked is None:
+            raise LoadTestSetupError("Linking the Facebook account failed")
+        await self.list_ad_accounts()
+        if not self._account_ids:
+            raise LoadTestSetupError("No ad accounts returned")
+        for account_id in self._account_ids:
+            await self.list_campaigns(account_id)
+        self.stats.clear()
+
+    async def login(self) -> None:
+        response = await self._request(
+            "POST /auth/login",
+            "POST",
+            "/auth/login",
+            json={"username": self.username, "password": self.password},
+        )
+        if response is not None:
+            token = response.json()["access_token"]
+            self._headers = {"Authorization": f"Bearer {token}"}
+
+    async def list_users(self) -> None:
+        params: dict[str, Any] = {"page_size": 20}
+        # Mostly first pages, sometimes deeper keyset pages
+        for _ in range(self._rng.choice((1, 1, 1, 3))):
+            response = await self._request("GET /users", "GET", "/users", params=params)
+            if response is None or not response.json().get("next_cursor"):
+                return
+            params["cursor"] = response.json()["next_cursor"]
+
+    async def list_ad_accounts(self) -> None:
+        response = await self._request(
+            "GET /facebook/ad-accounts", "GET", "/facebook/ad-accounts"
+        )
+        if response is not None:
+            self._account_ids = [a["account_id"] for a in response.json()]
+
+    async def list_campaigns(self, account_id: str | None = None) -> list[str]:
+        account_id = account_id or self._rng.choice(self._account_ids)
+        response = await self._request(
+            "GET /facebook/ad-accounts/{account_id}/campaigns",
+            "GET",
+            f"/facebook/ad-accounts/{account_id}/campaigns",
+            params=self._dates,
+        )
+        if response is None:
+            return []
+        ids = [c["campaign_id"] for c in response.json()]
+        self._campaign_ids[account_id] = ids
+        return ids
+
+    async def drill_down(self) -> None:
+        account_id = self._rng.choice(self._account_ids)
+        campaign_ids = self._campaign_ids.get(account_id)
+        if not campaign_ids:
+            return
+        response = await self._request(
+            "GET /facebook/ad-accounts/{account_id}/campaigns/{campaign_id}/adsets",
+            "GET",
+            f"/facebook/ad-accounts/{account_id}/campaigns/"
+            f"{self._rng.choice(campaign_ids)}/adsets",
+            params=self._dates,
+        )
+        if response is None or not response.json():
+            return
+        adset_id = self._rng.choice(response.json())["adset_id"]
+        await self._request(
+            "GET /facebook/adsets/{adset_id}/ads",
+            "GET",
+            f"/facebook/adsets/{adset_id}/ads",
+            params=self._dates,
+        )
+
+    async def snapshot(self) -> None:
+        await self._request(
+            "GET /facebook/ad-accounts/{account_id}/snapshot",
+            "GET",
+            f"/facebook/ad-accounts/{self._rng.choice(self._account_ids)}/snapshot",
+            params=self._dates,
+        )
+
+    async def broadcast(self) -> None:
+        await self._request(
+            "POST /telegram/broadcast",
+            "POST",
+            "/telegram/broadcast",
+            json={"period": "yesterday", "locale": "ua"},
+        )
+
+    async def _virtual_user(self, deadline: float) -> None:
+        names = list(self.config.mix)
+        weights = list(self.config.mix.values())
+        while time.monotonic() < deadline:
+            action = self._rng.choices(names, weights)[0]
+            await self._actions[action]()
+
+    async def run(self, duration: float, concurrency: int) -> LoadTestReport:
+        started = time.monotonic()
+        deadline = started + duration
+        await asyncio.gather(
+            *(self._virtual_user(deadline) for _ in range(concurrency))
+        )
+        return self.report(time.monotonic() - started, concurrency)
+
+    def report(self, elapsed: float, concurrency: int) -> LoadTestReport:
+        routes = [
+            RouteResult(
+                route=route,
+                count=stats.count,
+                rps=stats.count / elapsed,
+                p50_ms=stats.percentile(50),
+                p95_ms=stats.percentile(95),
+                p99_ms=stats.percentile(99),
+                error_rate=stats.error_rate,
+                slo=self.config.slos.get(route, self.config.default_slo),
+                statuses=dict(stats.statuses),
+            )
+            for route, stats in sorted(self.stats.items())
+            if stats.count
+        ]
+        return LoadTestReport(duration=elapsed, concurrency=concurrency, routes=routes)
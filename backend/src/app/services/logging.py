@@ -1,20 +1,249 @@
+"""Process-wide logging that keeps formatting and I/O off the event loop.
+
+Records go to an in-memory queue; a listener thread formats them, as JSON
+lines for Loki or as text, redacts credentials and writes to stderr. A full
+queue drops records instead of blocking the loop.
+
+Arguments are formatted in the listener thread, after the call returns: log
+immutable values, and wrap expensive ones in ``Lazy`` so they are computed
+there, and only for records that are emitted.
+"""
+
+import atexit
+import json
 import logging
-from typing import Literal
+import queue
+import random
+import re
+import sys
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Literal
+
+from prometheus_client import Counter
+
+from app.services.tracing import current_span
+from app.settings import LoggingConfig
 
 LOG_FORMAT_DEBUG = (
     "[%(levelname)7s]: %(name)s - %(message)s --- %(pathname)s:%(lineno)d"
 )
 LOG_FORMAT_PROD = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+# Loggers writing a record per request or per outgoing call, and the level up
+# to which their records are sampled
+HOT_PATH_LOGGERS = {
+    "app.clients.base": logging.DEBUG,
+    "httpx": logging.INFO,
+    "httpcore": logging.DEBUG,
+}
+
+# Query parameters, JSON and repr() keys, Bearer headers and Bot API URLs
+_SECRET_KEY = r"[\w-]*(?:token|secret|password|appsecret_proof)[\w-]*"
+_REDACTIONS = [
+    (
+        re.compile(
+            rf"(?i)\b({_SECRET_KEY})((?:\\?[\"'])?\s*[:=]\s*(?:\\?[\"'])?)"
+            r"([^\"'&\s,;}\\]+)"
+        ),
+        r"\1\2[REDACTED]",
+    ),
+    (re.compile(r"(?i)\b(Bearer\s+)[\w.~+/-]+=*"), r"\1[REDACTED]"),
+    (re.compile(r"/bot\d+:[\w-]+"), "/bot[REDACTED]"),
+]
+
+# Attributes every LogRecord has; anything else was passed in ``extra``
+_RECORD_ATTRS = frozenset(
+    [*logging.LogRecord("", 0, "", 0, "", None, None).__dict__, "message", "asctime"]
+)
+
+LOG_RECORDS_DROPPED = Counter(
+    "log_records_dropped_total",
+    "Log records dropped because the logging queue was full",
+)
+
+
+def redact(text: str) -> str:
+    for pattern, replacement in _REDACTIONS:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+class Lazy:
+    """Log argument computed by the listener, only if the record is emitted."""
+
+    __slots__ = ("func",)
+
+    def __init__(self, func: Callable[[], Any]):
+        self.func = func
+
+    def __str__(self) -> str:
+        return str(self.func())
+
+    __repr__ = __str__
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, with ``extra`` fields and trace ids."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        # Fields passed in ``extra``, trace ids among them
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class RedactingFormatter(logging.Formatter):
+    def __init__(self, formatter: logging.Formatter):
+        super().__init__()
+        self.formatter = formatter
+
+    def format(self, record: logging.LogRecord) -> str:
+        return redact(self.formatter.format(record))
+
+
+class HotPathSampler(logging.Filter):
+    """Keeps a share of the chatty records of ``loggers`` and their children.
+
+    A request, task or update wrapped in ``sample_logs`` keeps or drops its
+    records together; records outside one are drawn one by one. Records of a
+    sampled trace are all kept, so a traced request keeps its whole story.
+    """
+
+    def __init__(self, ratio: float, loggers: dict[str, int]):
+        super().__init__()
+        self.ratio = ratio
+        self.loggers = loggers
 
-def setup_logging(env: Literal["local", "dev", "prod"]) -> None:
-    if env in ("local", "dev"):
-        logging.basicConfig(level=logging.DEBUG, format=LOG_FORMAT_DEBUG)
-        logging.info("Logging is set to DEBUG level")
+    def _max_level(self, name: str) -> int | None:
+        while True:
+            level = self.loggers.get(name)
+            if level is not None or "." not in name:
+                return level
+            name = name.rpartition(".")[0]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        max_level = self._max_level(record.name)
+        if max_level is None or record.levelno > max_level:
+            return True
+        if current_span() is not None:
+            return True
+        draw = _log_sample.get()
+        return (random.random() if draw is None else draw) < self.ratio
+
+
+_log_sample: ContextVar[float | None] = ContextVar("log_sample", default=None)
+
+
+def start_log_sample() -> Token[float | None]:
+    """Draw the hot-path sample once for the current context, until reset."""
+    return _log_sample.set(random.random())
+
+
+def stop_log_sample(token: Token[float | None]) -> None:
+    _log_sample.reset(token)
+
+
+@contextmanager
+def sample_logs() -> Iterator[None]:
+    token = start_log_sample()
+    try:
+        yield
+    finally:
+        stop_log_sample(token)
+
+
+class _StderrHandler(logging.StreamHandler):
+    """Writes to the current ``sys.stderr``, even if replaced later."""
+
+    def __init__(self) -> None:
+        logging.Handler.__init__(self)
+
+    @property  # type: ignore[override]
+    def stream(self) -> Any:
+        return sys.stderr
+
+
+class AsyncQueueHandler(QueueHandler):
+    """Hands records to the listener as they are, without formatting them.
+
+    Trace ids are read here, since the listener thread has no trace context.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        span = current_span()
+        if span is not None:
+            record.trace_id = span.trace_id
+            record.span_id = span.span_id
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.inc()
+
+
+_listener: QueueListener | None = None
+
+
+def setup_logging(
+    env: Literal["local", "dev", "prod"], config: LoggingConfig = LoggingConfig()
+) -> None:
+    """Route all records through the queue, replacing the root handlers.
+
+    Later calls change nothing.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    debug = env in ("local", "dev")
+    level = config.level or ("DEBUG" if debug else "INFO")
+    log_format = config.format or ("text" if env == "local" else "json")
+    if log_format == "json":
+        formatter: logging.Formatter = JsonFormatter()
     else:
-        logging.basicConfig(level=logging.INFO, format=LOG_FORMAT_PROD)
-        logging.info("Logging is set to INFO level")
+        formatter = logging.Formatter(LOG_FORMAT_DEBUG if debug else LOG_FORMAT_PROD)
+
+    stream = _StderrHandler()
+    stream.setFormatter(RedactingFormatter(formatter))
+    records: queue.Queue[logging.LogRecord] = queue.Queue(config.queue_size)
+    _listener = QueueListener(records, stream, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    handler = AsyncQueueHandler(records)
+    handler.addFilter(HotPathSampler(config.debug_sample_ratio, HOT_PATH_LOGGERS))
+    root = logging.getLogger()
+    # Handlers added earlier, e.g. by the basicConfig of taskiq's CLI, would
+    # write every record again, from the loop and unredacted
+    for previous in root.handlers[:]:
+        root.removeHandler(previous)
+    root.addHandler(handler)
+    root.setLevel(level)
+
+    # Uvicorn's own handlers write to stderr from the loop
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers.clear()
+        uvicorn_logger.propagate = True
 
     logging.getLogger("aiogram").setLevel(logging.INFO)
     logging.getLogger("aiogram_dialog").setLevel(logging.INFO)
     logging.getLogger("telethon").setLevel(logging.WARNING)
+    logging.info("Logging is set to %s level, %s format", level, log_format)
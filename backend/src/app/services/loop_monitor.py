@@ -0,0 +1,101 @@
+"""Event loop lag, exported as a histogram.
+
+A heartbeat coroutine sleeps ``interval`` seconds and records how late it
+wakes up: the time callbacks running meanwhile kept the loop busy. With
+DEBUG logging a watchdog thread also logs where the loop is stuck whenever
+it has not ticked for ``blocking_threshold`` seconds, while the blocking
+callback still runs.
+"""
+
+import asyncio
+import contextlib
+import logging
+import sys
+import threading
+import time
+import traceback
+
+from prometheus_client import Histogram
+
+logger = logging.getLogger(__name__)
+
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "Delay of event loop heartbeats past their scheduled time",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+
+class LoopMonitor:
+    def __init__(self, interval: float, blocking_threshold: float):
+        self.interval = interval
+        self.blocking_threshold = blocking_threshold
+        self._heartbeat: asyncio.Task[None] | None = None
+        self._tick: asyncio.TimerHandle | None = None
+        self._last_tick = 0.0
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        """Monitor the running event loop; call from its thread."""
+        if self._heartbeat is not None:
+            return
+        loop = asyncio.get_running_loop()
+        self._heartbeat = loop.create_task(self._measure_lag(loop))
+        if logger.isEnabledFor(logging.DEBUG):
+            self._stopped.clear()
+            self._schedule_tick(loop)
+            self._watchdog = threading.Thread(
+                target=self._watch,
+                args=(threading.get_ident(),),
+                name="loop-watchdog",
+                daemon=True,
+            )
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        if self._heartbeat is None:
+            return
+        self._heartbeat.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._heartbeat
+        self._heartbeat = None
+        if self._tick is not None:
+            self._tick.cancel()
+            self._tick = None
+        if self._watchdog is not None:
+            self._stopped.set()
+            self._watchdog.join()
+            self._watchdog = None
+
+    async def _measure_lag(self, loop: asyncio.AbstractEventLoop) -> None:
+        while True:
+            scheduled = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            EVENT_LOOP_LAG.observe(max(loop.time() - scheduled, 0))
+
+    def _schedule_tick(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Ticks well within the threshold, so only a blocked loop misses it
+        self._last_tick = time.monotonic()
+        self._tick = loop.call_later(
+            self.blocking_threshold / 4, self._schedule_tick, loop
+        )
+
+    def _watch(self, loop_ident: int) -> None:
+        reported = False
+        while not self._stopped.wait(self.blocking_threshold / 4):
+            blocked = time.monotonic() - self._last_tick
+            if blocked < self.blocking_threshold:
+                reported = False
+                continue
+            if reported:
+                continue
+            reported = True
+            frame = sys._current_frames().get(loop_ident)
+            if frame is None:
+                continue
+            logger.warning(
+                "Event loop blocked for %.0f ms so far in:\n%s",
+                blocked * 1000,
+                "".join(traceback.format_stack(frame)),
+            )
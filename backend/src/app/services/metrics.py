@@ -0,0 +1,16 @@
+from prometheus_client import start_http_server
+
+
+def start_metrics_server(port: int, attempts: int, addr: str = "0.0.0.0") -> int | None:
+    """Serve /metrics of this process on the first free port from ``port``.
+
+    For processes forked side by side, like taskiq workers, which cannot
+    share one port. Returns the port, or None when all were taken.
+    """
+    for candidate in range(port, port + attempts):
+        try:
+            start_http_server(candidate, addr=addr)
+        except OSError:
+            continue
+        return candidate
+    return None
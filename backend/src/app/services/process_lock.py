@@ -0,0 +1,33 @@
+import asyncio
+import fcntl
+import os
+import tempfile
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+
+def lock_path(name: str) -> Path:
+    return Path(tempfile.gettempdir()) / f"agency45_hub-{name}.lock"
+
+
+@asynccontextmanager
+async def exclusive_file_lock(
+    path: Path, retry_interval: float = 5.0
+) -> AsyncIterator[None]:
+    """Hold an exclusive flock on ``path``, waiting until it is free.
+
+    Elects a single process per host; the kernel releases the lock when the
+    holder exits, so a waiting process takes over after a crash.
+    """
+    fd = os.open(path, os.O_CREAT | os.O_RDWR, 0o600)
+    try:
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                await asyncio.sleep(retry_interval)
+        yield
+    finally:
+        os.close(fd)
@@ -0,0 +1,264 @@
+"""Sampling profiles of the running process as folded stacks.
+
+Every line of a profile is ``frame;frame;...;frame weight``, root first: the
+input of flamegraph.pl and inferno, and a format speedscope opens directly.
+
+``sample_cpu`` and ``snapshot_memory`` profile the whole process on demand.
+``slow_requests`` samples the event loop thread all the time but keeps only
+the stacks of requests and bot updates that turn out slower than a
+threshold, attributed through the asyncio task context, so concurrent
+requests do not mix.
+
+Profiles are kept in the memory of the process that took them: with several
+API workers each has its own, and records carry the pid that recorded them.
+"""
+
+import asyncio
+import functools
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from types import FrameType
+from typing import Literal
+from uuid import uuid4
+
+from app.services.tracing import current_span
+
+ProfileKind = Literal["cpu", "memory"]
+
+# Frames kept per tracemalloc allocation; deeper stacks cost memory per block
+MEMORY_FRAMES = 32
+
+
+class ProfilerBusyError(Exception):
+    """Another on-demand profile of this process is running."""
+
+
+@dataclass(slots=True)
+class StackProfile:
+    # "samples" for CPU profiles, "bytes" for memory ones
+    unit: str = "samples"
+    stacks: Counter[str] = field(default_factory=Counter)
+
+    def add(self, stack: str, weight: int = 1) -> None:
+        self.stacks[stack] += weight
+
+    @property
+    def total(self) -> int:
+        return sum(self.stacks.values())
+
+    def folded(self) -> str:
+        return "".join(
+            f"{stack} {weight}\n" for stack, weight in self.stacks.most_common()
+        )
+
+
+@functools.lru_cache(maxsize=4096)
+def _short_path(filename: str) -> str:
+    for prefix in sorted(filter(None, sys.path), key=len, reverse=True):
+        if filename.startswith(prefix + os.sep):
+            return filename[len(prefix) + 1 :]
+    return filename
+
+
+def fold_stack(frame: FrameType | None, root: str | None = None) -> str:
+    """Frames from ``frame`` up, root first, as ``module:qualname`` names."""
+    names: list[str] = []
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "?")
+        names.append(f"{module}:{frame.f_code.co_qualname}")
+        frame = frame.f_back
+    if root is not None:
+        names.append(root)
+    names.reverse()
+    return ";".join(names)
+
+
+class _SamplerThread(threading.Thread):
+    def __init__(self, interval: float, sample: Callable[[int], None]):
+        super().__init__(name="profiler", daemon=True)
+        self.interval = interval
+        self.sample = sample
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.sample(self.ident or 0)
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+_on_demand = threading.Lock()
+
+
+@contextmanager
+def _exclusive() -> Iterator[None]:
+    if not _on_demand.acquire(blocking=False):
+        raise ProfilerBusyError("A profile of this process is already running")
+    try:
+        yield
+    finally:
+        _on_demand.release()
+
+
+async def sample_cpu(seconds: float, interval: float = 0.01) -> StackProfile:
+    """Stacks of all threads every ``interval`` seconds, for ``seconds``.
+
+    The event loop thread waiting in its selector shows up as idle time.
+    """
+    profile = StackProfile()
+    thread_names: dict[int | None, str] = {}
+
+    def sample(own_ident: int) -> None:
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            if ident not in thread_names:
+                thread_names.update((t.ident, t.name) for t in threading.enumerate())
+            profile.add(fold_stack(frame, root=thread_names.get(ident, str(ident))))
+
+    with _exclusive():
+        sampler = _SamplerThread(interval, sample)
+        sampler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            sampler.stop()
+    return profile
+
+
+async def snapshot_memory(seconds: float, frames: int = MEMORY_FRAMES) -> StackProfile:
+    """Allocations made during ``seconds`` and still alive at the end, in bytes.
+
+    Tracing slows allocations down severalfold while it runs.
+    """
+    with _exclusive():
+        if tracemalloc.is_tracing():
+            raise ProfilerBusyError("tracemalloc is already tracing")
+        tracemalloc.start(frames)
+        try:
+            await asyncio.sleep(seconds)
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+    profile = StackProfile(unit="bytes")
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    for stat in snapshot.statistics("traceback"):
+        # Traceback frames are ordered from the oldest call
+        profile.add(
+            ";".join(f"{_short_path(f.filename)}:{f.lineno}" for f in stat.traceback),
+            stat.size,
+        )
+    return profile
+
+
+async def run_profile(kind: ProfileKind, seconds: float) -> StackProfile:
+    if kind == "memory":
+        return await snapshot_memory(seconds)
+    return await sample_cpu(seconds)
+
+
+@dataclass(slots=True)
+class SlowProfile:
+    id: str
+    name: str
+    started_at: datetime
+    duration: float = 0.0
+    trace_id: str | None = None
+    pid: int = field(default_factory=os.getpid)
+    profile: StackProfile = field(default_factory=StackProfile)
+
+
+_watched_profile: ContextVar[StackProfile | None] = ContextVar(
+    "watched_profile", default=None
+)
+
+
+class SlowRequestSampler:
+    """Keeps the CPU profiles of the latest requests slower than a threshold.
+
+    Each sample of the loop thread goes to the request whose task is running,
+    including tasks it spawned, since they inherit its context. Without
+    watched requests in flight a sample is a single check.
+    """
+
+    def __init__(self) -> None:
+        self.threshold = 0.0
+        self.profiles: deque[SlowProfile] = deque()
+        self._thread: _SamplerThread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_ident = 0
+        self._watched = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self, threshold: float, interval: float, keep: int) -> None:
+        """Sample the running event loop; call from its thread."""
+        if self._thread is not None:
+            return
+        self.threshold = threshold
+        self.profiles = deque(self.profiles, maxlen=keep)
+        self._loop = asyncio.get_running_loop()
+        self._loop_ident = threading.get_ident()
+        self._thread = _SamplerThread(interval, self._sample)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._thread.stop()
+            self._thread = None
+
+    def get(self, profile_id: str) -> SlowProfile | None:
+        return next((p for p in self.profiles if p.id == profile_id), None)
+
+    @contextmanager
+    def watch(self, name: str) -> Iterator[SlowProfile]:
+        """Profile the block; kept if it ran longer than the threshold.
+
+        ``name`` of the yielded record may be refined before the block ends.
+        """
+        record = SlowProfile(uuid4().hex[:12], name, datetime.now(UTC))
+        if self._thread is None:
+            yield record
+            return
+
+        token = _watched_profile.set(record.profile)
+        self._watched += 1
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            self._watched -= 1
+            _watched_profile.reset(token)
+            record.duration = time.perf_counter() - started
+            if record.duration >= self.threshold and record.profile.stacks:
+                span = current_span()
+                record.trace_id = span.trace_id if span is not None else None
+                self.profiles.append(record)
+
+    def _sample(self, own_ident: int) -> None:
+        if not self._watched or self._loop is None:
+            return
+        task = asyncio.current_task(self._loop)
+        frame = sys._current_frames().get(self._loop_ident)
+        if task is None or frame is None:
+            return
+        profile = task.get_context().get(_watched_profile)
+        if profile is not None:
+            profile.add(fold_stack(frame))
+
+
+slow_requests = SlowRequestSampler()
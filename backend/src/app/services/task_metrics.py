@@ -0,0 +1,129 @@
+"""Prometheus metrics of taskiq tasks, served by workers and the scheduler."""
+
+import logging
+import time
+from contextvars import Token
+from typing import Any
+
+from prometheus_client import Counter, Gauge, Histogram
+from taskiq import TaskiqMessage, TaskiqMiddleware, TaskiqResult
+
+from app.database.instrumentation import (
+    QueryStats,
+    record_handler_stats,
+    start_tracking,
+    stop_tracking,
+)
+from app.services.logging import start_log_sample, stop_log_sample
+from app.services.metrics import start_metrics_server
+from app.settings import TaskiqConfig
+
+logger = logging.getLogger(__name__)
+
+# Set by the sender, read by the worker to measure time spent in the queue
+ENQUEUED_AT_LABEL = "_enqueued_at"
+# Set by taskiq's retry middlewares on re-kicked messages
+RETRIES_LABEL = "_retries"
+
+# Tasks run from seconds to a whole broadcast of many accounts
+TASK_BUCKETS = (0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600, 1200, 1800, 3600)
+
+TASKS_SENT = Counter(
+    "taskiq_tasks_sent_total",
+    "Tasks kicked to the broker, by the API or the scheduler",
+    ["task_name"],
+)
+TASK_QUEUE_WAIT = Histogram(
+    "taskiq_task_queue_wait_seconds",
+    "Time from kicking a task to a worker starting it",
+    ["task_name"],
+    buckets=TASK_BUCKETS,
+)
+TASK_DURATION = Histogram(
+    "taskiq_task_duration_seconds",
+    "Execution time of tasks",
+    ["task_name"],
+    buckets=TASK_BUCKETS,
+)
+TASKS_EXECUTED = Counter(
+    "taskiq_tasks_executed_total",
+    "Finished task executions by outcome: success or failure",
+    ["task_name", "outcome"],
+)
+TASK_RETRIES = Counter(
+    "taskiq_task_retries_total",
+    "Executions of retried tasks",
+    ["task_name"],
+)
+TASKS_IN_FLIGHT = Gauge(
+    "taskiq_tasks_in_flight",
+    "Tasks currently executing",
+    ["task_name"],
+    multiprocess_mode="livesum",
+)
+
+
+class TaskMetricsMiddleware(TaskiqMiddleware):
+    """Records task metrics and serves /metrics from workers and the scheduler.
+
+    Every worker process of `taskiq worker -w N` takes its own port from
+    ``metrics_port`` on, so each is scraped as a separate target. SQL
+    statements of each execution are counted like those of API requests, and
+    its hot-path log records are sampled together.
+    """
+
+    def __init__(self, config: TaskiqConfig):
+        super().__init__()
+        self.config = config
+        # pre_execute and post_execute of one message share its context
+        self._queries: dict[str, tuple[QueryStats, Token[QueryStats | None]]] = {}
+        self._log_samples: dict[str, Token[float | None]] = {}
+
+    def startup(self) -> None:
+        if self.config.metrics_port is None:
+            return
+        if not (self.broker.is_worker_process or self.broker.is_scheduler_process):
+            return
+        first = self.config.metrics_port
+        port = start_metrics_server(first, self.config.metrics_port_range)
+        if port is None:
+            last = first + self.config.metrics_port_range - 1
+            logger.warning("No free metrics port in %s-%s", first, last)
+        else:
+            logger.info("Serving task metrics on port %s", port)
+
+    def pre_send(self, message: TaskiqMessage) -> TaskiqMessage:
+        message.labels[ENQUEUED_AT_LABEL] = time.time()
+        TASKS_SENT.labels(message.task_name).inc()
+        return message
+
+    def pre_execute(self, message: TaskiqMessage) -> TaskiqMessage:
+        name = message.task_name
+        TASKS_IN_FLIGHT.labels(name).inc()
+        try:
+            enqueued_at = float(message.labels[ENQUEUED_AT_LABEL])
+        except (KeyError, TypeError, ValueError):
+            pass
+        else:
+            # Clocks of sender and worker hosts may differ slightly
+            TASK_QUEUE_WAIT.labels(name).observe(max(time.time() - enqueued_at, 0))
+        if int(message.labels.get(RETRIES_LABEL, 0)) > 0:
+            TASK_RETRIES.labels(name).inc()
+        self._queries[message.task_id] = start_tracking()
+        self._log_samples[message.task_id] = start_log_sample()
+        return message
+
+    def post_execute(self, message: TaskiqMessage, result: TaskiqResult[Any]) -> None:
+        name = message.task_name
+        TASKS_IN_FLIGHT.labels(name).dec()
+        TASK_DURATION.labels(name).observe(result.execution_time)
+        outcome = "failure" if result.is_err else "success"
+        TASKS_EXECUTED.labels(name, outcome).inc()
+        tracking = self._queries.pop(message.task_id, None)
+        if tracking is not None:
+            stats, token = tracking
+            stop_tracking(token)
+            record_handler_stats(f"task {name}", stats)
+        log_sample = self._log_samples.pop(message.task_id, None)
+        if log_sample is not None:
+            stop_log_sample(log_sample)
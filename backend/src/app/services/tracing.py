@@ -0,0 +1,268 @@
+"""Lightweight tracing with OpenTelemetry-shaped spans.
+
+Root spans (HTTP requests, tasks) decide once whether their trace is
+recorded: head sampling with ``TRACING__SAMPLE_RATIO``, or the sampled flag
+of an incoming W3C ``traceparent``. Child spans only exist inside a sampled
+trace, so an unsampled request costs one random draw and a few context
+lookups.
+
+Finished spans are logged by the ``app.tracing`` logger as ``span {json}``
+messages with OTLP field names; promtail ships them to Loki, where
+
+    {container=~".*-app-.*"} |= "span {" | json | line_format "{{.message}}"
+        | regexp "span (?P<s>.*)" | line_format "{{.s}}" | json
+        | trace_id="..."
+
+reassembles one trace.
+"""
+
+import functools
+import json
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Literal, ParamSpec, TypeVar
+
+logger = logging.getLogger("app.tracing")
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+SpanKind = Literal["server", "client", "consumer", "internal"]
+
+SAMPLED_FLAG = 0x01
+
+
+@dataclass(slots=True)
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    kind: SpanKind
+    start_time_unix_nano: int
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: Literal["unset", "ok", "error"] = "unset"
+    status_message: str | None = None
+    end_time_unix_nano: int | None = None
+    _started: int = 0
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        self.status = "error"
+        self.status_message = f"{type(error).__name__}: {error}"
+
+    def end(self) -> None:
+        duration = time.perf_counter_ns() - self._started
+        self.end_time_unix_nano = self.start_time_unix_nano + duration
+        _exporter(self)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "service": _service_name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time_unix_nano": self.start_time_unix_nano,
+            "end_time_unix_nano": self.end_time_unix_nano,
+            "duration_ms": round(
+                ((self.end_time_unix_nano or 0) - self.start_time_unix_nano) / 1e6, 3
+            ),
+            "status": self.status,
+            "status_message": self.status_message,
+            "attributes": self.attributes,
+        }
+
+
+class NoopSpan:
+    """Stands in for spans of unsampled traces."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_error(self, error: BaseException) -> None:
+        pass
+
+
+NOOP_SPAN = NoopSpan()
+
+
+class _SpanJson:
+    """Serialized by the logging thread, off the event loop."""
+
+    __slots__ = ("span",)
+
+    def __init__(self, span: Span):
+        self.span = span
+
+    def __str__(self) -> str:
+        return json.dumps(self.span.as_dict(), default=str)
+
+
+def log_span(span: Span) -> None:
+    logger.info("span %s", _SpanJson(span))
+
+
+_current: ContextVar[Span | None] = ContextVar("span", default=None)
+_sample_ratio = 0.0
+_service_name = "app"
+_exporter: Callable[[Span], None] = log_span
+
+
+def configure_tracing(
+    sample_ratio: float,
+    service_name: str,
+    exporter: Callable[[Span], None] = log_span,
+) -> None:
+    global _sample_ratio, _service_name, _exporter
+    _sample_ratio = sample_ratio
+    _service_name = service_name
+    _exporter = exporter
+
+
+def current_span() -> Span | None:
+    return _current.get()
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+def _parse_traceparent(header: str | None) -> tuple[str, str, bool] | None:
+    """(trace id, parent span id, sampled) of a valid W3C traceparent."""
+    if not header:
+        return None
+    parts = header.strip().split("-")
+    if len(parts) < 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        flags = int(parts[3][:2], 16)
+        if int(parts[1], 16) == 0 or int(parts[2], 16) == 0:
+            return None
+    except ValueError:
+        return None
+    return parts[1], parts[2], bool(flags & SAMPLED_FLAG)
+
+
+def start_span(
+    name: str,
+    kind: SpanKind = "internal",
+    attributes: dict[str, Any] | None = None,
+    parent: Span | None = None,
+) -> Span | None:
+    """Start a child of ``parent`` (default: the current span), if traced.
+
+    The span does not become current; call ``end()`` when done. For spans
+    opened and closed in different callbacks, like SQLAlchemy events.
+    """
+    parent = parent or _current.get()
+    if parent is None:
+        return None
+    return Span(
+        name=name,
+        trace_id=parent.trace_id,
+        span_id=_new_id(64),
+        parent_span_id=parent.span_id,
+        kind=kind,
+        start_time_unix_nano=time.time_ns(),
+        attributes=attributes or {},
+        _started=time.perf_counter_ns(),
+    )
+
+
+@contextmanager
+def _activate(span: Span) -> Iterator[Span]:
+    token = _current.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.record_error(e)
+        raise
+    finally:
+        _current.reset(token)
+        span.end()
+
+
+@contextmanager
+def trace(
+    name: str,
+    kind: SpanKind = "server",
+    traceparent: str | None = None,
+    sampled: bool | None = None,
+    **attributes: Any,
+) -> Iterator[Span | NoopSpan]:
+    """Root span of a request or task; a child span inside an active trace.
+
+    ``sampled`` forces the decision, e.g. for rare scheduled tasks.
+    """
+    if _current.get() is not None:
+        with span(name, kind, **attributes) as child:
+            yield child
+        return
+
+    parent = _parse_traceparent(traceparent)
+    if parent is not None:
+        trace_id, parent_span_id, parent_sampled = parent
+    else:
+        trace_id, parent_span_id, parent_sampled = _new_id(128), None, None
+    if sampled is None:
+        sampled = parent_sampled
+    if sampled is None:
+        sampled = _sample_ratio > 0 and random.random() < _sample_ratio
+    if not sampled:
+        yield NOOP_SPAN
+        return
+
+    root = Span(
+        name=name,
+        trace_id=trace_id,
+        span_id=_new_id(64),
+        parent_span_id=parent_span_id,
+        kind=kind,
+        start_time_unix_nano=time.time_ns(),
+        attributes=attributes,
+        _started=time.perf_counter_ns(),
+    )
+    with _activate(root):
+        yield root
+
+
+@contextmanager
+def span(
+    name: str, kind: SpanKind = "internal", **attributes: Any
+) -> Iterator[Span | NoopSpan]:
+    """Child of the current span; does nothing outside a sampled trace."""
+    child = start_span(name, kind, attributes)
+    if child is None:
+        yield NOOP_SPAN
+        return
+    with _activate(child):
+        yield child
+
+
+def traced(
+    name: str | None = None,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Wrap calls of a coroutine function in a span named after it."""
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if _current.get() is None:
+                return await func(*args, **kwargs)
+            with span(span_name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
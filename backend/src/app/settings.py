@@ -2,7 +2,7 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Literal, final
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from yarl import URL
 
@@ -14,6 +14,21 @@ class PostgresConfig(BaseModel):
     port: int = 5432
     db: str
 
+    # Connection pool, per process (API, each taskiq worker, scheduler)
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800  # seconds, -1 to disable
+    pool_pre_ping: bool = True
+
+    # asyncpg statement cache and SQLAlchemy's prepared statement cache
+    statement_cache_size: int = 100
+    prepared_statement_cache_size: int = 100
+
+    # "transaction" when connecting through PgBouncer in transaction pooling
+    # mode: prepared statements cannot be reused across server connections
+    pool_mode: Literal["session", "transaction"] = "session"
+
 
 class RedisConfig(BaseModel):
     host: str
@@ -35,10 +50,45 @@ class APIConfig(BaseModel):
     host: str = "0.0.0.0"
     allowed_hosts: list[str]
 
+    # Server processes; with more than one, Prometheus metrics are shared
+    # through PROMETHEUS_MULTIPROC_DIR
+    workers: int = 1
+    loop: Literal["auto", "asyncio", "uvloop"] = "uvloop"
+    http: Literal["auto", "h11", "httptools"] = "httptools"
+
     page_max_size: int = 100
     page_default_size: int = 10
 
 
+class GraphSimulatorConfig(BaseModel):
+    """Synthetic Graph API served when ``facebook.base_url`` is ``simulator://``."""
+
+    seed: int = 45
+
+    # Scale: every access token sees the same accounts
+    accounts: int = 1
+    campaigns: int = 50
+    adsets_per_campaign: int = 3
+    ads_per_adset: int = 3
+    # Share of entities with spend in any range; the rest have no insights
+    active_ratio: float = 0.7
+    page_size: int = 25
+
+    # Per-request latency: median (ms) and lognormal sigma (0 = fixed)
+    latency_ms: float = 0.0
+    latency_sigma: float = 0.5
+
+    # Injected failures: share of requests answered with a Graph error
+    error_rate: float = 0.0
+    error_codes: list[int] = [1, 2]
+    rate_limit_rate: float = 0.0
+
+    # Calls per `usage_window` seconds that count as 100% in usage headers;
+    # above it every call is throttled like the real API
+    usage_limit: int = 6000
+    usage_window: float = 60.0
+
+
 class FacebookConfig(BaseModel):
     app_id: str
     app_secret: str
@@ -54,11 +104,128 @@ class FacebookConfig(BaseModel):
     # Status filter (active + paused to include campaigns that had spend in period)
     active_statuses: list[str] = ["ACTIVE", "PAUSED"]
 
+    # Browser cache lifetime (seconds) for insights responses: ranges ending
+    # before today change rarely, ranges including today keep accruing spend
+    closed_range_max_age: int = 3600
+    open_range_max_age: int = 60
+
+    # Budget (seconds) for all Graph calls made by one API request
+    request_deadline: float = 90.0
+
+    # Used when base_url is "simulator://graph"
+    simulator: GraphSimulatorConfig = GraphSimulatorConfig()
+
+
+class TelegramSimulatorConfig(BaseModel):
+    """Bot API answered in-process when ``telegram.api_url`` is ``simulator://``."""
+
+    latency_ms: float = 0.0
+    # Share of calls answered with "Too Many Requests: retry after 1"
+    error_rate: float = 0.0
+
 
 class TelegramConfig(BaseModel):
     bot_token: str
     bot_link: str
 
+    # "polling": long polling, placed by `poller`; "webhook": Telegram
+    # pushes updates to POST /telegram/webhook, served by every API worker
+    mode: Literal["polling", "webhook"] = "polling"
+
+    # "api": one API worker per host polls, elected with a file lock;
+    # "standalone": the API never polls, run `cli bot` as its own process
+    poller: Literal["api", "standalone"] = "api"
+
+    # Public URL of /telegram/webhook and the secret Telegram sends with
+    # every update
+    webhook_url: str | None = None
+    webhook_secret: str | None = None
+    # Updates handled at once per API worker
+    webhook_max_concurrency: int = 50
+    # Bot API base URL: None for api.telegram.org, a local Bot API server,
+    # or "simulator://telegram" for benchmarks and load tests
+    api_url: str | None = None
+    simulator: TelegramSimulatorConfig = TelegramSimulatorConfig()
+
+    # Handlers using the database at once per process; keep it below
+    # postgres.pool_size so the API still gets connections during a burst
+    db_concurrency: int = 3
+
+    @model_validator(mode="after")
+    def check_webhook(self) -> "TelegramConfig":
+        if self.mode == "webhook" and not (self.webhook_url and self.webhook_secret):
+            raise ValueError("webhook mode needs webhook_url and webhook_secret")
+        return self
+
+
+class LoggingConfig(BaseModel):
+    # Default: DEBUG in local and dev, INFO in prod
+    level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] | None = None
+    # Default: text in local, JSON lines (for Loki) elsewhere
+    format: Literal["json", "text"] | None = None
+    # Share of per-request debug records of hot paths (HTTP clients) kept
+    debug_sample_ratio: float = Field(0.05, ge=0, le=1)
+    # Records waiting for the writer thread; more are dropped
+    queue_size: int = 10_000
+
+
+class TracingConfig(BaseModel):
+    # Share of requests traced; a sampled `traceparent` header always is
+    sample_ratio: float = Field(0.01, ge=0, le=1)
+
+
+class ProfilingConfig(BaseModel):
+    # Requests and bot updates slower than this many seconds keep their CPU
+    # profile for GET /profiling/slow; None turns the sampler off
+    slow_request_threshold: float | None = 2.0
+    sample_interval: float = Field(0.01, gt=0)
+    keep: int = 50
+
+
+class LoopMonitorConfig(BaseModel):
+    # Seconds between event loop lag measurements
+    interval: float = Field(0.5, gt=0)
+    # With DEBUG logging, where the loop is stuck gets logged once it has
+    # been blocked this many seconds
+    blocking_threshold: float = Field(0.1, gt=0)
+
+
+class TaskiqConfig(BaseModel):
+    # Worker processes and the scheduler serve /metrics on the first free
+    # port from metrics_port on, trying metrics_port_range; None disables it
+    metrics_port: int | None = 9100
+    metrics_port_range: int = 16
+
+
+class RouteSLO(BaseModel):
+    p95_ms: float
+    p99_ms: float
+    max_error_rate: float = 0.01
+
+
+class LoadTestConfig(BaseModel):
+    """Request mix and objectives of `cli loadtest`."""
+
+    # Relative weights of the simulated user actions
+    mix: dict[str, float] = {
+        "login": 1,
+        "users": 4,
+        "ad_accounts": 3,
+        "campaigns": 3,
+        "drilldown": 2,
+        "snapshot": 1,
+        "broadcast": 0.5,
+    }
+    # Objectives per route ("GET /users"); unlisted routes use default_slo
+    default_slo: RouteSLO = RouteSLO(p95_ms=300, p99_ms=800)
+    slos: dict[str, RouteSLO] = {
+        # bcrypt with 12 rounds dominates
+        "POST /auth/login": RouteSLO(p95_ms=800, p99_ms=1500),
+        "GET /facebook/ad-accounts/{account_id}/snapshot": RouteSLO(
+            p95_ms=1500, p99_ms=3000
+        ),
+    }
+
 
 class PathsConfig:
     src_path = Path(__file__).parent.parent
@@ -87,6 +254,12 @@ class Config(BaseSettings):
 
     postgres: PostgresConfig
     redis: RedisConfig
+    taskiq: TaskiqConfig = TaskiqConfig()
+    logging: LoggingConfig = LoggingConfig()
+    tracing: TracingConfig = TracingConfig()
+    profiling: ProfilingConfig = ProfilingConfig()
+    loop_monitor: LoopMonitorConfig = LoopMonitorConfig()
+    loadtest: LoadTestConfig = LoadTestConfig()
 
     paths: PathsConfig = PathsConfig()
 
@@ -1,4 +1,5 @@
 from .broadcast import send_daily_broadcast
 from .health import health_check
+from .profiling import profile_worker
 
-__all__ = ["health_check", "send_daily_broadcast"]
+__all__ = ["health_check", "profile_worker", "send_daily_broadcast"]
@@ -1,9 +1,12 @@
 import logging
 
+from app.api.modules.telegram.services import create_bot
 from app.api.modules.telegram.services.broadcast import TelegramBroadcastService
 from app.clients.facebook import FacebookClient
+from app.clients.graph_simulator import graph_mounts
 from app.database.engine import SessionFactory
 from app.database.uow import UnitOfWork
+from app.services.tracing import trace
 from app.settings import get_config
 from app.tiq import broker
 
@@ -17,16 +20,16 @@ config = get_config()
 async def send_daily_broadcast() -> None:
     logger.info("Starting daily broadcast task")
 
-    from aiogram import Bot
     from httpx import AsyncClient
 
-    bot = Bot(token=config.telegram.bot_token)
+    bot = create_bot(config.telegram)
     try:
-        async with AsyncClient(timeout=60.0) as http_client:
+        async with AsyncClient(
+            timeout=60.0, mounts=graph_mounts(config.facebook)
+        ) as http_client:
             fb_client = FacebookClient(http_client, config.facebook)
 
-            async with SessionFactory() as session:
-                uow = UnitOfWork(session)
+            async with UnitOfWork(session_factory=SessionFactory) as uow:
                 service = TelegramBroadcastService(
                     bot=bot,
                     fb_client=fb_client,
@@ -34,7 +37,9 @@ async def send_daily_broadcast() -> None:
                     fb_auth_gw=uow.facebook_auth,
                     telegram_gw=uow.telegram,
                 )
-                await service.send_daily_reports()
+                # Runs once a day, so it is always traced
+                with trace("task send_daily_broadcast", kind="consumer", sampled=True):
+                    await service.send_daily_reports()
     finally:
         await bot.session.close()
 
@@ -0,0 +1,14 @@
+from app.services.profiling import ProfileKind, run_profile
+from app.tiq import broker
+
+
+@broker.task
+async def profile_worker(kind: ProfileKind, seconds: float) -> str:
+    """Folded stacks of the worker process that picks the task up.
+
+    Other tasks keep running in the process meanwhile, and show up in the
+    profile; with several worker processes, which one runs it is up to the
+    queue.
+    """
+    profile = await run_profile(kind, seconds)
+    return profile.folded()
@@ -1,14 +1,17 @@
 from dishka.integrations.taskiq import setup_dishka
-from taskiq import TaskiqScheduler
+from taskiq import TaskiqEvents, TaskiqScheduler, TaskiqState
 from taskiq.schedule_sources import LabelScheduleSource
 from taskiq_redis import ListQueueBroker, RedisAsyncResultBackend
 
 from app.ioc import get_async_container
 from app.services.logging import setup_logging
+from app.services.loop_monitor import LoopMonitor
+from app.services.task_metrics import TaskMetricsMiddleware
+from app.services.tracing import configure_tracing
 from app.settings import get_config
 
 config = get_config()
-setup_logging(config.env)
+setup_logging(config.env, config.logging)
 
 redis_async_result: RedisAsyncResultBackend = RedisAsyncResultBackend(
     redis_url=config.redis_url,
@@ -16,6 +19,25 @@ redis_async_result: RedisAsyncResultBackend = RedisAsyncResultBackend(
 
 broker = ListQueueBroker(url=config.redis_url)
 broker.with_result_backend(redis_async_result)
+broker.add_middlewares(TaskMetricsMiddleware(config.taskiq))
+
+
+loop_monitor = LoopMonitor(
+    config.loop_monitor.interval, config.loop_monitor.blocking_threshold
+)
+
+
+# Not at import time: the API imports tasks to kick them
+@broker.on_event(TaskiqEvents.WORKER_STARTUP)
+async def configure_worker(state: TaskiqState) -> None:
+    configure_tracing(config.tracing.sample_ratio, service_name="tasks")
+    loop_monitor.start()
+
+
+@broker.on_event(TaskiqEvents.WORKER_SHUTDOWN)
+async def stop_worker_monitors(state: TaskiqState) -> None:
+    await loop_monitor.stop()
+
 
 scheduler = TaskiqScheduler(
     broker=broker,
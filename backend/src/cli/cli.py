@@ -106,3 +106,155 @@ def create_user(
             typer.echo(f"User '{username}' created successfully.")
 
     anyio.run(_create_user)
+
+
+@app.command("bot")
+def bot() -> None:
+    """Run Telegram long polling in this process (TELEGRAM__POLLER=standalone)."""
+    from app.api.modules.telegram.services.bot import TelegramBotService
+    from app.services.logging import setup_logging
+    from app.settings import get_config
+
+    config = get_config()
+    setup_logging(config.env, config.logging)
+    anyio.run(TelegramBotService(config.telegram).start_polling)
+
+
+@app.command("graph-simulator")
+def graph_simulator(
+    host: str = "127.0.0.1",
+    port: int = 8900,
+) -> None:
+    """Serve the synthetic Graph API over HTTP (FACEBOOK__SIMULATOR__* sets scale).
+
+    Point APP__FACEBOOK__BASE_URL at http://HOST:PORT to use it.
+    """
+    import uvicorn
+    from pydantic_settings import BaseSettings, SettingsConfigDict
+
+    from app.clients.graph_simulator import GraphSimulator
+    from app.settings import GraphSimulatorConfig
+
+    # Only the simulator section: the app's other settings are not needed
+    class SimulatorSettings(BaseSettings):
+        model_config = SettingsConfigDict(
+            env_file=".env",
+            env_prefix="APP__FACEBOOK__",
+            env_nested_delimiter="__",
+            extra="ignore",
+        )
+        simulator: GraphSimulatorConfig = GraphSimulatorConfig()
+
+    simulator = GraphSimulator(SimulatorSettings().simulator)
+    uvicorn.run(simulator.asgi(), host=host, port=port)
+
+
+@app.command("loadtest")
+def loadtest(
+    password: Annotated[
+        str,
+        typer.Option(
+            prompt=True,
+            hide_input=True,
+            help="Password set on the load-test user for the run",
+        ),
+    ],
+    duration: Annotated[float, typer.Option(help="Seconds of load")] = 30.0,
+    concurrency: Annotated[int, typer.Option(help="Virtual users")] = 10,
+    url: Annotated[
+        str | None,
+        typer.Option(help="Target a running server instead of the in-process app"),
+    ] = None,
+    report: Annotated[
+        Path | None, typer.Option(help="Also write the results as JSON")
+    ] = None,
+) -> None:
+    """Drive the API with a realistic request mix and check it against the SLOs.
+
+    Graph and Telegram are simulated in-process (LOADTEST__* sets the mix and
+    objectives). With --url the server must run with
+    APP__FACEBOOK__BASE_URL=simulator://graph and
+    APP__TELEGRAM__API_URL=simulator://telegram itself.
+
+    The run logs in as a new admin, created in the configured database with
+    the given password under a random loadtest_ username and deleted when the
+    run ends.
+    """
+    import json
+    import logging
+
+    import httpx
+
+    from app.services.loadtest import (
+        LoadTest,
+        LoadTestSetupError,
+        create_loadtest_user,
+        delete_loadtest_user,
+    )
+    from app.settings import get_config
+
+    config = get_config()
+    if url is None:
+        # Before the app module reads the config: no real Graph or Telegram calls
+        config.facebook.base_url = "simulator://graph"
+        config.telegram.api_url = "simulator://telegram"
+        config.telegram.mode = "polling"
+        config.telegram.poller = "standalone"
+
+    async def _create_user() -> User:
+        container = get_async_container()
+        async with container() as request_container:
+            uow = await request_container.get(UnitOfWork)
+            user = await create_loadtest_user(uow, password)
+        await container.close()
+        return user
+
+    async def _delete_user(user: User) -> None:
+        container = get_async_container()
+        async with container() as request_container:
+            uow = await request_container.get(UnitOfWork)
+            await delete_loadtest_user(uow, user.id)
+        await container.close()
+
+    async def _run() -> bool:
+        user = await _create_user()
+        try:
+            return await _run_load(user.username)
+        finally:
+            await _delete_user(user)
+
+    async def _run_load(username: str) -> bool:
+        if url is not None:
+            async with httpx.AsyncClient(base_url=url, timeout=60) as client:
+                return await _drive(client, username)
+
+        from app.application import get_production_app
+
+        api = get_production_app()
+        # Every simulated Graph page would be logged
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        async with api.router.lifespan_context(api):
+            transport = httpx.ASGITransport(app=api)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://loadtest", timeout=60
+            ) as client:
+                return await _drive(client, username)
+
+    async def _drive(client: httpx.AsyncClient, username: str) -> bool:
+        test = LoadTest(client, config.loadtest, username, password)
+        try:
+            await test.setup()
+        except LoadTestSetupError as e:
+            typer.echo(typer.style(str(e), fg=typer.colors.RED), err=True)
+            raise typer.Exit(2) from e
+        typer.echo(f"Running {concurrency} virtual users for {duration:.0f}s...")
+        result = await test.run(duration, concurrency)
+        typer.echo(result.format())
+        if report is not None:
+            report.write_text(json.dumps(result.as_dict(), indent=2) + "\n")
+        return result.passed
+
+    if not anyio.run(_run):
+        typer.echo(typer.style("SLOs violated", fg=typer.colors.RED), err=True)
+        raise typer.Exit(1)
+    typer.echo(typer.style("All SLOs met", fg=typer.colors.GREEN))
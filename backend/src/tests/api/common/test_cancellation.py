@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.api.common.cancellation import CLIENT_DISCONNECTS, DeadlineRoute
+from app.services.deadline import current_deadline
+
+
+class ShortDeadlineRoute(DeadlineRoute):
+    def deadline_seconds(self) -> float | None:
+        return 0.05
+
+
+def make_app(route_class: type[DeadlineRoute], state: dict) -> FastAPI:
+    router = APIRouter(route_class=route_class)
+
+    @router.get("/slow")
+    async def slow() -> dict:
+        state["remaining"] = current_deadline() and current_deadline().remaining()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            state["cancelled"] = True
+            raise
+        return {}
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+@pytest.mark.asyncio
+class TestDeadlineRoute:
+    async def test_deadline_cancels_endpoint(self):
+        state: dict = {}
+        app = make_app(ShortDeadlineRoute, state)
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            resp = await client.get("/slow")
+
+        assert resp.status_code == 504
+        assert state["cancelled"]
+        assert 0 < state["remaining"] <= 0.05
+
+    async def test_disconnect_cancels_endpoint(self):
+        state: dict = {}
+        app = make_app(DeadlineRoute, state)
+        before = CLIENT_DISCONNECTS.labels(route="/slow")._value.get()
+        messages = iter([{"type": "http.request", "body": b"", "more_body": False}])
+
+        async def receive() -> dict:
+            try:
+                return next(messages)
+            except StopIteration:
+                await asyncio.sleep(0.05)
+                return {"type": "http.disconnect"}
+
+        sent: list[dict] = []
+
+        async def send(message: dict) -> None:
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/slow",
+            "raw_path": b"/slow",
+            "query_string": b"",
+            "headers": [],
+            "server": ("test", 80),
+            "client": ("test", 1234),
+        }
+        await asyncio.wait_for(app(scope, receive, send), timeout=2)
+
+        assert state["cancelled"]
+        assert sent[0]["status"] == 499
+        assert CLIENT_DISCONNECTS.labels(route="/slow")._value.get() == before + 1
@@ -0,0 +1,23 @@
+from datetime import date, timedelta
+
+from app.api.common.http_cache import etag_matches, make_etag
+from app.api.modules.facebook.routes import is_closed_range
+
+
+def test_etag_matches():
+    etag = make_etag(b'{"id": 1}')
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches(make_etag(b'{"id": 2}'), etag)
+
+
+def test_is_closed_range():
+    today = date.today()
+
+    assert not is_closed_range(None)
+    assert not is_closed_range(today.isoformat())
+    assert not is_closed_range((today - timedelta(days=1)).isoformat())
+    assert is_closed_range((today - timedelta(days=2)).isoformat())
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from app.api.common.streaming import (
+    EVENT_STREAM_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    negotiate_stream,
+    stream_models,
+)
+from app.services.deadline import deadline
+
+
+class Item(BaseModel):
+    id: int
+
+
+async def items(fail_after: int | None = None):
+    for i in range(3):
+        if i == fail_after:
+            raise HTTPException(status_code=429, detail="slow down")
+        yield Item(id=i)
+
+
+async def read_body(response) -> str:
+    return "".join([chunk async for chunk in response.body_iterator])
+
+
+def test_negotiate_stream():
+    assert negotiate_stream(None) is None
+    assert negotiate_stream("application/json") is None
+    assert negotiate_stream(NDJSON_MEDIA_TYPE) == NDJSON_MEDIA_TYPE
+    assert negotiate_stream("text/event-stream, */*") == EVENT_STREAM_MEDIA_TYPE
+
+
+@pytest.mark.asyncio
+class TestStreamModels:
+    async def test_ndjson_lines(self):
+        response = await stream_models(items(), NDJSON_MEDIA_TYPE)
+
+        assert await read_body(response) == '{"id":0}\n{"id":1}\n{"id":2}\n'
+
+    async def test_error_before_first_item_raises(self):
+        with pytest.raises(HTTPException):
+            await stream_models(items(fail_after=0), NDJSON_MEDIA_TYPE)
+
+    async def test_later_error_is_sent_in_band(self):
+        response = await stream_models(items(fail_after=1), EVENT_STREAM_MEDIA_TYPE)
+
+        assert await read_body(response) == (
+            'data: {"id":0}\n\n'
+            "event: error\n"
+            'data: {"error": {"status_code": 429, "detail": "slow down"}}\n\n'
+        )
+
+    async def test_deadline_bounds_body_sent_after_endpoint(self):
+        async def slow_items():
+            yield Item(id=0)
+            await asyncio.sleep(10)
+            yield Item(id=1)
+
+        with deadline(0.05):
+            response = await stream_models(slow_items(), NDJSON_MEDIA_TYPE)
+
+        assert await read_body(response) == (
+            '{"id":0}\n'
+            '{"error": {"status_code": 504, "detail": "Request deadline exceeded."}}\n'
+        )
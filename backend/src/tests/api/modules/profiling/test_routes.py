@@ -0,0 +1,17 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+class TestProfilingRoutes:
+    async def test_requires_admin(self, client: AsyncClient, authenticated_user: dict):
+        headers = {"Authorization": f"Bearer {authenticated_user['access_token']}"}
+
+        resp = await client.get("/profiling/process/cpu?seconds=1", headers=headers)
+
+        assert resp.status_code == 403
+
+    async def test_requires_authentication(self, client: AsyncClient):
+        resp = await client.get("/profiling/slow")
+
+        assert resp.status_code == 401
@@ -0,0 +1 @@
+# Telegram tests package
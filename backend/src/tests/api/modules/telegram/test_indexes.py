@@ -0,0 +1,66 @@
+import uuid
+
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.api.modules.telegram.gateway import TelegramGateway
+from app.api.modules.users.models import User
+from tests.fixtures.core.postgres import explain_index_names
+
+
+@pytest.mark.asyncio
+class TestTelegramIndexes:
+    async def _seed(self, conn) -> None:
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "username": f"index_user_{i}",
+                "password": "x",
+                "is_active": True,
+                "is_admin": False,
+                "telegram_chat_id": i if i % 50 == 0 else None,
+                "telegram_daily_enabled": i % 100 == 0,
+                "telegram_token": str(uuid.uuid4()) if i % 10 == 0 else None,
+            }
+            for i in range(1, 5001)
+        ]
+        await conn.execute(insert(User), rows)
+        await conn.execute(text("ANALYZE users"))
+
+    async def test_daily_recipients_use_partial_index(self, pg_engine: AsyncEngine):
+        async with pg_engine.connect() as conn:
+            await self._seed(conn)
+            await conn.execute(text("SET LOCAL enable_seqscan = off"))
+
+            stmt = TelegramGateway.recipients_query(daily_only=True)
+            names = await explain_index_names(conn, stmt)
+
+            assert "users_telegram_daily_recipients_idx" in names
+            await conn.rollback()
+
+    async def test_chat_binding_uses_token_and_chat_indexes(
+        self, pg_engine: AsyncEngine
+    ):
+        async with pg_engine.connect() as conn:
+            await self._seed(conn)
+            await conn.execute(text("SET LOCAL enable_seqscan = off"))
+
+            stmt = TelegramGateway.chat_binding_query(50, str(uuid.uuid4()))
+            names = await explain_index_names(conn, stmt)
+
+            assert names == {"users_telegram_token_idx", "users_telegram_chat_id_ukey"}
+            await conn.rollback()
+
+    async def test_bind_chat_uses_unique_partial_index(self, pg_engine: AsyncEngine):
+        async with pg_engine.connect() as conn:
+            await self._seed(conn)
+            await conn.execute(text("SET LOCAL enable_seqscan = off"))
+
+            stmt = TelegramGateway.bind_chat_statement(
+                str(uuid.uuid4()), 50, "user", "ua"
+            )
+            names = await explain_index_names(conn, stmt)
+
+            assert names == {"users_telegram_token_idx"}
+            await conn.rollback()
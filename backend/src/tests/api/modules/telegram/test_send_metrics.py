@@ -0,0 +1,39 @@
+import pytest
+from aiogram.exceptions import TelegramRetryAfter
+from prometheus_client import REGISTRY
+
+from app.api.modules.telegram.services.bot import create_bot
+from app.settings import TelegramConfig, TelegramSimulatorConfig
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.asyncio
+class TestTelegramMetrics:
+    async def test_send_outcomes(self):
+        config = TelegramConfig(
+            bot_token="123:abc", bot_link="x", api_url="simulator://telegram"
+        )
+        ok = _sample("telegram_requests_total", method="sendMessage", outcome="ok")
+        retry = _sample(
+            "telegram_requests_total", method="sendMessage", outcome="retry_after"
+        )
+
+        bot = create_bot(config)
+        await bot.send_message(chat_id=1, text="hi")
+        bot.session.config = TelegramSimulatorConfig(error_rate=1)
+        with pytest.raises(TelegramRetryAfter):
+            await bot.send_message(chat_id=1, text="hi")
+
+        assert (
+            _sample("telegram_requests_total", method="sendMessage", outcome="ok")
+            == ok + 1
+        )
+        assert (
+            _sample(
+                "telegram_requests_total", method="sendMessage", outcome="retry_after"
+            )
+            == retry + 1
+        )
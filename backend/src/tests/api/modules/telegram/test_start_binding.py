@@ -0,0 +1,61 @@
+import asyncio
+import random
+
+import pytest
+
+from app.api.modules.telegram.services.handlers.middleware import UnitOfWorkMiddleware
+from app.api.modules.users.models import User
+from app.database.uow import UnitOfWork
+
+
+def _chat_id() -> int:
+    return random.randint(10**9, 10**12)
+
+
+@pytest.mark.asyncio
+class TestStartBinding:
+    async def test_binding_finds_token_owner_and_chat_owner(self, uow: UnitOfWork):
+        chat_id = _chat_id()
+        previous = User(
+            username="bind_previous", password="x", telegram_chat_id=chat_id
+        )
+        user = User(username="bind_user", password="x")
+        await uow.users.create(previous)
+        await uow.users.create(user)
+        token = await uow.telegram.set_telegram_token(user.id)
+
+        binding = await uow.telegram.get_chat_binding(chat_id, token)
+
+        assert binding.user_id == user.id
+        assert binding.user_chat_id is None
+        assert binding.chat_owner_id == previous.id
+        assert (await uow.telegram.get_chat_binding(chat_id, None)).user_id is None
+
+    async def test_bind_chat_consumes_token_once(self, uow: UnitOfWork):
+        chat_id = _chat_id()
+        user = User(username="bind_once", password="x")
+        await uow.users.create(user)
+        token = await uow.telegram.set_telegram_token(user.id)
+
+        assert await uow.telegram.bind_chat(token, chat_id, locale="ru") == user.id
+        assert await uow.telegram.bind_chat(token, chat_id) is None
+        assert await uow.telegram.get_chat_id_by_user_id(user.id) == chat_id
+
+
+@pytest.mark.asyncio
+class TestUnitOfWorkMiddleware:
+    async def test_limits_concurrent_handlers(self):
+        middleware = UnitOfWorkMiddleware(session_factory=lambda: None, limit=2)
+        running = peak = 0
+
+        async def handler(event, data):
+            nonlocal running, peak
+            assert isinstance(data["uow"], UnitOfWork)
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await asyncio.gather(*(middleware(handler, None, {}) for _ in range(10)))
+
+        assert peak == 2
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from app.api.modules.users.models import FacebookAuth, User
+from app.database.uow import UnitOfWork
+
+
+def _chat_id() -> int:
+    return random.randint(10**9, 10**12)
+
+
+@pytest.mark.asyncio
+class TestStreamRecipients:
+    async def test_resolves_owner_token_in_one_query(self, uow: UnitOfWork):
+        admin = User(
+            username="recipients_admin",
+            password="x",
+            is_admin=True,
+            telegram_chat_id=_chat_id(),
+            telegram_daily_enabled=True,
+        )
+        await uow.users.create(admin)
+        member = User(
+            username="recipients_member",
+            password="x",
+            ad_account_id="123",
+            created_by_id=admin.id,
+            telegram_chat_id=_chat_id(),
+            telegram_daily_enabled=True,
+            locale="ru",
+        )
+        orphan = User(
+            username="recipients_orphan",
+            password="x",
+            telegram_chat_id=_chat_id(),
+            telegram_daily_enabled=True,
+        )
+        muted = User(
+            username="recipients_muted",
+            password="x",
+            created_by_id=admin.id,
+            telegram_chat_id=_chat_id(),
+        )
+        for u in (member, orphan, muted):
+            await uow.users.create(u)
+        uow.session.add(FacebookAuth(owner_id=admin.id, long_token="admin-token"))
+        await uow.commit()
+
+        recipients = {
+            r.user_id: r async for r in uow.telegram.stream_recipients(daily_only=True)
+        }
+
+        assert recipients[admin.id].access_token == "admin-token"
+        assert recipients[admin.id].is_admin is True
+        assert recipients[member.id].access_token == "admin-token"
+        assert recipients[member.id].chat_id == member.telegram_chat_id
+        assert recipients[member.id].locale == "ru"
+        assert recipients[member.id].ad_account_id == "123"
+        assert recipients[orphan.id].access_token is None
+        assert muted.id not in recipients
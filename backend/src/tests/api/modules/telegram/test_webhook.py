@@ -0,0 +1,97 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from aiogram.methods import SendMessage
+from fastapi import HTTPException
+
+from app.api.modules.telegram.services.bot import TelegramBotService
+from app.api.modules.telegram.services.webhook import TelegramWebhookService
+from app.settings import TelegramConfig
+
+SECRET = "s3cret"
+
+
+class MemoryRedis:
+    def __init__(self):
+        self.keys: set[str] = set()
+
+    async def set(self, name: str, value, nx: bool = False, ex: int | None = None):
+        if nx and name in self.keys:
+            return None
+        self.keys.add(name)
+        return True
+
+
+def make_update(update_id: int) -> dict:
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": 0,
+            "chat": {"id": 1, "type": "private"},
+            "text": "hi",
+        },
+    }
+
+
+@pytest.fixture
+def bot_service() -> TelegramBotService:
+    config = TelegramConfig(
+        bot_token="123:abc",
+        bot_link="https://t.me/x",
+        mode="webhook",
+        webhook_url="https://example.com/api/telegram/webhook",
+        webhook_secret=SECRET,
+    )
+    service = TelegramBotService(config)
+    service.handled = []
+    service.release = asyncio.Event()
+
+    async def feed_update(bot, update):
+        service.handled.append(update.update_id)
+        await service.release.wait()
+
+    service.dp.feed_update = feed_update
+    return service
+
+
+@pytest.mark.asyncio
+class TestTelegramWebhook:
+    async def test_rejects_wrong_secret(self, bot_service):
+        service = TelegramWebhookService(bot_service.config, bot_service, MemoryRedis())
+
+        with pytest.raises(HTTPException) as error:
+            await service.handle("wrong", make_update(1))
+
+        assert error.value.status_code == 403
+
+    async def test_handles_updates_concurrently_once(self, bot_service):
+        service = TelegramWebhookService(bot_service.config, bot_service, MemoryRedis())
+
+        await service.handle(SECRET, make_update(1))
+        await service.handle(SECRET, make_update(2))
+        await service.handle(SECRET, make_update(1))
+        await asyncio.sleep(0)
+
+        # Both handlers are running before either finishes
+        assert bot_service.handled == [1, 2]
+
+        bot_service.release.set()
+        await bot_service.close()
+
+    async def test_sends_replies_returned_by_handlers(self, bot_service):
+        service = TelegramWebhookService(bot_service.config, bot_service, MemoryRedis())
+        reply = SendMessage(chat_id=1, text="hello")
+
+        async def feed_update(bot, update):
+            return reply
+
+        bot_service.dp.feed_update = feed_update
+        bot_service.bot.session.make_request = AsyncMock()
+
+        await service.handle(SECRET, make_update(1))
+        await bot_service.close()
+
+        bot_service.bot.session.make_request.assert_awaited_once()
+        assert bot_service.bot.session.make_request.await_args.args[1] is reply
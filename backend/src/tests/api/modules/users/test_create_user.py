@@ -1,6 +1,25 @@
+import bcrypt
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
 
+from app.api.modules.users.models import User
+from app.database.uow import UnitOfWork
+
+
+@pytest_asyncio.fixture
+async def admin_headers(client: AsyncClient, uow: UnitOfWork) -> dict:
+    password = bcrypt.hashpw(b"admin123", bcrypt.gensalt(rounds=4)).decode()
+    await uow.users.create(
+        User(username="create_admin", password=password, is_admin=True)
+    )
+    await uow.commit()
+    resp = await client.post(
+        "/auth/login", json={"username": "create_admin", "password": "admin123"}
+    )
+    assert resp.status_code == 200
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
 
 @pytest.mark.asyncio
 class TestCreateUser:
@@ -47,3 +66,20 @@ class TestCreateUser:
         resp = await client.post(self.endpoint, json=payload)
 
         assert resp.status_code == 422
+
+    async def test_create_user_duplicate_username(
+        self,
+        client: AsyncClient,
+        admin_headers: dict,
+    ):
+        payload = {
+            "username": "duplicate_user",
+            "password": "testpass123",
+        }
+
+        first = await client.post(self.endpoint, json=payload, headers=admin_headers)
+        second = await client.post(self.endpoint, json=payload, headers=admin_headers)
+
+        assert first.status_code == 201
+        assert second.status_code == 409
+        assert second.json()["detail"] == "Username already exists"
@@ -45,3 +45,25 @@ class TestGetUserById:
         resp = await client.get(f"{self.endpoint}/{user.id}")
 
         assert resp.status_code == 401
+
+    async def test_get_user_by_id_not_modified(
+        self,
+        client: AsyncClient,
+        authenticated_user: dict,
+        user,
+    ):
+        access_token = authenticated_user["access_token"]
+        headers = {"Authorization": f"Bearer {access_token}"}
+
+        first = await client.get(f"{self.endpoint}/{user.id}", headers=headers)
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "private, no-cache"
+
+        resp = await client.get(
+            f"{self.endpoint}/{user.id}",
+            headers={**headers, "If-None-Match": etag},
+        )
+
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["etag"] == etag
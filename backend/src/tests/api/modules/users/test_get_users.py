@@ -1,6 +1,13 @@
+import uuid
+
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
 
+from app.api.common.utils import encode_cursor
+from app.api.modules.users.models import User
+from app.database.uow import UnitOfWork
+
 
 @pytest.mark.asyncio
 class TestGetUsers:
@@ -32,3 +39,141 @@ class TestGetUsers:
         resp = await client.get(self.endpoint, params={"page": 1, "page_size": 10})
 
         assert resp.status_code == 401
+
+
+@pytest.mark.asyncio
+class TestGetUsersKeyset:
+    endpoint = "/users"
+
+    @pytest_asyncio.fixture
+    async def keyset_users(self, uow: UnitOfWork) -> list[User]:
+        users = []
+        for i in range(5):
+            user = User(username=f"keyset_user_{uuid.uuid4().hex}_{i}", password="x")
+            await uow.users.create(user)
+            users.append(user)
+        await uow.commit()
+        return users
+
+    async def test_cursor_walks_all_pages(
+        self,
+        client: AsyncClient,
+        authenticated_user: dict,
+        keyset_users: list[User],
+    ):
+        headers = {"Authorization": f"Bearer {authenticated_user['access_token']}"}
+        params = {"page_size": 2, "username__search": "keyset_user_"}
+
+        resp = await client.get(self.endpoint, headers=headers, params=params)
+        assert resp.status_code == 200
+        data = resp.json()
+        seen = [item["id"] for item in data["items"]]
+        assert data["page"] == 1
+        assert data["has_next"] is True
+
+        while data["next_cursor"]:
+            resp = await client.get(
+                self.endpoint,
+                headers=headers,
+                params={**params, "cursor": data["next_cursor"]},
+            )
+            assert resp.status_code == 200
+            data = resp.json()
+            assert data["page"] is None
+            assert data["total"] is None
+            seen.extend(item["id"] for item in data["items"])
+
+        expected = sorted(str(u.id) for u in keyset_users)
+        assert [i for i in seen if i in expected] == expected
+        assert data["has_next"] is False
+
+    async def test_cursor_with_exact_total(
+        self,
+        client: AsyncClient,
+        authenticated_user: dict,
+        keyset_users: list[User],
+    ):
+        headers = {"Authorization": f"Bearer {authenticated_user['access_token']}"}
+        first = await client.get(
+            self.endpoint,
+            headers=headers,
+            params={"page_size": 1, "username__search": keyset_users[0].username},
+        )
+        cursor = encode_cursor(uuid.UUID(int=0))
+
+        resp = await client.get(
+            self.endpoint,
+            headers=headers,
+            params={
+                "cursor": cursor,
+                "include_total": True,
+                "username__search": keyset_users[0].username,
+            },
+        )
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"] == first.json()["total"] == 1
+        assert data["total_is_estimate"] is False
+        assert data["items"][0]["id"] == str(keyset_users[0].id)
+
+    async def test_invalid_cursor(
+        self,
+        client: AsyncClient,
+        authenticated_user: dict,
+    ):
+        headers = {"Authorization": f"Bearer {authenticated_user['access_token']}"}
+
+        resp = await client.get(
+            self.endpoint, headers=headers, params={"cursor": "not-a-cursor"}
+        )
+
+        assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+class TestGetUsersSearch:
+    endpoint = "/users"
+
+    async def test_prefix_matches_first_across_cursor_pages(
+        self,
+        client: AsyncClient,
+        authenticated_user: dict,
+        uow: UnitOfWork,
+    ):
+        tag = uuid.uuid4().hex[:8]
+        names = [f"a_{tag}_1", f"b_{tag}_2", f"{tag}_3", f"{tag}_4"]
+        for name in names:
+            await uow.users.create(User(username=name, password="x"))
+        await uow.commit()
+        headers = {"Authorization": f"Bearer {authenticated_user['access_token']}"}
+        params = {"page_size": 1, "username__search": tag}
+
+        resp = await client.get(self.endpoint, headers=headers, params=params)
+        data = resp.json()
+        seen = [item["username"] for item in data["items"]]
+        while data["next_cursor"]:
+            resp = await client.get(
+                self.endpoint,
+                headers=headers,
+                params={**params, "cursor": data["next_cursor"]},
+            )
+            data = resp.json()
+            seen.extend(item["username"] for item in data["items"])
+
+        assert sorted(seen[:2]) == [f"{tag}_3", f"{tag}_4"]
+        assert sorted(seen[2:]) == [f"a_{tag}_1", f"b_{tag}_2"]
+
+    async def test_search_escapes_wildcards(
+        self,
+        client: AsyncClient,
+        authenticated_user: dict,
+    ):
+        headers = {"Authorization": f"Bearer {authenticated_user['access_token']}"}
+
+        resp = await client.get(
+            self.endpoint, headers=headers, params={"username__search": "%"}
+        )
+
+        assert resp.status_code == 200
+        assert resp.json()["items"] == []
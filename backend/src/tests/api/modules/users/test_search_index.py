@@ -0,0 +1,30 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.api.common.utils import build_filters, search_rank
+from app.api.modules.users.models import User
+from tests.fixtures.core.postgres import explain_index_scans
+
+
+@pytest.mark.asyncio
+class TestUsernameSearchIndex:
+    # md5 fragment: matches a handful of the seeded rows, not all of them
+    search = "abc12"
+
+    def _search_stmt(self):
+        filters = build_filters(User, {"username__search": self.search})
+        return (
+            select(User)
+            .where(*filters)
+            .order_by(search_rank(User.username, self.search), User.id)
+            .limit(20)
+        )
+
+    async def test_search_uses_trigram_index(
+        self, pg_engine: AsyncEngine, seeded_users_100k: int
+    ):
+        async with pg_engine.connect() as conn:
+            scans = await explain_index_scans(conn, self._search_stmt())
+
+        assert "Bitmap Index Scan on users_username_trgm_idx" in scans
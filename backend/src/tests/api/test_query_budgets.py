@@ -0,0 +1,127 @@
+import random
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from aiogram import Dispatcher
+from httpx import AsyncClient
+
+from app.api.modules.telegram.services.broadcast import TelegramBroadcastService
+from app.api.modules.telegram.services.handlers.start import register_start_handler
+from app.api.modules.users.models import FacebookAuth, User
+from app.clients.facebook import FacebookClient
+from app.clients.graph_simulator import GraphSimulator
+from app.database.uow import UnitOfWork
+from app.settings import FacebookConfig, GraphSimulatorConfig
+from tests.fixtures.core.queries import QueryBudget
+
+
+def _chat_id() -> int:
+    return random.randint(10**9, 10**12)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("path", "budget"),
+    [
+        # Authentication loads the user, listing counts and fetches a page
+        ("/users?limit=10", 3),
+        ("/users/{user_id}", 2),
+        ("/telegram/chat_id", 2),
+        ("/telegram/register", 2),
+    ],
+)
+async def test_query_budgets(
+    client: AsyncClient,
+    authenticated_user: dict,
+    user,
+    query_budget: QueryBudget,
+    path: str,
+    budget: int,
+):
+    headers = {"Authorization": f"Bearer {authenticated_user['access_token']}"}
+
+    with query_budget(budget):
+        resp = await client.get(path.format(user_id=user.id), headers=headers)
+
+    assert resp.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_stats_headers_in_dev(
+    client: AsyncClient, authenticated_user: dict, user
+):
+    headers = {"Authorization": f"Bearer {authenticated_user['access_token']}"}
+
+    resp = await client.get(f"/users/{user.id}", headers=headers)
+
+    assert resp.headers["X-DB-Queries"] == "2"
+    assert float(resp.headers["X-DB-Time-Ms"]) > 0
+    assert resp.headers["X-DB-Slowest-Query"].startswith("SELECT ")
+
+
+@pytest.mark.asyncio
+async def test_start_binding_budget(uow: UnitOfWork, query_budget: QueryBudget):
+    dp = Dispatcher()
+    register_start_handler(dp)
+    (start_handler,) = dp.message.handlers
+    user = User(username="budget_start", password="x")
+    await uow.users.create(user)
+    token = await uow.telegram.set_telegram_token(user.id)
+    await uow.commit()
+    message = SimpleNamespace(
+        chat=SimpleNamespace(id=_chat_id()),
+        from_user=SimpleNamespace(language_code="uk", username="budget"),
+        text=f"/start {token}_ua",
+        answer=MagicMock(),
+    )
+
+    # Finding token owner and chat owner, then binding in one UPDATE
+    with query_budget(2):
+        reply = await start_handler.callback(message, uow)
+
+    assert reply is message.answer.return_value
+    assert await uow.telegram.get_chat_id_by_user_id(user.id) == message.chat.id
+
+
+@pytest.mark.asyncio
+async def test_daily_reports_budget(uow: UnitOfWork, query_budget: QueryBudget):
+    admin = User(
+        username="budget_daily_admin",
+        password="x",
+        is_admin=True,
+        telegram_chat_id=_chat_id(),
+        telegram_daily_enabled=True,
+    )
+    await uow.users.create(admin)
+    for i in range(5):
+        await uow.users.create(
+            User(
+                username=f"budget_daily_{i}",
+                password="x",
+                ad_account_id="10000",
+                created_by_id=admin.id,
+                telegram_chat_id=_chat_id(),
+                telegram_daily_enabled=True,
+            )
+        )
+    uow.session.add(FacebookAuth(owner_id=admin.id, long_token="token"))
+    await uow.commit()
+    simulator = GraphSimulator(GraphSimulatorConfig(campaigns=5))
+    http = httpx.AsyncClient(mounts={"simulator://": simulator.transport()})
+    config = FacebookConfig(app_id="x", app_secret="x", base_url="simulator://graph")
+    bot = SimpleNamespace(send_message=AsyncMock())
+    service = TelegramBroadcastService(
+        bot=bot,
+        fb_client=FacebookClient(http, config),
+        user_gw=uow.users,
+        fb_auth_gw=uow.facebook_auth,
+        telegram_gw=uow.telegram,
+    )
+
+    # Recipients and their owners' tokens in one query, however many there are
+    with query_budget(1):
+        await service.send_daily_reports()
+
+    assert bot.send_message.await_count >= 6
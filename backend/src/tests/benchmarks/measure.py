@@ -0,0 +1,120 @@
+"""Measurement and baseline comparison for the offline benchmarks.
+
+Each scenario runs against a ``GraphSimulator`` ``ROUNDS`` times untraced, keeping
+the best wall time, then once under ``tracemalloc`` with a low gen-0 GC
+threshold for peak memory and allocations (both slow the run down). The
+simulator runs in-process, so wall time includes generating its responses;
+compare runs from the same machine only.
+"""
+
+import gc
+import json
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from app.clients.graph_simulator import GraphSimulator
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+ROUNDS = 3
+
+# Gen-0 GC threshold while counting: allocations are measured in these steps
+ALLOCATION_STEP = 32
+
+# Differences below these are noise, whatever the relative change
+ABSOLUTE_SLACK = {
+    "wall_time_s": 0.005,
+    "peak_memory_bytes": 256 * 1024,
+    "allocations": 1000,
+}
+# Deterministic for a given simulator seed: any increase is a regression
+EXACT_METRICS = {"graph_calls"}
+
+
+@dataclass(frozen=True, slots=True)
+class Measurement:
+    wall_time_s: float
+    graph_calls: int
+    peak_memory_bytes: int
+    # GC-tracked allocations net of frees, counted in gen-0 collections
+    allocations: int
+
+
+def _gen0_collections() -> int:
+    return gc.get_stats()[0]["collections"]
+
+
+async def measure(
+    run: Callable[[], Awaitable[Any]], simulator: GraphSimulator
+) -> Measurement:
+    wall_time = float("inf")
+    for _ in range(ROUNDS):
+        gc.collect()
+        simulator.reset_stats()
+        started = time.perf_counter()
+        await run()
+        wall_time = min(wall_time, time.perf_counter() - started)
+    graph_calls = sum(simulator.calls.values())
+
+    gc.collect()
+    thresholds = gc.get_threshold()
+    gc.set_threshold(ALLOCATION_STEP, *thresholds[1:])
+    collections = _gen0_collections()
+    tracemalloc.start()
+    try:
+        await run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        gc.set_threshold(*thresholds)
+    allocations = (_gen0_collections() - collections) * ALLOCATION_STEP
+
+    return Measurement(
+        wall_time_s=round(wall_time, 4),
+        graph_calls=graph_calls,
+        peak_memory_bytes=peak,
+        allocations=allocations,
+    )
+
+
+class Baseline:
+    """Results of one session, checked against and optionally saved to JSON."""
+
+    def __init__(self, path: Path, tolerance: float, compare: bool, save: bool):
+        self.path = path
+        self.tolerance = tolerance
+        self.compare = compare
+        self.save = save
+        self.recorded: dict[str, dict[str, float]] = (
+            json.loads(path.read_text()) if path.exists() else {}
+        )
+        self.results: dict[str, dict[str, float]] = {}
+
+    def check(self, name: str, measurement: Measurement) -> list[str]:
+        """Record a measurement; with ``compare``, list metrics over tolerance."""
+        current = asdict(measurement)
+        self.results[name] = current
+        baseline = self.recorded.get(name)
+        if not self.compare or baseline is None:
+            return []
+
+        regressions = []
+        for metric, value in current.items():
+            if metric in EXACT_METRICS:
+                limit = baseline[metric]
+            else:
+                limit = max(
+                    baseline[metric] * (1 + self.tolerance),
+                    baseline[metric] + ABSOLUTE_SLACK[metric],
+                )
+            if value > limit:
+                regressions.append(f"{name} {metric}: {value} > {limit}")
+        return regressions
+
+    def write(self) -> None:
+        merged = {**self.recorded, **self.results}
+        self.path.write_text(json.dumps(dict(sorted(merged.items())), indent=2) + "\n")
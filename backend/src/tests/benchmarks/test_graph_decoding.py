@@ -0,0 +1,113 @@
+"""Time and memory to decode a Graph page of ads and encode the API response.
+
+Timings are only checked against a saved baseline, like the other offline
+benchmarks:
+
+    pytest src/tests/benchmarks/test_graph_decoding.py --benchmark-save
+    pytest src/tests/benchmarks/test_graph_decoding.py --benchmark-compare
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from pydantic import TypeAdapter
+
+from app.api.modules.facebook.schema import AdResponse
+from app.clients import base
+from app.clients.base import json_loads
+from app.clients.graph_simulator import GraphSimulator
+from app.settings import GraphSimulatorConfig
+from tests.benchmarks.measure import Baseline, measure
+
+ENTITIES = 1000
+
+ADS_ADAPTER = TypeAdapter(list[AdResponse])
+
+
+def make_ads_page(count: int) -> bytes:
+    return json.dumps(
+        {
+            "data": [
+                {
+                    "id": str(120200000000000 + i),
+                    "name": f"Ad {i}",
+                    "status": "ACTIVE",
+                    "creative": {
+                        "id": str(990000 + i),
+                        "thumbnail_url": f"https://scontent.example/{i}.jpg",
+                        "body": "Spring sale " * 8,
+                        "title": f"Creative {i}",
+                        "link_url": "https://example.com/landing",
+                    },
+                    "insights": {
+                        "spend": "12.34",
+                        "impressions": "1520",
+                        "clicks": "37",
+                        "cpc": "0.333514",
+                        "cpm": "8.118421",
+                        "ctr": "2.434211",
+                        "reach": "1301",
+                        "conversations": "4",
+                    },
+                }
+                for i in range(count)
+            ],
+            "paging": {"cursors": {"before": "MAZDZD", "after": "MjQZD"}},
+        }
+    ).encode()
+
+
+def to_ad(item: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "ad_id": item["id"],
+        "ad_name": item.get("name"),
+        "status": item.get("status"),
+        "creative": item.get("creative", {}),
+        "insights": item["insights"],
+    }
+
+
+def stdlib_pipeline(page: bytes) -> bytes:
+    items = json.loads(page)["data"]
+    ads = [AdResponse(**to_ad(dict(item))) for item in items]
+    return ADS_ADAPTER.dump_json(ads)
+
+
+def fast_pipeline(page: bytes) -> bytes:
+    items = json_loads(page)["data"]
+    ads = [AdResponse.model_validate(to_ad(item)) for item in items]
+    return ADS_ADAPTER.dump_json(ads)
+
+
+PIPELINES: dict[str, Callable[[bytes], bytes]] = {
+    "stdlib": stdlib_pipeline,
+    "orjson": fast_pipeline,
+}
+
+
+@pytest.mark.skipif(base.orjson is None, reason="orjson is not installed")
+class TestGraphDecodingBenchmark:
+    def test_pipelines_agree(self):
+        page = make_ads_page(ENTITIES)
+
+        assert fast_pipeline(page) == stdlib_pipeline(page)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("pipeline", PIPELINES)
+    async def test_decode_ads(self, pipeline: str, benchmark_baseline: Baseline):
+        page = make_ads_page(ENTITIES)
+        # No Graph calls: measure() only needs it for its call counter
+        simulator = GraphSimulator(GraphSimulatorConfig())
+
+        async def run() -> None:
+            PIPELINES[pipeline](page)
+
+        result = await measure(run, simulator)
+
+        assert result.graph_calls == 0
+        regressions = benchmark_baseline.check(
+            f"decode_ads_{pipeline}[{ENTITIES}]", result
+        )
+        assert not regressions, "\n".join(regressions)
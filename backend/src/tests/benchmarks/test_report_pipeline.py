@@ -0,0 +1,189 @@
+"""Offline benchmarks of the Facebook client and the Telegram report pipeline.
+
+Timings depend on the machine, so the baseline is local: save it on the base
+commit, then compare the change against it on the same machine.
+
+    pytest src/tests/benchmarks -s                       # quick sizes, printed
+    pytest src/tests/benchmarks --benchmark-full --benchmark-save
+    pytest src/tests/benchmarks --benchmark-full --benchmark-compare
+"""
+
+import uuid
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+
+from app.api.modules.telegram.gateway import TelegramRecipient
+from app.api.modules.telegram.services.broadcast import (
+    REPORT_FIELDS,
+    TelegramBroadcastService,
+    _build_time_range,
+    _format_admin_report,
+)
+from app.clients.facebook import FacebookClient
+from app.clients.graph_simulator import GraphSimulator
+from app.settings import FacebookConfig, GraphSimulatorConfig
+from tests.benchmarks.measure import ROUNDS, Baseline, Measurement, measure
+
+TIME_RANGE = _build_time_range("yesterday")
+
+# accounts x campaigns per account
+QUICK_SIZES = [(1, 10), (10, 100), (1, 1000)]
+FULL_SIZES = QUICK_SIZES + [
+    (1, 5000),
+    (10, 1000),
+    (100, 10),
+    (100, 100),
+    (10, 5000),
+    (100, 1000),
+]
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "size" in metafunc.fixturenames:
+        full = metafunc.config.getoption("--benchmark-full")
+        sizes = FULL_SIZES if full else QUICK_SIZES
+        metafunc.parametrize("size", sizes, ids=[f"{a}x{c}" for a, c in sizes])
+
+
+class RecordingBot:
+    def __init__(self):
+        self.sent: list[str] = []
+
+    async def send_message(self, chat_id: int, text: str, parse_mode: str) -> None:
+        self.sent.append(text)
+
+
+class AdminRecipients:
+    """Stands in for TelegramGateway: one daily admin recipient, no database."""
+
+    async def stream_recipients(
+        self, daily_only: bool = False
+    ) -> AsyncIterator[TelegramRecipient]:
+        yield TelegramRecipient(
+            user_id=uuid.uuid4(),
+            chat_id=1,
+            locale="ua",
+            is_admin=True,
+            ad_account_id=None,
+            access_token="token",
+        )
+
+
+def _simulator(accounts: int, campaigns: int, **config) -> GraphSimulator:
+    # No usage throttling: the biggest sizes exceed the default call budget
+    return GraphSimulator(
+        GraphSimulatorConfig(
+            accounts=accounts, campaigns=campaigns, usage_limit=10**9, **config
+        )
+    )
+
+
+def _client(simulator: GraphSimulator) -> FacebookClient:
+    http = httpx.AsyncClient(mounts={"simulator://": simulator.transport()})
+    config = FacebookConfig(app_id="x", app_secret="x", base_url="simulator://graph")
+    return FacebookClient(http, config)
+
+
+def _report(baseline: Baseline, name: str, measurement: Measurement) -> None:
+    print(
+        f"\n{name}: {measurement.wall_time_s * 1000:.1f} ms, "
+        f"{measurement.graph_calls} Graph calls, "
+        f"peak {measurement.peak_memory_bytes / 2**20:.1f} MiB, "
+        f"~{measurement.allocations} allocations"
+    )
+    regressions = baseline.check(name, measurement)
+    assert not regressions, "\n".join(regressions)
+
+
+@pytest.mark.asyncio
+class TestReportPipelineBenchmark:
+    async def test_fetch_campaigns(
+        self, size: tuple[int, int], benchmark_baseline: Baseline
+    ):
+        accounts, campaigns = size
+        simulator = _simulator(accounts, campaigns)
+        client = _client(simulator)
+        fetched: list[int] = []
+
+        async def run() -> None:
+            fetched.clear()
+            for account in await client.get_ad_accounts("token"):
+                rows = await client.get_campaigns(
+                    account["account_id"], "token", TIME_RANGE, fields=REPORT_FIELDS
+                )
+                fetched.append(len(rows))
+
+        result = await measure(run, simulator)
+
+        assert len(fetched) == accounts
+        assert sum(fetched) > 0
+        _report(benchmark_baseline, f"fetch_campaigns[{accounts}x{campaigns}]", result)
+
+    async def test_format_admin_report(
+        self, size: tuple[int, int], benchmark_baseline: Baseline
+    ):
+        accounts, campaigns = size
+        simulator = _simulator(accounts, campaigns)
+        client = _client(simulator)
+        data = [
+            {
+                "name": account["name"],
+                "currency": account["currency"],
+                "campaigns": await client.get_campaigns(
+                    account["account_id"], "token", TIME_RANGE, fields=REPORT_FIELDS
+                ),
+            }
+            for account in await client.get_ad_accounts("token")
+        ]
+
+        async def run() -> None:
+            _format_admin_report(data, "yesterday", TIME_RANGE)
+
+        result = await measure(run, simulator)
+
+        assert result.graph_calls == 0
+        _report(
+            benchmark_baseline, f"format_admin_report[{accounts}x{campaigns}]", result
+        )
+
+    async def test_send_daily_reports(
+        self, size: tuple[int, int], benchmark_baseline: Baseline
+    ):
+        accounts, campaigns = size
+        simulator = _simulator(accounts, campaigns)
+        bot = RecordingBot()
+        service = TelegramBroadcastService(
+            bot=bot,
+            fb_client=_client(simulator),
+            user_gw=None,
+            fb_auth_gw=None,
+            telegram_gw=AdminRecipients(),
+        )
+
+        result = await measure(service.send_daily_reports, simulator)
+
+        # One report per timed round plus the traced one
+        assert len(bot.sent) == ROUNDS + 1
+        _report(
+            benchmark_baseline, f"send_daily_reports[{accounts}x{campaigns}]", result
+        )
+
+
+@pytest.mark.asyncio
+class TestDrilldownBenchmark:
+    async def test_adsets_and_ads(self, benchmark_baseline: Baseline):
+        simulator = _simulator(1, 1, adsets_per_campaign=20, ads_per_adset=10)
+        client = _client(simulator)
+        campaign_id = simulator._entity_id((0, 0))
+
+        async def run() -> None:
+            adsets = await client.get_adsets(campaign_id, "10000", "token", TIME_RANGE)
+            for adset in adsets:
+                await client.get_ads(adset["adset_id"], "token", TIME_RANGE)
+
+        result = await measure(run, simulator)
+
+        assert result.graph_calls > 20
+        _report(benchmark_baseline, "adsets_and_ads[1x20x10]", result)
@@ -0,0 +1,94 @@
+import httpx
+import pytest
+
+from app.clients.facebook import FacebookClient, GraphFields
+from app.settings import FacebookConfig
+
+TIME_RANGE = {"since": "2026-01-01", "until": "2026-01-31"}
+
+
+class RecordingGraph:
+    def __init__(self):
+        self.fields: dict[str, str] = {}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.split("/", 2)[2]
+        self.fields[path] = request.url.params.get("fields", "")
+        if path == "adset_1/ads":
+            data = [{"id": "ad_1", "name": "Ad"}]
+        elif path == "act_1/campaigns":
+            data = [{"id": "c_1", "name": "Campaign"}, {"id": "c_2"}]
+        elif path == "act_1/insights":
+            data = [
+                {"campaign_id": "c_1", "spend": "1.5", "impressions": "10"},
+                {"campaign_id": "c_2", "spend": "2", "impressions": "5", "actions": []},
+            ]
+        else:
+            data = [{"spend": "1.5", "impressions": "10", "actions": []}]
+        return httpx.Response(200, json={"data": data})
+
+
+@pytest.mark.asyncio
+class TestGraphFieldProjection:
+    async def _client(self, graph: RecordingGraph) -> FacebookClient:
+        http = httpx.AsyncClient(transport=httpx.MockTransport(graph))
+        return FacebookClient(http, FacebookConfig(app_id="x", app_secret="x"))
+
+    async def test_default_requests_all_fields(self):
+        graph = RecordingGraph()
+        client = await self._client(graph)
+
+        await client.get_ads("adset_1", "token", TIME_RANGE)
+
+        assert "creative{" in graph.fields["adset_1/ads"]
+        assert graph.fields["ad_1/insights"] == client.config.ad_insight_fields
+
+    async def test_projection_builds_minimal_fields(self):
+        graph = RecordingGraph()
+        client = await self._client(graph)
+
+        ads = await client.get_ads(
+            "adset_1",
+            "token",
+            TIME_RANGE,
+            fields=GraphFields.parse("name,clicks,conversations"),
+        )
+
+        assert graph.fields["adset_1/ads"] == "id,name"
+        assert graph.fields["ad_1/insights"] == "spend,impressions,clicks,actions"
+        assert ads[0]["insights"] == {
+            "spend": "1.5",
+            "impressions": "10",
+            "conversations": None,
+        }
+
+    async def test_projection_keeps_insight_identity_fields(self):
+        graph = RecordingGraph()
+        client = await self._client(graph)
+
+        await client.get_campaigns(
+            "1", "token", TIME_RANGE, fields=GraphFields.parse("name,clicks")
+        )
+
+        assert graph.fields["act_1/insights"] == (
+            "campaign_id,campaign_name,spend,impressions,clicks"
+        )
+
+    async def test_listed_and_streamed_campaigns_match(self):
+        client = await self._client(RecordingGraph())
+
+        listed = await client.get_campaigns("1", "token", TIME_RANGE)
+        streamed = [
+            row async for row in client.iter_campaigns("1", "token", TIME_RANGE)
+        ]
+
+        assert sorted(streamed, key=lambda row: row["campaign_id"]) == listed
+        assert "conversations" not in listed[0]["insights"]
+        assert listed[1]["insights"]["conversations"] is None
+
+
+def test_unknown_fields():
+    fields = GraphFields.parse("name,targeting,bogus")
+
+    assert fields.unknown("adset") == {"bogus"}
+    assert fields.unknown("ad") == {"targeting", "bogus"}
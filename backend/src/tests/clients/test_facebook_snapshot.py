@@ -0,0 +1,79 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.clients.facebook import FacebookClient
+from app.settings import FacebookConfig
+
+TIME_RANGE = {"since": "2026-01-01", "until": "2026-01-31"}
+
+ENTITIES = {
+    "act_1/campaigns": [
+        {"id": "c1", "name": "Leads", "status": "ACTIVE"},
+        {"id": "c2", "name": "Idle", "status": "PAUSED"},
+    ],
+    "act_1/adsets": [
+        {"id": "s1", "campaign_id": "c1", "name": "Set 1"},
+        {"id": "s2", "campaign_id": "c1", "name": "Set 2"},
+    ],
+    "act_1/ads": [
+        {"id": "a1", "adset_id": "s1", "name": "Ad 1"},
+        {"id": "a2", "adset_id": "s1", "name": "Ad 2"},
+    ],
+}
+
+INSIGHTS = {
+    "campaign": [
+        {"campaign_id": "c1", "spend": "5", "impressions": "100", "actions": []},
+        {"campaign_id": "c2", "spend": "0", "impressions": "0"},
+    ],
+    "adset": [{"adset_id": "s1", "spend": "5", "impressions": "100"}],
+    "ad": [
+        {"ad_id": "a1", "spend": "3", "impressions": "60"},
+        {"ad_id": "a2", "spend": "2", "impressions": "40"},
+    ],
+}
+
+
+class SlowGraph:
+    """Answers after a delay and records how many requests overlap."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+        path = request.url.path.split("/", 2)[2]
+        if path == "act_1/insights":
+            data = INSIGHTS[request.url.params["level"]]
+        else:
+            data = ENTITIES[path]
+        return httpx.Response(200, json={"data": data})
+
+
+@pytest.mark.asyncio
+class TestAccountSnapshot:
+    async def test_builds_tree_from_concurrent_account_calls(self):
+        graph = SlowGraph()
+        http = httpx.AsyncClient(transport=httpx.MockTransport(graph))
+        client = FacebookClient(http, FacebookConfig(app_id="x", app_secret="x"))
+
+        campaigns = await client.get_account_snapshot("1", "token", TIME_RANGE)
+
+        assert graph.calls == 6
+        assert graph.max_in_flight == 6
+
+        # Idle campaign and the ad set without insights are dropped
+        assert [c["campaign_id"] for c in campaigns] == ["c1"]
+        adsets = campaigns[0]["adsets"]
+        assert [s["adset_id"] for s in adsets] == ["s1"]
+        assert [a["ad_id"] for a in adsets[0]["ads"]] == ["a1", "a2"]
+        assert adsets[0]["ads"][0]["insights"] == {"spend": "3", "impressions": "60"}
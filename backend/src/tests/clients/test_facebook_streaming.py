@@ -0,0 +1,59 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.clients.facebook import FacebookClient
+from app.settings import FacebookConfig
+
+TIME_RANGE = {"since": "2026-01-01", "until": "2026-01-31"}
+NEXT_PAGE = "https://graph.facebook.com/v24.0/act_1/campaigns?after=p2"
+
+
+class GatedGraph:
+    """Holds the second campaigns page until ``release`` is set."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.split("/", 2)[2]
+        if path == "act_1/insights":
+            data = [
+                {"campaign_id": cid, "spend": "1", "impressions": "10"}
+                for cid in ("c1", "c2")
+            ]
+            return httpx.Response(200, json={"data": data})
+        if request.url.params.get("after") == "p2":
+            await self.release.wait()
+            return httpx.Response(200, json={"data": [{"id": "c2"}]})
+        return httpx.Response(
+            200, json={"data": [{"id": "c1"}], "paging": {"next": NEXT_PAGE}}
+        )
+
+
+@pytest.mark.asyncio
+class TestFacebookStreaming:
+    async def test_yields_before_pagination_finishes(self):
+        graph = GatedGraph()
+        http = httpx.AsyncClient(transport=httpx.MockTransport(graph))
+        client = FacebookClient(http, FacebookConfig(app_id="x", app_secret="x"))
+
+        campaigns = client.iter_campaigns("1", "token", TIME_RANGE)
+        first = await asyncio.wait_for(anext(campaigns), timeout=1)
+        assert first["campaign_id"] == "c1"
+
+        graph.release.set()
+        rest = [c["campaign_id"] async for c in campaigns]
+        assert rest == ["c2"]
+
+    async def test_closing_stream_cancels_pending_requests(self):
+        graph = GatedGraph()
+        http = httpx.AsyncClient(transport=httpx.MockTransport(graph))
+        client = FacebookClient(http, FacebookConfig(app_id="x", app_secret="x"))
+
+        campaigns = client.iter_campaigns("1", "token", TIME_RANGE)
+        await anext(campaigns)
+        await asyncio.wait_for(campaigns.aclose(), timeout=1)
+
+        assert not graph.release.is_set()
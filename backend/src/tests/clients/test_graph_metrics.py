@@ -0,0 +1,72 @@
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from app.clients.facebook import FacebookAPIError, FacebookClient
+from app.clients.graph_simulator import GraphSimulator
+from app.clients.metrics import graph_endpoint
+from app.settings import FacebookConfig, GraphSimulatorConfig
+
+TIME_RANGE = {"since": "2026-01-01", "until": "2026-01-31"}
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def _client(simulator: GraphSimulator) -> FacebookClient:
+    http = httpx.AsyncClient(mounts={"simulator://": simulator.transport()})
+    config = FacebookConfig(app_id="x", app_secret="x", base_url="simulator://graph")
+    return FacebookClient(http, config)
+
+
+@pytest.mark.parametrize(
+    ("url", "endpoint"),
+    [
+        ("simulator://graph/v24.0/me/adaccounts", "accounts"),
+        ("https://graph.facebook.com/v24.0/act_10000/insights?after=x", "insights"),
+        ("https://graph.facebook.com/v24.0/2000000001/adsets", "adsets"),
+        ("https://graph.facebook.com/v24.0/oauth/access_token", "oauth"),
+        ("https://graph.facebook.com/v24.0/2000000001", "other"),
+    ],
+)
+def test_endpoint_labels_have_no_ids(url: str, endpoint: str):
+    assert graph_endpoint(url) == endpoint
+
+
+@pytest.mark.asyncio
+class TestGraphMetrics:
+    async def test_pages_bytes_and_usage(self):
+        simulator = GraphSimulator(
+            GraphSimulatorConfig(campaigns=60, page_size=25, active_ratio=1.0)
+        )
+        pages = _sample("graph_pages_per_call_sum", endpoint="campaigns")
+        calls = _sample("graph_requests_total", endpoint="campaigns", status="200")
+        body = _sample("graph_response_bytes_sum", endpoint="campaigns")
+
+        await _client(simulator).get_campaigns("10000", "token", TIME_RANGE, False)
+
+        assert _sample("graph_pages_per_call_sum", endpoint="campaigns") == pages + 3
+        assert (
+            _sample("graph_requests_total", endpoint="campaigns", status="200")
+            == calls + 3
+        )
+        assert _sample("graph_response_bytes_sum", endpoint="campaigns") > body
+        assert _sample("graph_usage_percent", header="app") >= 0
+        assert _sample("graph_requests_in_flight", endpoint="campaigns") == 0
+
+    async def test_error_codes_and_throttling(self):
+        throttled = _sample("graph_rate_limited_total", endpoint="campaigns")
+        errors = _sample("graph_errors_total", endpoint="campaigns", code="80004")
+        client = _client(GraphSimulator(GraphSimulatorConfig(rate_limit_rate=1)))
+
+        with pytest.raises(FacebookAPIError):
+            await client.get_campaigns("10000", "token", TIME_RANGE)
+
+        assert (
+            _sample("graph_rate_limited_total", endpoint="campaigns") >= throttled + 1
+        )
+        assert (
+            _sample("graph_errors_total", endpoint="campaigns", code="80004")
+            >= errors + 1
+        )
@@ -0,0 +1,66 @@
+import httpx
+import pytest
+
+from app.clients.facebook import FacebookAPIError, FacebookClient
+from app.clients.graph_simulator import GraphSimulator, graph_mounts
+from app.settings import FacebookConfig, GraphSimulatorConfig
+
+TIME_RANGE = {"since": "2026-01-01", "until": "2026-01-31"}
+
+
+def _config(**simulator) -> FacebookConfig:
+    return FacebookConfig(
+        app_id="x",
+        app_secret="x",
+        base_url="simulator://graph",
+        simulator=GraphSimulatorConfig(**simulator),
+    )
+
+
+@pytest.mark.asyncio
+class TestGraphSimulator:
+    async def _client(self, simulator: GraphSimulator) -> FacebookClient:
+        http = httpx.AsyncClient(mounts={"simulator://": simulator.transport()})
+        return FacebookClient(http, _config())
+
+    async def test_pages_through_campaigns(self):
+        simulator = GraphSimulator(
+            GraphSimulatorConfig(campaigns=60, page_size=25, active_ratio=1.0)
+        )
+        client = await self._client(simulator)
+
+        campaigns = await client.get_campaigns("10000", "token", TIME_RANGE, False)
+
+        assert len(campaigns) == 60
+        assert simulator.calls["act/campaigns"] == 3
+        assert simulator.calls["act/insights"] == 3
+        assert float(campaigns[0]["insights"]["spend"]) > 0
+
+    async def test_snapshot_is_deterministic(self):
+        first = await (await self._client(GraphSimulator())).get_account_snapshot(
+            "10000", "token", TIME_RANGE
+        )
+        second = await (await self._client(GraphSimulator())).get_account_snapshot(
+            "10000", "token", TIME_RANGE
+        )
+
+        assert first == second
+        assert any(adset["ads"] for c in first for adset in c["adsets"])
+
+    async def test_injected_errors_and_throttling(self):
+        client = await self._client(GraphSimulator(GraphSimulatorConfig(error_rate=1)))
+        with pytest.raises(FacebookAPIError) as error:
+            await client.get_ad_accounts("token")
+        assert error.value.error_code in (1, 2)
+
+        simulator = GraphSimulator(GraphSimulatorConfig(usage_limit=1))
+        client = await self._client(simulator)
+        await client.get_ad_accounts("token")
+        with pytest.raises(FacebookAPIError) as error:
+            await client.get_campaigns("10000", "token", TIME_RANGE)
+        assert error.value.error_code == 80004
+
+
+def test_mounts_only_for_simulator_url():
+    assert graph_mounts(_config())
+    assert graph_mounts(FacebookConfig(app_id="x", app_secret="x")) == {}
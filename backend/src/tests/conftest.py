@@ -14,6 +14,12 @@ _test_config = Config(
 
 app.settings.get_config = lambda: _test_config
 
+# app.database.engine builds its engine on import, which may happen while test
+# modules are collected, before any fixture runs
+app.settings.Config.database_url = property(
+    lambda self: "sqlite+aiosqlite:///file::memory:?cache=shared&uri=true"
+)
+
 _FIXTURES_ROOT = Path(__file__).parent / "fixtures"
 
 # Collect all fixture modules
@@ -0,0 +1,39 @@
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.database.uow import UnitOfWork
+
+
+class CountingFactory:
+    def __init__(self, engine: AsyncEngine):
+        self._factory = async_sessionmaker(engine, expire_on_commit=False)
+        self.calls = 0
+
+    def __call__(self) -> AsyncSession:
+        self.calls += 1
+        return self._factory()
+
+
+@pytest.mark.asyncio
+class TestLazyUnitOfWork:
+    async def test_untouched_uow_never_opens_a_session(self, engine: AsyncEngine):
+        factory = CountingFactory(engine)
+
+        async with UnitOfWork(session_factory=factory) as uow:
+            await uow.commit()
+            await uow.rollback()
+
+        assert factory.calls == 0
+        assert uow.is_active is False
+
+    async def test_session_opened_once_on_first_gateway_use(self, engine: AsyncEngine):
+        factory = CountingFactory(engine)
+
+        async with UnitOfWork(session_factory=factory) as uow:
+            await uow.users.get_by_username("lazy-uow-missing")
+            await uow.facebook_auth.get_by_owner(uuid.uuid4())
+            assert uow.users.session is uow.telegram.session
+
+        assert factory.calls == 1
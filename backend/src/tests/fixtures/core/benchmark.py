@@ -0,0 +1,44 @@
+import pytest
+
+from tests.benchmarks.measure import BASELINE_PATH, Baseline
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("benchmarks", "offline benchmarks (src/tests/benchmarks)")
+    group.addoption(
+        "--benchmark-full",
+        action="store_true",
+        help="run the whole accounts x campaigns grid, not only the quick sizes",
+    )
+    group.addoption(
+        "--benchmark-save",
+        action="store_true",
+        help="write this run's measurements to the JSON baseline",
+    )
+    group.addoption(
+        "--benchmark-compare",
+        action="store_true",
+        help="fail benchmarks that regress beyond the tolerance of the baseline",
+    )
+    group.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=0.5,
+        help=(
+            "allowed relative regression of time, memory and allocations in "
+            "compare mode (default 0.5); Graph calls must not grow at all"
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def benchmark_baseline(request: pytest.FixtureRequest) -> Baseline:
+    baseline = Baseline(
+        BASELINE_PATH,
+        tolerance=request.config.getoption("--benchmark-tolerance"),
+        compare=request.config.getoption("--benchmark-compare"),
+        save=request.config.getoption("--benchmark-save"),
+    )
+    yield baseline
+    if baseline.save:
+        baseline.write()
@@ -0,0 +1,27 @@
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+
+import pytest
+
+from app.database.instrumentation import QueryStats, track_queries
+
+QueryBudget = Callable[[int], AbstractContextManager[QueryStats]]
+
+
+@pytest.fixture
+def query_budget() -> QueryBudget:
+    """Fail if the block runs more SQL statements than allowed.
+
+    with query_budget(2):
+        await client.get("/users/...")
+    """
+
+    @contextmanager
+    def budget(max_queries: int) -> Iterator[QueryStats]:
+        with track_queries() as stats:
+            yield stats
+        assert stats.count <= max_queries, (
+            f"{stats.count} queries over a budget of {max_queries}; {stats.summary()}"
+        )
+
+    return budget
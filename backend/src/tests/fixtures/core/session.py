@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engin
 from sqlalchemy.pool import StaticPool
 
 from app.database.base import Base
+from app.database.instrumentation import instrument_engine
 from app.database.uow import UnitOfWork
 
 SHARED_DSN = "sqlite+aiosqlite:///file::memory:?cache=shared&uri=true"
@@ -33,6 +34,9 @@ async def engine(override_database_in_settings) -> AsyncEngine:
     def _enable_sqlite_fks(dbapi_conn, _) -> None:
         dbapi_conn.execute("PRAGMA foreign_keys = ON")
 
+    # Statements through the ``uow`` fixture count against query budgets too
+    instrument_engine(test_engine.sync_engine)
+
     async def _prepare() -> None:
         async with test_engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
@@ -0,0 +1,30 @@
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+SEEDED_USERS_COUNT = 100_000
+SEEDED_USERNAME_PREFIX = "bench_user_"
+
+
+@pytest_asyncio.fixture(scope="session")
+async def seeded_users_100k(pg_engine: AsyncEngine) -> int:
+    """Seed ``users`` with 100k synthetic rows for planner/timing benchmarks."""
+    async with pg_engine.begin() as conn:
+        await conn.execute(
+            text(
+                "INSERT INTO users (id, username, password, is_active, is_admin, "
+                "telegram_daily_enabled) "
+                "SELECT gen_random_uuid(), :prefix || md5(i::text), 'x', true, "
+                "false, false FROM generate_series(1, :count) AS i"
+            ),
+            {"prefix": SEEDED_USERNAME_PREFIX, "count": SEEDED_USERS_COUNT},
+        )
+        await conn.execute(text("ANALYZE users"))
+
+    yield SEEDED_USERS_COUNT
+
+    async with pg_engine.begin() as conn:
+        await conn.execute(
+            text("DELETE FROM users WHERE username LIKE :prefix || '%'"),
+            {"prefix": SEEDED_USERNAME_PREFIX},
+        )
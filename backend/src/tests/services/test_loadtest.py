@@ -0,0 +1,105 @@
+import httpx
+import pytest
+
+from app.api.modules.users.models import User
+from app.database.uow import UnitOfWork
+from app.services.loadtest import (
+    LoadTest,
+    RouteStats,
+    create_loadtest_user,
+    delete_loadtest_user,
+)
+from app.settings import LoadTestConfig, RouteSLO
+
+
+def _fake_api(request: httpx.Request) -> httpx.Response:
+    match request.url.path.split("/")[1:]:
+        case ["auth", "login"]:
+            return httpx.Response(200, json={"access_token": "token"})
+        case ["facebook", "auth", "exchange-token"]:
+            return httpx.Response(204)
+        case ["facebook", "ad-accounts"]:
+            return httpx.Response(200, json=[{"account_id": "1"}, {"account_id": "2"}])
+        case ["facebook", "ad-accounts", _, "campaigns"]:
+            return httpx.Response(200, json=[{"campaign_id": "c1"}])
+        case ["users"]:
+            return httpx.Response(503)
+    return httpx.Response(404)
+
+
+def _load_test(mix: dict[str, float]) -> LoadTest:
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(_fake_api), base_url="http://test"
+    )
+    config = LoadTestConfig(
+        mix=mix,
+        default_slo=RouteSLO(p95_ms=10_000, p99_ms=10_000),
+        slos={"GET /users": RouteSLO(p95_ms=10_000, p99_ms=10_000)},
+    )
+    return LoadTest(client, config, "loadtest", "loadtest", seed=1)
+
+
+def test_percentiles_use_nearest_rank():
+    stats = RouteStats(latencies=[i / 1000 for i in range(1, 101)])
+
+    assert stats.percentile(50) == pytest.approx(50)
+    assert stats.percentile(95) == pytest.approx(95)
+    assert stats.percentile(99) == pytest.approx(99)
+    assert RouteStats(latencies=[0.2]).percentile(99) == pytest.approx(200)
+
+
+@pytest.mark.asyncio
+class TestLoadTest:
+    async def test_routes_aggregate_by_template(self):
+        test = _load_test({"campaigns": 1})
+
+        await test.setup()
+        report = await test.run(duration=0.05, concurrency=2)
+
+        assert [r.route for r in report.routes] == [
+            "GET /facebook/ad-accounts/{account_id}/campaigns"
+        ]
+        assert report.passed
+        assert report.total_requests > 0
+
+    async def test_error_rate_violates_slo(self):
+        test = _load_test({"users": 1})
+
+        await test.setup()
+        report = await test.run(duration=0.05, concurrency=1)
+
+        (users,) = report.routes
+        assert users.error_rate == 1.0
+        assert users.statuses == {503: users.count}
+        assert users.violations == ["errors 100.00% > 1.00%"]
+        assert not report.passed
+
+
+@pytest.mark.asyncio
+async def test_loadtest_user_leaves_existing_users_alone(uow: UnitOfWork):
+    existing = User(
+        username="loadtest",
+        password="hash",
+        is_admin=True,
+        telegram_chat_id=42,
+        telegram_daily_enabled=True,
+    )
+    await uow.users.create(existing)
+    await uow.commit()
+
+    user = await create_loadtest_user(uow, "secret")
+    await uow.facebook_auth.set_token(user.id, "token")
+    await uow.commit()
+    await delete_loadtest_user(uow, user.id)
+
+    assert user.username.startswith("loadtest_")
+    assert await uow.users.get_by_id(user.id) is None
+    assert await uow.facebook_auth.get_by_owner(user.id) is None
+    await uow.refresh(existing)
+    assert (
+        existing.password,
+        existing.is_active,
+        existing.is_admin,
+        existing.telegram_chat_id,
+        existing.telegram_daily_enabled,
+    ) == ("hash", True, True, 42, True)
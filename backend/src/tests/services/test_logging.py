@@ -0,0 +1,181 @@
+import io
+import json
+import logging
+import queue
+from collections.abc import Iterator
+from logging.handlers import QueueListener
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.services import logging as app_logging
+from app.services.logging import (
+    AsyncQueueHandler,
+    HotPathSampler,
+    JsonFormatter,
+    Lazy,
+    RedactingFormatter,
+    redact,
+    sample_logs,
+    setup_logging,
+)
+from app.services.tracing import configure_tracing, trace
+
+
+def _record(name: str, level: int, msg: str, *args: object) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        (
+            "GET https://graph.facebook.com/v24.0/me?access_token=EAAB12&limit=5",
+            "GET https://graph.facebook.com/v24.0/me?access_token=[REDACTED]&limit=5",
+        ),
+        (
+            "{'client_secret': 'abc', 'fb_exchange_token': 'EAAB'}",
+            "{'client_secret': '[REDACTED]', 'fb_exchange_token': '[REDACTED]'}",
+        ),
+        ('{"password": "admin123"}', '{"password": "[REDACTED]"}'),
+        ("Authorization: Bearer eyJhbGciOi.x-y_z", "Authorization: Bearer [REDACTED]"),
+        (
+            "POST https://api.telegram.org/bot123:AAH-x_y/sendMessage",
+            "POST https://api.telegram.org/bot[REDACTED]/sendMessage",
+        ),
+        ("Sent 3 reports", "Sent 3 reports"),
+    ],
+)
+def test_redact(line: str, expected: str):
+    assert redact(line) == expected
+
+
+def test_json_lines_carry_extra_fields_and_are_redacted():
+    formatter = RedactingFormatter(JsonFormatter())
+    record = _record("app.clients.base", logging.INFO, "Making %s request", "GET")
+    record.url = "https://graph.facebook.com/me?access_token=EAAB"
+
+    entry = json.loads(formatter.format(record))
+
+    assert entry["message"] == "Making GET request"
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "app.clients.base"
+    assert entry["url"] == "https://graph.facebook.com/me?access_token=[REDACTED]"
+
+
+def test_hot_path_sampler_drops_chatty_records_outside_traces():
+    sampler = HotPathSampler(0.0, {"httpcore": logging.DEBUG})
+
+    assert not sampler.filter(_record("httpcore", logging.DEBUG, "x"))
+    assert not sampler.filter(_record("httpcore.http11", logging.DEBUG, "x"))
+    assert sampler.filter(_record("httpcore.http11", logging.WARNING, "x"))
+    assert sampler.filter(_record("app.services", logging.DEBUG, "x"))
+
+    configure_tracing(0.0, "test", exporter=lambda span: None)
+    try:
+        with trace("request", sampled=True):
+            assert sampler.filter(_record("httpcore.http11", logging.DEBUG, "x"))
+    finally:
+        configure_tracing(0.0, "app")
+
+
+def test_hot_path_sampler_keeps_or_drops_a_request_as_a_whole():
+    sampler = HotPathSampler(0.5, {"app.clients.base": logging.DEBUG})
+    kept = set()
+
+    for _ in range(50):
+        with sample_logs():
+            kept.add(
+                (
+                    sampler.filter(_record("app.clients.base", logging.DEBUG, "x")),
+                    sampler.filter(_record("app.clients.base", logging.DEBUG, "y")),
+                )
+            )
+
+    assert kept == {(True, True), (False, False)}
+
+
+def test_lazy_fields_are_formatted_by_the_listener():
+    calls: list[int] = []
+    records: queue.Queue[logging.LogRecord] = queue.Queue()
+    logger = logging.getLogger("tests.lazy")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(AsyncQueueHandler(records))
+    lazy = Lazy(lambda: calls.append(1) or "computed")
+
+    try:
+        logger.debug("skipped %s", lazy)
+        logger.info("kept %s", lazy)
+    finally:
+        logger.handlers.clear()
+
+    assert calls == []
+    record = records.get_nowait()
+    assert records.empty()
+    assert record.getMessage() == "kept computed"
+    assert calls == [1]
+
+
+def test_full_queue_drops_records():
+    dropped = REGISTRY.get_sample_value("log_records_dropped_total") or 0.0
+    records: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=1)
+    handler = AsyncQueueHandler(records)
+
+    handler.handle(_record("tests", logging.INFO, "first"))
+    handler.handle(_record("tests", logging.INFO, "second"))
+
+    assert records.qsize() == 1
+    assert REGISTRY.get_sample_value("log_records_dropped_total") == dropped + 1
+
+
+def test_listener_writes_formatted_records():
+    records: queue.Queue[logging.LogRecord] = queue.Queue()
+    written: list[str] = []
+
+    class ListHandler(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            written.append(self.format(record))
+
+    target = ListHandler()
+    target.setFormatter(RedactingFormatter(logging.Formatter("%(message)s")))
+    listener = QueueListener(records, target)
+    listener.start()
+    AsyncQueueHandler(records).handle(
+        _record("tests", logging.INFO, "token=%s", Lazy(lambda: "secret"))
+    )
+    listener.stop()
+
+    assert written == ["token=[REDACTED]"]
+
+
+@pytest.fixture
+def fresh_root() -> Iterator[logging.Logger]:
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    listener = app_logging._listener
+    app_logging._listener = None
+    yield root
+    if app_logging._listener is not None:
+        app_logging._listener.stop()
+    app_logging._listener = listener
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_setup_replaces_handlers_added_before(
+    fresh_root: logging.Logger, capsys: pytest.CaptureFixture[str]
+):
+    # What taskiq's CLI does before importing the broker
+    earlier = io.StringIO()
+    fresh_root.addHandler(logging.StreamHandler(earlier))
+
+    setup_logging("prod")
+    logging.getLogger("tests").warning("url ?access_token=SECRET")
+    assert app_logging._listener is not None
+    app_logging._listener.stop()
+
+    (handler,) = fresh_root.handlers
+    assert isinstance(handler, AsyncQueueHandler)
+    assert earlier.getvalue() == ""
+    assert "?access_token=[REDACTED]" in capsys.readouterr().err
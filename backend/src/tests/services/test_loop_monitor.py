@@ -0,0 +1,46 @@
+import asyncio
+import logging
+import time
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.services.loop_monitor import LoopMonitor
+
+
+def _sample(name: str) -> float:
+    return REGISTRY.get_sample_value(name) or 0.0
+
+
+def _block_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+@pytest.mark.asyncio
+async def test_records_lag_and_logs_blocking_stack(caplog: pytest.LogCaptureFixture):
+    caplog.set_level(logging.DEBUG, logger="app.services.loop_monitor")
+    lag_sum = _sample("event_loop_lag_seconds_sum")
+    monitor = LoopMonitor(interval=0.01, blocking_threshold=0.05)
+
+    monitor.start()
+    await asyncio.sleep(0.02)
+    _block_loop(0.2)
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+
+    assert _sample("event_loop_lag_seconds_sum") - lag_sum >= 0.15
+    (record,) = [r for r in caplog.records if "Event loop blocked" in r.message]
+    assert "_block_loop" in record.message
+
+
+@pytest.mark.asyncio
+async def test_no_watchdog_without_debug_logging(caplog: pytest.LogCaptureFixture):
+    caplog.set_level(logging.INFO, logger="app.services.loop_monitor")
+    monitor = LoopMonitor(interval=0.01, blocking_threshold=0.05)
+
+    monitor.start()
+    _block_loop(0.1)
+    await asyncio.sleep(0.02)
+    await monitor.stop()
+
+    assert not [r for r in caplog.records if "Event loop blocked" in r.message]
@@ -0,0 +1,29 @@
+import asyncio
+
+import pytest
+
+from app.services.process_lock import exclusive_file_lock
+
+
+@pytest.mark.asyncio
+class TestExclusiveFileLock:
+    async def test_second_holder_waits_for_release(self, tmp_path):
+        path = tmp_path / "poller.lock"
+        events: list[str] = []
+
+        async def hold(name: str, seconds: float) -> None:
+            async with exclusive_file_lock(path, retry_interval=0.01):
+                events.append(f"{name} acquired")
+                await asyncio.sleep(seconds)
+                events.append(f"{name} released")
+
+        first = asyncio.create_task(hold("first", 0.1))
+        await asyncio.sleep(0.02)
+        await asyncio.gather(first, hold("second", 0))
+
+        assert events == [
+            "first acquired",
+            "first released",
+            "second acquired",
+            "second released",
+        ]
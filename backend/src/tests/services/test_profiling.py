@@ -0,0 +1,91 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from app.services.profiling import (
+    ProfilerBusyError,
+    SlowRequestSampler,
+    sample_cpu,
+    snapshot_memory,
+)
+
+
+def _spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def _busy_handler(seconds: float) -> None:
+    _spin(seconds)
+
+
+@pytest.mark.asyncio
+class TestOnDemandProfiles:
+    async def test_cpu_profile_is_folded_stacks(self):
+        async def busy() -> None:
+            await asyncio.sleep(0.02)
+            _spin(0.2)
+
+        profile, _ = await asyncio.gather(sample_cpu(0.3, interval=0.005), busy())
+
+        stacks = dict(line.rsplit(" ", 1) for line in profile.folded().splitlines())
+        spinning = [s for s in stacks if s.endswith(f"{__name__}:_spin")]
+        assert spinning
+        assert all(s.startswith("MainThread;") for s in spinning)
+        assert sum(int(stacks[s]) for s in spinning) > 0
+
+    async def test_memory_profile_counts_live_allocations(self):
+        kept: list[bytes] = []
+
+        async def allocate() -> None:
+            await asyncio.sleep(0.01)
+            kept.extend(bytes(1024) for _ in range(100))
+
+        profile, _ = await asyncio.gather(snapshot_memory(0.05), allocate())
+
+        assert profile.unit == "bytes"
+        assert any("test_profiling.py" in stack for stack in profile.stacks)
+        assert profile.total >= 100 * 1024
+
+    async def test_one_profile_at_a_time(self):
+        running = asyncio.create_task(sample_cpu(0.1))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(ProfilerBusyError):
+            await snapshot_memory(0.01)
+        await running
+
+
+@pytest.mark.asyncio
+class TestSlowRequestSampler:
+    async def test_keeps_only_slow_requests_own_stacks(self):
+        sampler = SlowRequestSampler()
+        sampler.start(threshold=0.1, interval=0.005, keep=10)
+
+        async def request(name: str, seconds: float) -> None:
+            with sampler.watch(name):
+                await asyncio.sleep(0.01)
+                await _busy_handler(seconds)
+
+        try:
+            await asyncio.gather(request("slow", 0.2), request("fast", 0.0))
+        finally:
+            sampler.stop()
+
+        (record,) = sampler.profiles
+        assert record.name == "slow"
+        assert record.duration >= 0.2
+        assert any(f"{__name__}:_busy_handler" in s for s in record.profile.stacks)
+        assert sampler.get(record.id) is record
+        assert record.pid == os.getpid()
+
+    async def test_watch_does_nothing_when_stopped(self):
+        sampler = SlowRequestSampler()
+
+        with sampler.watch("request"):
+            _spin(0.01)
+
+        assert not sampler.profiles
@@ -0,0 +1,97 @@
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from taskiq import InMemoryBroker
+
+from app.database.engine import engine
+from app.services.task_metrics import TaskMetricsMiddleware
+from app.settings import TaskiqConfig
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.asyncio
+class TestTaskMetricsMiddleware:
+    async def test_records_queue_wait_duration_and_outcome(self):
+        broker = InMemoryBroker().with_middlewares(
+            TaskMetricsMiddleware(TaskiqConfig(metrics_port=None))
+        )
+
+        @broker.task(task_name="tests.succeeds")
+        async def succeeds() -> None:
+            pass
+
+        @broker.task(task_name="tests.fails")
+        async def fails() -> None:
+            raise RuntimeError("boom")
+
+        await broker.startup()
+        await (await succeeds.kiq()).wait_result()
+        await (await fails.kiq()).wait_result()
+        await broker.shutdown()
+
+        assert _sample("taskiq_tasks_sent_total", task_name="tests.succeeds") == 1
+        assert (
+            _sample("taskiq_task_queue_wait_seconds_count", task_name="tests.succeeds")
+            == 1
+        )
+        assert (
+            _sample("taskiq_task_duration_seconds_count", task_name="tests.succeeds")
+            == 1
+        )
+        assert (
+            _sample(
+                "taskiq_tasks_executed_total",
+                task_name="tests.succeeds",
+                outcome="success",
+            )
+            == 1
+        )
+        assert (
+            _sample(
+                "taskiq_tasks_executed_total",
+                task_name="tests.fails",
+                outcome="failure",
+            )
+            == 1
+        )
+        assert _sample("taskiq_tasks_in_flight", task_name="tests.fails") == 0
+
+    async def test_counts_retried_executions(self):
+        broker = InMemoryBroker().with_middlewares(
+            TaskMetricsMiddleware(TaskiqConfig(metrics_port=None))
+        )
+
+        @broker.task(task_name="tests.retried")
+        async def retried() -> None:
+            pass
+
+        await broker.startup()
+        await (await retried.kiq()).wait_result()
+        await (await retried.kicker().with_labels(_retries=1).kiq()).wait_result()
+        await broker.shutdown()
+
+        assert _sample("taskiq_task_retries_total", task_name="tests.retried") == 1
+
+    async def test_counts_queries_per_task(self):
+        broker = InMemoryBroker().with_middlewares(
+            TaskMetricsMiddleware(TaskiqConfig(metrics_port=None))
+        )
+
+        @broker.task(task_name="tests.queries")
+        async def queries() -> None:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                await conn.execute(text("SELECT 2"))
+
+        await broker.startup()
+        await (await queries.kiq()).wait_result()
+        await broker.shutdown()
+
+        assert _sample("db_queries_per_handler_sum", handler="task tests.queries") == 2
+        assert (
+            _sample("db_time_per_handler_seconds_count", handler="task tests.queries")
+            == 1
+        )
@@ -0,0 +1,131 @@
+from collections.abc import Iterator
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.api.common.tracing import TracingMiddleware
+from app.clients.facebook import FacebookClient
+from app.clients.graph_simulator import GraphSimulator
+from app.database.instrumentation import instrument_engine
+from app.services.tracing import NOOP_SPAN, Span, configure_tracing, span, trace
+from app.settings import FacebookConfig, GraphSimulatorConfig
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+@pytest.fixture
+def spans() -> Iterator[list[Span]]:
+    exported: list[Span] = []
+    configure_tracing(0.0, "test", exporter=exported.append)
+    yield exported
+    configure_tracing(0.0, "app")
+
+
+def test_unsampled_trace_records_nothing(spans: list[Span]):
+    with trace("request") as root, span("child") as child:
+        pass
+
+    assert root is NOOP_SPAN
+    assert child is NOOP_SPAN
+    assert spans == []
+
+
+def test_sampled_traceparent_continues_trace(spans: list[Span]):
+    with trace("request", traceparent=f"00-{TRACE_ID}-{PARENT_ID}-01"):
+        with span("child"):
+            pass
+
+    child, root = spans
+    assert root.trace_id == child.trace_id == TRACE_ID
+    assert root.parent_span_id == PARENT_ID
+    assert child.parent_span_id == root.span_id
+
+
+def test_unsampled_traceparent_wins_over_ratio(spans: list[Span]):
+    configure_tracing(1.0, "test", exporter=spans.append)
+
+    with trace("request", traceparent=f"00-{TRACE_ID}-{PARENT_ID}-00"):
+        pass
+
+    assert spans == []
+
+
+def test_error_marks_span(spans: list[Span]):
+    with pytest.raises(ValueError), trace("request", sampled=True):
+        raise ValueError("boom")
+
+    assert spans[0].status == "error"
+    assert spans[0].status_message == "ValueError: boom"
+
+
+@pytest.mark.asyncio
+async def test_graph_pages_are_child_spans(spans: list[Span]):
+    simulator = GraphSimulator(
+        GraphSimulatorConfig(campaigns=60, page_size=25, active_ratio=1.0)
+    )
+    http = httpx.AsyncClient(mounts={"simulator://": simulator.transport()})
+    config = FacebookConfig(app_id="x", app_secret="x", base_url="simulator://graph")
+    time_range = {"since": "2026-01-01", "until": "2026-01-31"}
+
+    with trace("request", sampled=True):
+        await FacebookClient(http, config).get_campaigns(
+            "10000", "token", time_range, False
+        )
+
+    root = spans[-1]
+    campaigns = next(
+        s for s in spans if s.attributes.get("graph.endpoint") == "act_10000/campaigns"
+    )
+    pages = [s for s in spans if s.parent_span_id == campaigns.span_id]
+    assert [p.name for p in pages] == ["graph.page"] * 3
+    assert [p.attributes["graph.page"] for p in pages] == [1, 2, 3]
+    assert campaigns.attributes["graph.items"] == 60
+    assert campaigns.parent_span_id == root.span_id
+
+
+@pytest.mark.asyncio
+async def test_queries_are_child_spans(spans: list[Span]):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrument_engine(engine.sync_engine)
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        with trace("request", sampled=True):
+            await conn.execute(text("SELECT 2"))
+    await engine.dispose()
+
+    query, root = spans
+    assert query.name == "db SELECT"
+    assert query.kind == "client"
+    assert query.attributes["db.query.text"] == "SELECT 2"
+    assert query.parent_span_id == root.span_id
+
+
+@pytest.mark.asyncio
+async def test_middleware_names_root_span_after_route(spans: list[Span]):
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> dict[str, int]:
+        return {"id": item_id}
+
+    app.add_middleware(TracingMiddleware)
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        await client.get("/items/1")
+        assert spans == []
+        await client.get(
+            "/items/2", headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"}
+        )
+
+    (root,) = spans
+    assert root.name == "GET /items/{item_id}"
+    assert root.trace_id == TRACE_ID
+    assert root.attributes["http.route"] == "/items/{item_id}"
+    assert root.attributes["http.response.status_code"] == 200
@@ -1,5 +1,34 @@
 import apiClient from './client';
-import type { AdAccountResponse, CampaignResponse, AdSetResponse, AdResponse, DateRange } from '@/types/facebook';
+import type {
+  AccountSnapshotResponse,
+  AdAccountResponse,
+  AdResponse,
+  AdSetResponse,
+  CampaignResponse,
+  DateRange,
+} from '@/types/facebook';
+
+// Account snapshots are kept briefly so drill-down pages can skip their own requests
+const SNAPSHOT_TTL_MS = 5 * 60 * 1000;
+const snapshotCache = new Map<string, { expiresAt: number; snapshot: Promise<AccountSnapshotResponse> }>();
+
+function snapshotKey(accountId: string, dateRange?: DateRange): string {
+  return `${accountId}:${dateRange?.since ?? ''}:${dateRange?.until ?? ''}`;
+}
+
+async function findInSnapshots<T>(
+  dateRange: DateRange | undefined,
+  pick: (snapshot: AccountSnapshotResponse) => T | undefined,
+): Promise<T | undefined> {
+  const suffix = snapshotKey('', dateRange);
+  for (const [key, entry] of snapshotCache) {
+    if (!key.endsWith(suffix) || entry.expiresAt <= Date.now()) continue;
+    const snapshot = await entry.snapshot.catch(() => undefined);
+    const found = snapshot && pick(snapshot);
+    if (found) return found;
+  }
+  return undefined;
+}
 
 export async function getAdAccounts(): Promise<AdAccountResponse[]> {
   const response = await apiClient.get<AdAccountResponse[]>('/facebook/ad-accounts');
@@ -24,6 +53,13 @@ export async function getAdSets(
   campaignId: string,
   dateRange?: DateRange,
 ): Promise<AdSetResponse[]> {
+  const cached = await findInSnapshots(dateRange, (snapshot) =>
+    snapshot.account_id === accountId
+      ? snapshot.campaigns.find((campaign) => campaign.campaign_id === campaignId)?.adsets
+      : undefined,
+  );
+  if (cached) return cached;
+
   const params: Record<string, string> = {};
   if (dateRange) {
     params.since = dateRange.since;
@@ -37,6 +73,13 @@ export async function getAdSets(
 }
 
 export async function getAds(adsetId: string, dateRange?: DateRange): Promise<AdResponse[]> {
+  const cached = await findInSnapshots(dateRange, (snapshot) =>
+    snapshot.campaigns
+      .flatMap((campaign) => campaign.adsets)
+      .find((adset) => adset.adset_id === adsetId)?.ads,
+  );
+  if (cached) return cached;
+
   const params: Record<string, string> = {};
   if (dateRange) {
     params.since = dateRange.since;
@@ -46,6 +89,24 @@ export async function getAds(adsetId: string, dateRange?: DateRange): Promise<Ad
   return response.data;
 }
 
+export function getAccountSnapshot(accountId: string, dateRange?: DateRange): Promise<AccountSnapshotResponse> {
+  const key = snapshotKey(accountId, dateRange);
+  const cached = snapshotCache.get(key);
+  if (cached && cached.expiresAt > Date.now()) return cached.snapshot;
+
+  const params: Record<string, string> = {};
+  if (dateRange) {
+    params.since = dateRange.since;
+    params.until = dateRange.until;
+  }
+  const snapshot = apiClient
+    .get<AccountSnapshotResponse>(`/facebook/ad-accounts/${accountId}/snapshot`, { params })
+    .then((response) => response.data);
+  snapshotCache.set(key, { expiresAt: Date.now() + SNAPSHOT_TTL_MS, snapshot });
+  snapshot.catch(() => snapshotCache.delete(key));
+  return snapshot;
+}
+
 export async function getFacebookAuthStatus(): Promise<{ connected: boolean; app_id: string }> {
   const response = await apiClient.get<{ connected: boolean; app_id: string }>('/facebook/auth/status');
   return response.data;
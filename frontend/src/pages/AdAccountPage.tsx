@@ -1,6 +1,6 @@
 import { useEffect, useMemo, useState } from 'react';
 import { useParams, useNavigate, useLocation } from 'react-router-dom';
-import { getCampaigns } from '@/api/facebook';
+import { getAccountSnapshot, getCampaigns } from '@/api/facebook';
 import { useDateRange } from '@/hooks/useDateRange';
 import { groupCampaignsByObjective } from '@/utils/insightHelpers';
 import type { ObjectiveGroup } from '@/types/facebook';
@@ -67,6 +67,8 @@ export default function AdAccountPage() {
       .then((campaigns) => setGroups(groupCampaignsByObjective(campaigns)))
       .catch((error) => setError(resolveFacebookErrorMessage(error, t('adAccountLoadCampaignsError'), t)))
       .finally(() => setLoading(false));
+    // Warm the snapshot that ad set and ad pages are served from
+    getAccountSnapshot(accountId, dateRange).catch(() => undefined);
   }, [accountId, dateRange, t]);
 
   if (loading) return <LoadingSpinner size="lg" />;
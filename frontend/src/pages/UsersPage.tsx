@@ -231,7 +231,11 @@ export default function UsersPage() {
               </tbody>
             </table>
           </div>
-          <Pagination page={data.page} totalPages={data.total_pages} onPageChange={setPage} />
+          <Pagination
+            page={data.page ?? page}
+            totalPages={data.total_pages ?? (data.has_next ? page + 1 : page)}
+            onPageChange={setPage}
+          />
         </>
       )}
 
@@ -51,6 +51,21 @@ export interface AdResponse {
   insights: InsightsData | null;
 }
 
+export interface AdSetSnapshot extends AdSetResponse {
+  ads: AdResponse[];
+}
+
+export interface CampaignSnapshot extends CampaignResponse {
+  adsets: AdSetSnapshot[];
+}
+
+export interface AccountSnapshotResponse {
+  account_id: string;
+  since: string;
+  until: string;
+  campaigns: CampaignSnapshot[];
+}
+
 export interface ObjectiveGroup {
   objective: string;
   campaigns: CampaignResponse[];
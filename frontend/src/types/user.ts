@@ -22,10 +22,12 @@ export interface UpdateUserRequest {
 
 export interface UsersPaginationResponse {
   items: UserResponse[];
-  total: number;
-  page: number;
+  total: number | null;
+  total_is_estimate: boolean;
+  page: number | null;
   page_size: number;
-  total_pages: number;
+  next_cursor: string | null;
+  total_pages: number | null;
   has_next: boolean;
   has_prev: boolean;
 }
@@ -33,5 +35,7 @@ export interface UsersPaginationResponse {
 export interface UsersPaginationParams {
   page?: number;
   page_size?: number;
+  cursor?: string;
+  include_total?: boolean;
   username__search?: string;
 }